@@ -0,0 +1,47 @@
+"""
+Import-Time Benchmark
+
+Measures how long common imports take in a fresh interpreter and which
+heavy dependencies they load, and fails if any exceeds its startup budget
+from `pubmed_tools.testing.importtime.IMPORT_BUDGETS`.
+
+Usage:
+    python benchmarks/bench_import.py [--repeat R]
+
+Example:
+    python benchmarks/bench_import.py --repeat 10
+"""
+
+import argparse
+
+from pubmed_tools.testing.importtime import IMPORT_BUDGETS, heavy_imports, measure_import
+
+# Heavier entry points, reported for comparison but not budgeted.
+EXTRA_STATEMENTS = (
+    'from pubmed_tools import PubMedClient',
+    'from pubmed_tools.exporters import ExcelExporter',
+    'from pubmed_tools.exporters import PDFExporter',
+)
+
+
+def main(repeat: int) -> None:
+    over_budget = []
+    for statement in (*IMPORT_BUDGETS, *EXTRA_STATEMENTS):
+        seconds = measure_import(statement, repeat)
+        budget = IMPORT_BUDGETS.get(statement)
+        heavy = ', '.join(heavy_imports(statement)) or '-'
+        status = '' if budget is None else (' OK' if seconds <= budget else ' OVER BUDGET')
+        limit = f" (budget {budget * 1000:.0f} ms)" if budget is not None else ''
+        print(f"{statement:<52} {seconds * 1000:7.1f} ms{limit}{status}  heavy: {heavy}")
+        if budget is not None and seconds > budget:
+            over_budget.append(statement)
+    if over_budget:
+        raise SystemExit(f"{len(over_budget)} import(s) over budget")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='Benchmark pubmed_tools import time.')
+    parser.add_argument('--repeat', type=int, default=5,
+                        help='Fresh interpreters per statement; the best is reported (default: 5)')
+    args = parser.parse_args()
+    main(args.repeat)
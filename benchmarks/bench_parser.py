@@ -0,0 +1,79 @@
+"""
+Parser Benchmark
+
+Compares the xmltodict-based parsing path (`xmltodict.parse` followed by
+`ArticleParser.parse_all_details`) with the direct element path
+(`ArticleParser.parse_xml`) and its multi-process variant
+(`ArticleParser.parse_xml_parallel`) on a synthetic efetch payload.
+
+Usage:
+    python benchmarks/bench_parser.py [--articles N] [--repeat R] [--workers W]
+
+Example:
+    python benchmarks/bench_parser.py --articles 10000
+"""
+
+import argparse
+import functools
+import time
+from typing import Callable, List, Optional
+
+import xmltodict
+
+from pubmed_tools.parsers.article import ArticleParser
+from pubmed_tools.testing.synthetic import generate_efetch_xml
+
+
+def parse_with_xmltodict(xml: bytes) -> List[dict]:
+    articles = xmltodict.parse(xml)['PubmedArticleSet']['PubmedArticle']
+    return ArticleParser.parse_all_details(articles)
+
+
+def parse_with_elements(xml: bytes) -> List[dict]:
+    return list(ArticleParser.parse_xml(xml))
+
+
+def parse_in_parallel(xml: bytes, workers: Optional[int]) -> List[dict]:
+    return ArticleParser.parse_xml_parallel(xml, workers=workers)
+
+
+def best_of(func: Callable[[bytes], List[dict]], xml: bytes, repeat: int) -> float:
+    """Return the fastest wall-clock time of `repeat` runs, in seconds."""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(xml)
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main(articles: int, repeat: int, workers: Optional[int]) -> None:
+    xml = generate_efetch_xml(articles)
+    print(f"Fixture: {articles} articles, {len(xml) / 1e6:.1f} MB")
+
+    if parse_with_xmltodict(xml) != parse_with_elements(xml):
+        raise SystemExit("Parsers disagree on the fixture; refusing to report timings.")
+
+    baseline = best_of(parse_with_xmltodict, xml, repeat)
+    direct = best_of(parse_with_elements, xml, repeat)
+    print(f"xmltodict + parse_all_details: {baseline:8.3f}s "
+          f"({articles / baseline:,.0f} articles/s)")
+    print(f"ArticleParser.parse_xml:       {direct:8.3f}s "
+          f"({articles / direct:,.0f} articles/s)")
+    print(f"Speedup: {baseline / direct:.2f}x")
+
+    parallel = best_of(functools.partial(parse_in_parallel, workers=workers), xml, repeat)
+    print(f"ArticleParser.parse_xml_parallel: {parallel:5.3f}s "
+          f"({articles / parallel:,.0f} articles/s, {baseline / parallel:.2f}x)")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='Benchmark PubMed article parsing.')
+    parser.add_argument('--articles', type=int, default=10000,
+                        help='Number of synthetic articles (default: 10000)')
+    parser.add_argument('--repeat', type=int, default=3,
+                        help='Runs per parser; the best is reported (default: 3)')
+    parser.add_argument('--workers', type=int, default=None,
+                        help='Worker processes for the parallel parser (default: CPU count)')
+    args = parser.parse_args()
+    main(args.articles, args.repeat, args.workers)
@@ -0,0 +1,72 @@
+"""
+Fixtures for the benchmark suite.
+
+Synthetic efetch payloads are recorded once per size into
+`benchmarks/.fixtures` as gzipped XML and reused by later runs, so every
+run measures the same input without any network access. Sizes default to
+1,000 and 10,000 articles; pass `--bench-sizes=1000,10000,100000` to
+include the 100k corpus (about 460 MB of XML).
+"""
+
+import gzip
+import os
+
+import pytest
+
+from pubmed_tools.core.client import PubMedClient
+from pubmed_tools.core.ratelimit import TokenBucket
+from pubmed_tools.parsers.article import ArticleParser
+from pubmed_tools.testing.eutils_server import StubEutilsServer
+from pubmed_tools.testing.synthetic import write_efetch_xml
+
+FIXTURE_DIR = os.path.join(os.path.dirname(__file__), '.fixtures')
+DEFAULT_SIZES = '1000,10000'
+
+
+def pytest_addoption(parser):
+    parser.addoption('--bench-sizes', default=DEFAULT_SIZES,
+                     help=f'Comma-separated corpus sizes to benchmark (default: {DEFAULT_SIZES})')
+
+
+def pytest_generate_tests(metafunc):
+    if 'size' in metafunc.fixturenames:
+        sizes = [int(size) for size in metafunc.config.getoption('bench_sizes').split(',')]
+        marker = metafunc.definition.get_closest_marker('max_size')
+        if marker is not None:
+            sizes = [size for size in sizes if size <= marker.args[0]] or sizes[:1]
+        metafunc.parametrize('size', sizes, scope='session')
+
+
+@pytest.fixture(scope='session')
+def efetch_path(size):
+    """Path of the recorded, gzipped efetch payload with `size` articles."""
+    os.makedirs(FIXTURE_DIR, exist_ok=True)
+    path = os.path.join(FIXTURE_DIR, f'efetch_{size}.xml.gz')
+    if not os.path.exists(path):
+        write_efetch_xml(path + '.tmp', size, opener=gzip.open)
+        os.replace(path + '.tmp', path)
+    return path
+
+
+@pytest.fixture(scope='session')
+def efetch_xml(efetch_path):
+    with gzip.open(efetch_path, 'rb') as f:
+        return f.read()
+
+
+@pytest.fixture(scope='session')
+def articles(efetch_xml):
+    return list(ArticleParser.parse_xml(efetch_xml))
+
+
+@pytest.fixture(scope='session')
+def eutils_server():
+    with StubEutilsServer(corpus_size=10000) as server:
+        yield server
+
+
+@pytest.fixture
+def client(eutils_server):
+    with PubMedClient(base_url=eutils_server.base_url,
+                      rate_limiter=TokenBucket(1e6, capacity=1e6)) as client:
+        yield client
@@ -0,0 +1,18 @@
+"""PubMedClient benchmarks against the local stub E-utilities server."""
+
+
+def test_search(benchmark, client):
+    result = benchmark(client.search, "benchmark", retmax=1000)
+    assert len(result['id_list']) == 1000
+
+
+def test_fetch_details(benchmark, client):
+    ids = [str(pmid) for pmid in range(1, 1001)]
+    articles = benchmark.pedantic(client.fetch_details, kwargs={'id_list': ids}, rounds=5)
+    assert len(articles) == 1000
+
+
+def test_search_and_fetch(benchmark, client):
+    articles = benchmark.pedantic(client.search_and_fetch, args=("benchmark",),
+                                  kwargs={'max_results': 1000}, rounds=5)
+    assert len(articles) == 1000
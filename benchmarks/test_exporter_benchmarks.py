@@ -0,0 +1,39 @@
+import os
+
+import pytest
+
+from pubmed_tools.exporters.csv_exporter import CSVExporter
+from pubmed_tools.exporters.excel_exporter import ExcelExporter
+from pubmed_tools.exporters.jsonl_exporter import JSONLExporter
+from pubmed_tools.exporters.parquet_exporter import FeatherExporter, ParquetExporter
+from pubmed_tools.exporters.pdf_exporter import PDFExporter
+
+STREAMING_EXPORTERS = [
+    (CSVExporter, 'out.csv'),
+    (CSVExporter, 'out.csv.gz'),
+    (JSONLExporter, 'out.jsonl'),
+    (ParquetExporter, 'out.parquet'),
+    (FeatherExporter, 'out.feather'),
+]
+
+
+@pytest.mark.parametrize('exporter_class, filename', STREAMING_EXPORTERS,
+                         ids=[name for _, name in STREAMING_EXPORTERS])
+def test_export(benchmark, articles, tmp_path, exporter_class, filename):
+    path = str(tmp_path / filename)
+    benchmark.pedantic(exporter_class().export, args=(articles, path), rounds=3)
+    assert os.path.getsize(path) > 0
+
+
+@pytest.mark.max_size(10000)
+def test_export_excel(benchmark, articles, tmp_path):
+    path = str(tmp_path / 'out.xlsx')
+    benchmark.pedantic(ExcelExporter().export, args=(articles, path), rounds=1)
+    assert os.path.getsize(path) > 0
+
+
+@pytest.mark.max_size(1000)
+def test_export_pdf(benchmark, articles, tmp_path):
+    path = str(tmp_path / 'out.pdf')
+    benchmark.pedantic(PDFExporter().export, args=(articles, path), rounds=1)
+    assert os.path.getsize(path) > 0
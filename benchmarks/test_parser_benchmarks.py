@@ -0,0 +1,29 @@
+import xmltodict
+import pytest
+
+from pubmed_tools.parsers.article import ArticleParser
+
+
+def test_parse_xml(benchmark, efetch_xml, size):
+    articles = benchmark(lambda: list(ArticleParser.parse_xml(efetch_xml)))
+    assert len(articles) == size
+
+
+def test_parse_xml_batch(benchmark, efetch_xml, size):
+    batch = benchmark(ArticleParser.parse_xml_batch, efetch_xml)
+    assert len(batch) == size
+
+
+def test_parse_xml_streaming_gzip(benchmark, efetch_path, size):
+    articles = benchmark(lambda: list(ArticleParser.parse_xml(efetch_path)))
+    assert len(articles) == size
+
+
+@pytest.mark.max_size(10000)
+def test_xmltodict_parse_all_details(benchmark, efetch_xml, size):
+    def parse():
+        records = xmltodict.parse(efetch_xml)['PubmedArticleSet']['PubmedArticle']
+        return ArticleParser.parse_all_details(records)
+
+    articles = benchmark.pedantic(parse, rounds=3)
+    assert len(articles) == size
@@ -1,12 +1,36 @@
-from .core import PubMedClient, ArticleDetails
-from .parsers import ArticleParser
-from .exporters import CSVExporter, ExcelExporter, PDFExporter
+from typing import TYPE_CHECKING
+
+from ._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .core.client import PubMedClient
+    from .core.async_client import AsyncPubMedClient
+    from .core.models import ArticleDetails
+    from .parsers.article import ArticleParser
+    from .exporters.csv_exporter import CSVExporter
+    from .exporters.excel_exporter import ExcelExporter
+    from .exporters.pdf_exporter import PDFExporter
+
+_LAZY_ATTRS = {
+    'PubMedClient': '.core.client',
+    'AsyncPubMedClient': '.core.async_client',
+    'ArticleDetails': '.core.models',
+    'ArticleParser': '.parsers.article',
+    'CSVExporter': '.exporters.csv_exporter',
+    'ExcelExporter': '.exporters.excel_exporter',
+    'PDFExporter': '.exporters.pdf_exporter',
+}
 
 __all__ = [
     'PubMedClient',
+    'AsyncPubMedClient',
     'ArticleDetails',
     'ArticleParser',
     'CSVExporter',
     'ExcelExporter',
     'PDFExporter'
 ]
+
+
+# Public names are imported on first access.
+__getattr__, __dir__ = lazy_exports(_LAZY_ATTRS, globals())
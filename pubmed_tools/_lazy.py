@@ -0,0 +1,34 @@
+"""
+Lazy package exports.
+
+Package `__init__` modules map their public names to submodules and import
+each one on first access, so `import pubmed_tools` does not pull in
+requests, reportlab, openpyxl, pyarrow or httpx until they are used.
+"""
+
+import importlib
+from typing import Any, Callable, Dict, List, Tuple
+
+
+def lazy_exports(attrs: Dict[str, str],
+                 namespace: Dict[str, Any]) -> Tuple[Callable[[str], Any], Callable[[], List[str]]]:
+    """Return module-level `__getattr__` and `__dir__` functions for a package.
+
+    Args:
+        attrs: Public name -> relative module that defines it
+        namespace: The package's `globals()`; resolved names are cached there
+    """
+    package = namespace['__name__']
+
+    def __getattr__(name: str) -> Any:
+        module = attrs.get(name)
+        if module is None:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        value = getattr(importlib.import_module(module, package), name)
+        namespace[name] = value
+        return value
+
+    def __dir__() -> List[str]:
+        return sorted(set(namespace) | set(attrs))
+
+    return __getattr__, __dir__
@@ -3,12 +3,16 @@ import os
 # Get the repository root directory
 REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
 
-# Allow override via environment variable, defaulting to absolute path in project root
+# Allow override via environment variable, defaulting to absolute path in project root.
+# Exporters create the directory when they first write to it.
 OUTPUT_DIR = os.getenv('PUBMED_TOOLS_OUTPUT_DIR', 
                       os.path.abspath(os.path.join(REPO_ROOT, 'outputs')))
 
 # Path to the DejaVuSans font file
 PDF_FONT_PATH = os.path.join(REPO_ROOT, 'pubmed_tools', 'fonts', 'DejaVuSans.ttf')
 
-# Ensure the output directory is created
-os.makedirs(OUTPUT_DIR, exist_ok=True)
\ No newline at end of file
+# NCBI E-utilities identification. An API key raises the rate limit from
+# 3 to 10 requests per second; tool and email identify the caller to NCBI.
+NCBI_API_KEY = os.getenv('NCBI_API_KEY') or None
+NCBI_EMAIL = os.getenv('NCBI_EMAIL') or None
+NCBI_TOOL = os.getenv('NCBI_TOOL', 'pubmed_tools')
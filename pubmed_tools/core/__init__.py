@@ -1,4 +1,27 @@
-from .client import PubMedClient
-from .models import ArticleDetails
+from typing import TYPE_CHECKING
 
-__all__ = ['PubMed', 'PubMedClient', 'ArticleDetails']
+from .._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .client import PubMedClient
+    from .async_client import AsyncPubMedClient
+    from .batch import ArticleBatch, ArticleRow
+    from .models import ArticleDetails
+    from .ratelimit import TokenBucket, get_rate_limiter
+
+_LAZY_ATTRS = {
+    'PubMedClient': '.client',
+    'AsyncPubMedClient': '.async_client',
+    'ArticleBatch': '.batch',
+    'ArticleRow': '.batch',
+    'ArticleDetails': '.models',
+    'TokenBucket': '.ratelimit',
+    'get_rate_limiter': '.ratelimit',
+}
+
+__all__ = ['PubMed', 'PubMedClient', 'AsyncPubMedClient', 'ArticleDetails',
+           'ArticleBatch', 'ArticleRow', 'TokenBucket', 'get_rate_limiter']
+
+
+# Public names are imported on first access.
+__getattr__, __dir__ = lazy_exports(_LAZY_ATTRS, globals())
@@ -0,0 +1,311 @@
+"""
+Asynchronous PubMed API Client
+
+This module provides `AsyncPubMedClient`, an asyncio-native counterpart of
+`PubMedClient` built on httpx. All requests share one connection pool, are
+bounded by a concurrency semaphore and draw from the same process-wide rate
+limiter as the synchronous client.
+
+Note:
+    Requires the optional `httpx` dependency (`pip install pubmed_tools[async]`).
+
+Example:
+    import asyncio
+    from pubmed_tools.core.async_client import AsyncPubMedClient
+
+    async def main():
+        async with AsyncPubMedClient() as client:
+            async for article in client.iter_articles("cancer treatment"):
+                print(article['MedlineCitation']['PMID'])
+
+    asyncio.run(main())
+"""
+
+import asyncio
+import contextlib
+import time
+from typing import Any, AsyncIterator, Dict, List, Optional
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover - exercised only without httpx
+    httpx = None
+
+from .client import (DEFAULT_BASE_URL, POST_ID_THRESHOLD, RETRY_STATUS_CODES,
+                     _parse_article_set, _parse_search_result, retry_delay)
+from .ratelimit import TokenBucket, get_rate_limiter
+from .. import instrumentation
+from ..config import NCBI_API_KEY, NCBI_EMAIL, NCBI_TOOL
+
+
+class AsyncPubMedClient:
+    def __init__(self,
+                 base_url: str = DEFAULT_BASE_URL,
+                 max_connections: int = 20,
+                 max_concurrency: int = 10,
+                 max_retries: int = 3,
+                 backoff_factor: float = 0.5,
+                 timeout: Optional[float] = 30.0,
+                 client: Optional['httpx.AsyncClient'] = None,
+                 api_key: Optional[str] = NCBI_API_KEY,
+                 email: Optional[str] = NCBI_EMAIL,
+                 tool: Optional[str] = NCBI_TOOL,
+                 rate_limit: Optional[float] = None,
+                 rate_limiter: Optional[TokenBucket] = None,
+                 batch_size: int = 200):
+        """Create an async client backed by a shared httpx connection pool.
+
+        Args:
+            base_url: E-utilities base URL (override to target a mirror or stub server)
+            max_connections: Maximum number of pooled connections
+            max_concurrency: Maximum number of requests in flight at once
+            max_retries: Number of retries on connection errors and 429/5xx responses
+            backoff_factor: Exponential backoff factor between retries, in seconds
+            timeout: Per-request timeout in seconds (None waits indefinitely)
+            client: Optional pre-configured httpx.AsyncClient to use instead of a new one
+            api_key: NCBI API key, sent with every request
+            email: Contact email, sent with every request
+            tool: Tool name, sent with every request
+            rate_limit: Requests per second for the limiter shared by every client
+                        with this API key. Defaults to 3, or 10 with an API key;
+                        ignored, with a warning, once that limiter exists.
+            rate_limiter: Explicit limiter to use instead of the process-wide
+                          limiter shared by all clients with the same API key
+            batch_size: Number of PubMed IDs sent per efetch request
+        """
+        if httpx is None:
+            raise ImportError(
+                "AsyncPubMedClient requires httpx. Install it with `pip install httpx`.")
+        self.base_url = base_url
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self.batch_size = batch_size
+        self.api_key = api_key
+        self.email = email
+        self.tool = tool
+        self.rate_limiter = rate_limiter if rate_limiter is not None else get_rate_limiter(
+            api_key, rate_limit)
+        self.client = client if client is not None else httpx.AsyncClient(
+            timeout=timeout,
+            limits=httpx.Limits(max_connections=max_connections,
+                                max_keepalive_connections=max_connections))
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def aclose(self) -> None:
+        """Close the underlying httpx client and release pooled connections."""
+        await self.client.aclose()
+
+    async def __aenter__(self) -> 'AsyncPubMedClient':
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
+    def _with_identity(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        """Add the api_key, tool and email parameters NCBI expects on every request."""
+        params = dict(params)
+        for name, value in (('api_key', self.api_key),
+                            ('tool', self.tool),
+                            ('email', self.email)):
+            if value:
+                params.setdefault(name, value)
+        return params
+
+    async def _request(self, eutil: str, params: Dict[str, Any],
+                       method: str = 'GET') -> 'httpx.Response':
+        """Issue a rate-limited E-utility request, retrying 429/5xx with backoff."""
+        url = f"{self.base_url}{eutil}"
+        params = self._with_identity(params)
+        with instrumentation.span('client.request', eutil=eutil, method=method) as span:
+            for attempt in range(self.max_retries + 1):
+                try:
+                    async with self._semaphore:
+                        waited = time.perf_counter()
+                        await self.rate_limiter.acquire_async()
+                        instrumentation.record('client.throttle_seconds',
+                                               time.perf_counter() - waited, eutil=eutil)
+                        if method == 'POST':
+                            response = await self.client.post(url, data=params)
+                        else:
+                            response = await self.client.get(url, params=params)
+                except httpx.TransportError:
+                    if attempt == self.max_retries:
+                        raise
+                    response = None
+                else:
+                    if (response.status_code not in RETRY_STATUS_CODES
+                            or attempt == self.max_retries):
+                        break
+                await asyncio.sleep(retry_delay(response, attempt, self.backoff_factor))
+            if span.recording:
+                span.set_attribute('status', response.status_code)
+                span.set_attribute('retries', attempt)
+                span.set_attribute('bytes', len(response.content))
+                instrumentation.add('client.requests', 1, eutil=eutil,
+                                    status=response.status_code)
+                instrumentation.add('client.retries', attempt, eutil=eutil)
+                instrumentation.add('client.bytes', len(response.content), eutil=eutil)
+        return response
+
+    async def search(self, query: str, use_history: bool = False,
+                     retmax: int = 100,
+                     mindate: Optional[str] = None,
+                     maxdate: Optional[str] = None,
+                     datetype: Optional[str] = None) -> Dict[str, Any]:
+        """Search PubMed and return results.
+
+        Args:
+            query: The search query string
+            use_history: If True, store results on NCBI server and return WebEnv and query_key
+                         for subsequent operations
+            retmax: Maximum number of results to return
+            mindate: Start of a date range (YYYY/MM/DD, YYYY/MM or YYYY); requires maxdate
+            maxdate: End of a date range; requires mindate
+            datetype: Date field the range applies to (e.g. 'edat', 'pdat', 'mdat')
+
+        Returns:
+            Dictionary containing search results, including id_list and optionally WebEnv and query_key
+        """
+        if (mindate is None) != (maxdate is None):
+            raise ValueError("mindate and maxdate must be given together")
+        params = {
+            'db': 'pubmed',
+            'term': query,
+            'usehistory': 'y' if use_history else 'n',
+            'retmode': 'xml',
+            'retmax': retmax
+        }
+        for name, value in (('mindate', mindate), ('maxdate', maxdate),
+                            ('datetype', datetype)):
+            if value is not None:
+                params[name] = value
+        response = await self._request('esearch.fcgi', params)
+        response.raise_for_status()
+        return _parse_search_result(response.content)
+
+    async def fetch_details(self, id_list: Optional[List[str]] = None,
+                            webenv: Optional[str] = None,
+                            query_key: Optional[str] = None,
+                            retmax: int = 100,
+                            retstart: int = 0) -> List[dict]:
+        """Fetch article details for given IDs or from a previous search.
+
+        Large ID lists are split into batches of `batch_size` and fetched
+        concurrently; articles are returned in the order of `id_list`.
+
+        Args:
+            id_list: List of PubMed IDs to fetch details for
+            webenv: WebEnv string from a previous search
+            query_key: Query key from a previous search
+            retmax: Maximum number of records to retrieve from a WebEnv
+            retstart: Index of first record to retrieve from a WebEnv
+
+        Returns:
+            List of article details dictionaries. Returns empty list if no results found.
+        """
+        if not id_list and not (webenv and query_key):
+            return []
+        if id_list:
+            ids = [str(i) for i in id_list]
+            size = max(1, self.batch_size)
+            batches = [ids[i:i + size] for i in range(0, len(ids), size)]
+            results = await asyncio.gather(
+                *(self._fetch_id_batch(batch) for batch in batches))
+            return [article for batch in results for article in batch]
+        params = {
+            'db': 'pubmed',
+            'retmode': 'xml',
+            'retmax': retmax,
+            'retstart': retstart,
+            'WebEnv': webenv,
+            'query_key': query_key,
+        }
+        return await self._efetch(params)
+
+    async def _efetch(self, params: Dict[str, Any], method: str = 'GET') -> List[dict]:
+        """Run a single efetch request and parse the articles off the event loop."""
+        response = await self._request('efetch.fcgi', params, method)
+        if response.status_code != 200:
+            return []
+        return await asyncio.get_running_loop().run_in_executor(
+            None, _parse_article_set, response.content)
+
+    async def _fetch_id_batch(self, batch: List[str]) -> List[dict]:
+        """Fetch one batch of IDs, switching to POST for long ID lists."""
+        params = {
+            'db': 'pubmed',
+            'retmode': 'xml',
+            'retmax': len(batch),
+            'retstart': 0,
+            'id': ','.join(batch),
+        }
+        method = 'POST' if len(batch) > POST_ID_THRESHOLD else 'GET'
+        return await self._efetch(params, method)
+
+    async def search_and_fetch(self, query: str, max_results: int = 100) -> List[dict]:
+        """Convenience method to search and fetch details in one operation.
+
+        Args:
+            query: The search query string
+            max_results: Maximum number of results to return
+
+        Returns:
+            List of article details dictionaries
+        """
+        return [article async for article in
+                self.iter_articles(query, max_results=max_results)]
+
+    async def iter_articles(self, query: str,
+                            batch_size: int = 500,
+                            max_results: Optional[int] = None,
+                            **search_options: Any) -> AsyncIterator[dict]:
+        """Stream every article matching a query via the NCBI history server.
+
+        Windows of `batch_size` are fetched with `retstart`; the next window
+        is requested while the caller consumes the current one.
+
+        Args:
+            query: The search query string
+            batch_size: Number of articles per efetch window
+            max_results: Stop after this many articles (None for all matches)
+            **search_options: Extra `search` arguments, e.g. mindate/maxdate/datetype
+
+        Yields:
+            Article details dictionaries, in search result order
+        """
+        search_results = await self.search(query, use_history=True, retmax=0,
+                                           **search_options)
+        total = int(search_results.get('count', 0) or 0)
+        if max_results is not None:
+            total = min(total, max_results)
+        if total <= 0:
+            return
+        webenv = search_results.get('webenv')
+        query_key = search_results.get('query_key')
+        if not webenv or not query_key:
+            id_list = (await self.search(query, retmax=total, **search_options)).get(
+                'id_list', [])
+            for article in await self.fetch_details(id_list=id_list[:total]):
+                yield article
+            return
+
+        def fetch_window(start: int) -> 'asyncio.Task[List[dict]]':
+            return asyncio.ensure_future(self.fetch_details(
+                webenv=webenv, query_key=query_key,
+                retmax=min(batch_size, total - start), retstart=start))
+
+        starts = range(0, total, batch_size)
+        pending = fetch_window(starts[0])
+        try:
+            for index in range(len(starts)):
+                articles = await pending
+                if index + 1 < len(starts):
+                    pending = fetch_window(starts[index + 1])
+                for article in articles:
+                    yield article
+                del articles
+        finally:
+            if not pending.done():
+                pending.cancel()
+                with contextlib.suppress(asyncio.CancelledError):
+                    await pending
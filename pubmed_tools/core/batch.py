@@ -0,0 +1,276 @@
+"""
+Columnar container for large numbers of parsed articles.
+
+A list of `ArticleDetails` dicts pays for a dict, its key strings and a
+list per record. `ArticleBatch` stores the same data column by column:
+
+- titles and abstracts as plain string columns
+- PMIDs as a 64-bit integer array
+- author names as indices into a shared string table, so repeated names
+  are stored once
+- author lists as a flat index array plus an offsets array
+- publication dates as YYYYMMDD integers (0 for a missing part) plus a
+  one-byte format code, turned back into the original dict or string only
+  when a row is read; dates in any other shape are kept as they are
+
+Rows are still available as read-only, dict-like `ArticleRow` views, so code
+written against `ArticleDetails` (including the exporters) keeps working.
+
+Example:
+    from pubmed_tools.parsers.article import ArticleParser
+
+    batch = ArticleParser.parse_xml_batch(xml_bytes)
+    batch[0]['title']
+    batch.column('pmid')
+"""
+
+from array import array
+from collections.abc import Mapping
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+from .models import ArticleDetails
+
+FIELDS = ('title', 'abstract', 'authors', 'publication_date', 'pmid')
+
+_MISSING_PMID = -1
+_TEXT_PMID = -2
+# Date format codes: bit flags for the integer-encoded dates, or _DATE_RAW.
+_DATE_PARTS = 0
+_DATE_TEXT = 1
+_DATE_NAMED_MONTH = 2
+_DATE_RAW = 255
+
+_MONTH_NAMES = ('Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep', 'Oct',
+                'Nov', 'Dec')
+_MONTH_NUMBERS = {name: number for number, name in enumerate(_MONTH_NAMES, start=1)}
+
+
+class ArticleRow(Mapping):
+    """Read-only, dict-like view of one article in an `ArticleBatch`."""
+
+    __slots__ = ('_batch', '_index')
+
+    def __init__(self, batch: 'ArticleBatch', index: int) -> None:
+        self._batch = batch
+        self._index = index
+
+    def __getitem__(self, key: str) -> Any:
+        return self._batch._value(self._index, key)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(FIELDS)
+
+    def __len__(self) -> int:
+        return len(FIELDS)
+
+    def __repr__(self) -> str:
+        return f"ArticleRow({dict(self)!r})"
+
+    def __reduce__(self):
+        # Pickle the row's own values, not the whole batch it points into.
+        return dict, (dict(self),)
+
+
+class ArticleBatch:
+    """Compact, append-only columnar store of `ArticleDetails`."""
+
+    def __init__(self, articles: Optional[Iterable[Mapping]] = None) -> None:
+        self._strings: List[str] = []
+        self._string_ids: Dict[str, int] = {}
+        self._titles: List[str] = []
+        self._abstracts: List[str] = []
+        self._pmids = array('q')
+        self._text_pmids: Dict[int, str] = {}
+        self._author_offsets = array('L', [0])
+        self._author_ids = array('L')
+        self._date_kinds = array('B')
+        self._dates = array('L')
+        self._raw_dates: Dict[int, Union[str, dict]] = {}
+        if articles is not None:
+            self.extend(articles)
+
+    def _intern(self, value: str) -> int:
+        index = self._string_ids.get(value)
+        if index is None:
+            index = self._string_ids[value] = len(self._strings)
+            self._strings.append(value)
+        return index
+
+    def append_fields(self,
+                      title: str,
+                      abstract: str,
+                      authors: List[str],
+                      publication_date: Union[str, dict],
+                      pmid: str) -> None:
+        """Append one article from its field values."""
+        row = len(self._titles)
+        self._titles.append(title)
+        self._abstracts.append(abstract)
+        if not pmid:
+            self._pmids.append(_MISSING_PMID)
+        elif (pmid.isascii() and pmid.isdigit() and len(pmid) < 19
+              and (pmid == '0' or pmid[0] != '0')):
+            self._pmids.append(int(pmid))
+        else:
+            self._pmids.append(_TEXT_PMID)
+            self._text_pmids[row] = pmid
+        intern = self._intern
+        self._author_ids.extend(intern(author) for author in authors)
+        self._author_offsets.append(len(self._author_ids))
+        encoded = _encode_date(publication_date)
+        if encoded is None:
+            self._date_kinds.append(_DATE_RAW)
+            self._dates.append(_date_key(publication_date))
+            self._raw_dates[row] = publication_date
+        else:
+            self._date_kinds.append(encoded[0])
+            self._dates.append(encoded[1])
+
+    def append(self, article: Mapping) -> None:
+        """Append one `ArticleDetails`-shaped mapping."""
+        self.append_fields(article.get('title', ''),
+                           article.get('abstract', ''),
+                           article.get('authors', []),
+                           article.get('publication_date', ''),
+                           article.get('pmid', ''))
+
+    def extend(self, articles: Iterable[Mapping]) -> None:
+        """Append every article from an iterable, skipping None entries."""
+        for article in articles:
+            if article is not None:
+                self.append(article)
+
+    def __len__(self) -> int:
+        return len(self._titles)
+
+    def __bool__(self) -> bool:
+        return bool(self._titles)
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[ArticleRow, List[ArticleRow]]:
+        if isinstance(index, slice):
+            return [ArticleRow(self, i) for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("ArticleBatch index out of range")
+        return ArticleRow(self, index)
+
+    def __iter__(self) -> Iterator[ArticleRow]:
+        for index in range(len(self)):
+            yield ArticleRow(self, index)
+
+    def _authors(self, index: int) -> List[str]:
+        strings = self._strings
+        start, end = self._author_offsets[index], self._author_offsets[index + 1]
+        return [strings[i] for i in self._author_ids[start:end]]
+
+    def _publication_date(self, index: int) -> Union[str, dict]:
+        kind = self._date_kinds[index]
+        if kind == _DATE_RAW:
+            return self._raw_dates[index]
+        value = self._dates[index]
+        year, month, day = value // 10000, value // 100 % 100, value % 100
+        parts = {'year': f'{year:04d}' if year else '',
+                 'month': ('' if not month else _MONTH_NAMES[month - 1]
+                           if kind & _DATE_NAMED_MONTH else f'{month:02d}'),
+                 'day': f'{day:02d}' if day else ''}
+        if kind & _DATE_TEXT:
+            return f"{parts['year']}-{parts['month']}-{parts['day']}"
+        return parts
+
+    def _pmid(self, index: int) -> str:
+        value = self._pmids[index]
+        if value == _MISSING_PMID:
+            return ''
+        if value == _TEXT_PMID:
+            return self._text_pmids[index]
+        return str(value)
+
+    def _value(self, index: int, key: str) -> Any:
+        if key == 'title':
+            return self._titles[index]
+        if key == 'abstract':
+            return self._abstracts[index]
+        if key == 'authors':
+            return self._authors(index)
+        if key == 'publication_date':
+            return self._publication_date(index)
+        if key == 'pmid':
+            return self._pmid(index)
+        raise KeyError(key)
+
+    def column(self, name: str) -> List[Any]:
+        """Return one field for every article, in order."""
+        if name == 'title':
+            return list(self._titles)
+        if name == 'abstract':
+            return list(self._abstracts)
+        if name not in FIELDS:
+            raise KeyError(name)
+        return [self._value(index, name) for index in range(len(self))]
+
+    def to_columns(self, fields: Optional[Iterable[str]] = None) -> Dict[str, List[Any]]:
+        """Return the requested fields (all by default) as a dict of lists."""
+        return {name: self.column(name) for name in (fields or FIELDS)}
+
+    def to_dicts(self) -> List[ArticleDetails]:
+        """Materialize every row as a plain `ArticleDetails` dict."""
+        return [dict(row) for row in self]
+
+    def date_key(self, index: int) -> int:
+        """Return a sortable YYYYMMDD integer for a row's date (0 for unknown parts)."""
+        return self._dates[index]
+
+
+def _encode_date(value: Union[str, dict]) -> Optional[Tuple[int, int]]:
+    """Return (format code, YYYYMMDD) for a date that decodes back unchanged, else None."""
+    if isinstance(value, dict):
+        if len(value) != 3:
+            return None
+        parts = [value.get('year'), value.get('month'), value.get('day')]
+        kind = _DATE_PARTS
+    elif isinstance(value, str):
+        parts = value.split('-')
+        if len(parts) != 3:
+            return None
+        kind = _DATE_TEXT
+    else:
+        return None
+    year, month, day = parts
+    if not (isinstance(year, str) and isinstance(month, str) and isinstance(day, str)):
+        return None
+    if year and not (len(year) == 4 and year.isascii() and year.isdigit() and year != '0000'):
+        return None
+    if month in _MONTH_NUMBERS:
+        kind |= _DATE_NAMED_MONTH
+        month_number = _MONTH_NUMBERS[month]
+    elif not month:
+        month_number = 0
+    elif len(month) == 2 and month.isascii() and month.isdigit() and '01' <= month <= '12':
+        month_number = int(month)
+    else:
+        return None
+    if day and not (len(day) == 2 and day.isascii() and day.isdigit() and '01' <= day <= '31'):
+        return None
+    return kind, int(year or 0) * 10000 + month_number * 100 + int(day or 0)
+
+
+def _date_key(value: Any) -> int:
+    """Best-effort YYYYMMDD integer for a date kept in its original shape."""
+    if isinstance(value, dict):
+        parts = [str(value.get(name) or '') for name in ('year', 'month', 'day')]
+    else:
+        parts = (str(value).split('-') + ['', ''])[:3]
+    year, month, day = (_date_number(part, months=(i == 1)) for i, part in enumerate(parts))
+    if not (0 <= year <= 9999 and 0 <= month <= 99 and 0 <= day <= 99):
+        return 0
+    return year * 10000 + month * 100 + day
+
+
+def _date_number(value: str, months: bool = False) -> int:
+    value = value.strip()
+    if value.isascii() and value.isdigit():
+        return int(value)
+    if months:
+        return _MONTH_NUMBERS.get(value[:3].title(), 0)
+    return 0
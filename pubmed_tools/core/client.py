@@ -19,16 +19,302 @@ Example:
     articles = ArticleParser.parse_all_details(articles_raw)
 """
 
-from typing import List, Dict, Any, Optional
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Iterator, List, Dict, Any, Optional, Tuple
 import requests
 import xmltodict
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from .ratelimit import TokenBucket, get_rate_limiter
+from .. import instrumentation
+from ..parsers.stream import CHUNK_SIZE as STREAM_CHUNK_SIZE, iter_pubmed_articles
+from ..config import NCBI_API_KEY, NCBI_EMAIL, NCBI_TOOL
+
+if TYPE_CHECKING:
+    from ..storage.article_store import ArticleStore
+    from ..storage.search_cache import SearchCache
+
+DEFAULT_BASE_URL = 'https://eutils.ncbi.nlm.nih.gov/entrez/eutils/'
+
+# Status codes worth retrying: NCBI answers 429 when the rate limit is
+# exceeded and intermittently returns 5xx under load.
+RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+
+# NCBI recommends HTTP POST once more than about 200 UIDs are sent at once,
+# since longer id= lists can exceed URL length limits.
+POST_ID_THRESHOLD = 200
+
+
+def record_pmid(record: dict) -> str:
+    """Return the PMID of a raw efetch record, or '' if it has none."""
+    pmid = (record.get('MedlineCitation') or {}).get('PMID', '')
+    if isinstance(pmid, dict):
+        return pmid.get('#text', '')
+    return pmid or ''
+
+
+def _parse_search_result(content: bytes) -> Dict[str, Any]:
+    """Parse an esearch eSearchResult payload into a search result dictionary."""
+    with instrumentation.span('client.decode', eutil='esearch.fcgi'):
+        xml = xmltodict.parse(content)
+    result = xml.get('eSearchResult') or {}
+    id_list = (result.get('IdList') or {}).get('Id', [])
+    if isinstance(id_list, str):
+        id_list = [id_list]
+    elif not isinstance(id_list, list):
+        id_list = []
+    out = {
+        'count': result.get('Count', '0'),
+        'ret_max': result.get('RetMax', '0'),
+        'ret_start': result.get('RetStart', '0'),
+        'id_list': id_list,
+    }
+    if 'WebEnv' in result:
+        out['webenv'] = result['WebEnv']
+    if 'QueryKey' in result:
+        out['query_key'] = result['QueryKey']
+    return out
+
+
+def retry_delay(response: Any, attempt: int, backoff_factor: float) -> float:
+    """Seconds to wait before retry `attempt`: the server's Retry-After, else exponential backoff.
+
+    `response` is a requests or httpx response, or None when no response arrived.
+    """
+    retry_after = response.headers.get('Retry-After') if response is not None else None
+    if isinstance(retry_after, str) and retry_after.isdigit():
+        return float(retry_after)
+    return backoff_factor * (2 ** attempt)
+
+
+def _parse_article_set(content: bytes) -> List[dict]:
+    """Parse an efetch PubmedArticleSet payload into a list of article dicts."""
+    with instrumentation.span('client.decode', eutil='efetch.fcgi') as span:
+        xml_dict = xmltodict.parse(content)
+        data = xml_dict.get('PubmedArticleSet') or {}
+        articles = data.get('PubmedArticle', [])
+        if not articles:
+            articles = []
+        elif not isinstance(articles, list):
+            articles = [articles]
+        span.set_attribute('articles', len(articles))
+    return articles
+
+
+def _count_bytes(chunks: Iterator[bytes], eutil: str) -> Iterator[bytes]:
+    """Pass streamed body chunks through, reporting their size to instrumentation."""
+    received = 0
+    try:
+        for chunk in chunks:
+            received += len(chunk)
+            yield chunk
+    finally:
+        instrumentation.add('client.bytes', received, eutil=eutil)
 
 
 class PubMedClient:
-    def __init__(self):
-        self.base_url = 'https://eutils.ncbi.nlm.nih.gov/entrez/eutils/'
+    def __init__(self,
+                 base_url: str = DEFAULT_BASE_URL,
+                 pool_size: int = 10,
+                 max_retries: int = 3,
+                 backoff_factor: float = 0.5,
+                 timeout: Optional[float] = 30.0,
+                 session: Optional[requests.Session] = None,
+                 api_key: Optional[str] = NCBI_API_KEY,
+                 email: Optional[str] = NCBI_EMAIL,
+                 tool: Optional[str] = NCBI_TOOL,
+                 rate_limit: Optional[float] = None,
+                 rate_limiter: Optional[TokenBucket] = None,
+                 batch_size: int = 200,
+                 max_workers: int = 3,
+                 article_store: Optional['ArticleStore'] = None,
+                 search_cache: Optional['SearchCache'] = None):
+        """Create a client backed by a pooled, keep-alive HTTP session.
 
-    def search(self, query: str, use_history: bool = False, retmax: int = 100) -> Dict[str, Any]:
+        Args:
+            base_url: E-utilities base URL (override to target a mirror or stub server)
+            pool_size: Maximum number of pooled connections kept alive per host
+            max_retries: Number of retries on connection errors and 429/5xx responses
+            backoff_factor: Exponential backoff factor between retries, in seconds
+            timeout: Per-request timeout in seconds (None waits indefinitely)
+            session: Optional pre-configured session to use instead of a new one
+            api_key: NCBI API key, sent with every request
+            email: Contact email, sent with every request
+            tool: Tool name, sent with every request
+            rate_limit: Requests per second for the limiter shared by every client
+                        with this API key. Defaults to 3, or 10 with an API key;
+                        ignored, with a warning, once that limiter exists.
+            rate_limiter: Explicit limiter to use instead of the process-wide
+                          limiter shared by all clients with the same API key
+            batch_size: Number of PubMed IDs sent per efetch request
+            max_workers: Maximum number of efetch batches fetched concurrently
+            article_store: Optional `ArticleStore` consulted before fetching by
+                           ID; only missing PMIDs are downloaded and stored
+            search_cache: Optional `SearchCache` consulted before each esearch
+        """
+        self.base_url = base_url
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self.session = session if session is not None else self._create_session(
+            pool_size, max_retries, backoff_factor)
+        self.batch_size = batch_size
+        self.max_workers = max_workers
+        self.article_store = article_store
+        self.search_cache = search_cache
+        self.api_key = api_key
+        self.email = email
+        self.tool = tool
+        self.rate_limiter = rate_limiter if rate_limiter is not None else get_rate_limiter(
+            api_key, rate_limit)
+        self._stats_lock = threading.Lock()
+        self._request_count = 0
+        self._retry_count = 0
+
+    @staticmethod
+    def _create_session(pool_size: int,
+                        max_retries: int,
+                        backoff_factor: float) -> requests.Session:
+        """Build a session with a sized connection pool that retries connection errors.
+
+        429 and 5xx answers are not retried here but by `_request`, so every
+        attempt draws a token from the rate limiter.
+        """
+        retry = Retry(
+            total=max_retries,
+            status=0,
+            backoff_factor=backoff_factor,
+            allowed_methods=frozenset(['GET', 'POST']),
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(pool_connections=pool_size,
+                              pool_maxsize=pool_size,
+                              max_retries=retry)
+        session = requests.Session()
+        session.headers['Connection'] = 'keep-alive'
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        return session
+
+    def _with_identity(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        """Add the api_key, tool and email parameters NCBI expects on every request."""
+        params = dict(params)
+        for name, value in (('api_key', self.api_key),
+                            ('tool', self.tool),
+                            ('email', self.email)):
+            if value:
+                params.setdefault(name, value)
+        return params
+
+    def _request(self, eutil: str, params: Dict[str, Any],
+                 method: str = 'GET', stream: bool = False) -> requests.Response:
+        """Issue a rate-limited E-utility request through the pooled session.
+
+        GET requests send parameters in the query string; POST requests send
+        them as a form body. With `stream=True` the body is left unread so it
+        can be consumed incrementally. 429 and 5xx answers are retried up to
+        `max_retries` times with exponential backoff (or the server's
+        Retry-After), taking a rate-limiter token for every attempt; the last
+        answer is returned whatever its status.
+        """
+        url = f"{self.base_url}{eutil}"
+        params = self._with_identity(params)
+        retried = 0
+        with instrumentation.span('client.request', eutil=eutil, method=method) as span:
+            for attempt in range(self.max_retries + 1):
+                self._acquire(eutil)
+                if method == 'POST':
+                    response = self.session.post(url, data=params, timeout=self.timeout,
+                                                 stream=stream)
+                else:
+                    response = self.session.get(url, params=params, timeout=self.timeout,
+                                                stream=stream)
+                retried += self._record_response(response)
+                if (response.status_code not in RETRY_STATUS_CODES
+                        or attempt == self.max_retries):
+                    break
+                response.close()
+                retried += 1
+                with self._stats_lock:
+                    self._retry_count += 1
+                time.sleep(retry_delay(response, attempt, self.backoff_factor))
+            if span.recording:
+                span.set_attribute('status', response.status_code)
+                span.set_attribute('retries', retried)
+                instrumentation.add('client.requests', 1, eutil=eutil,
+                                    status=response.status_code)
+                instrumentation.add('client.retries', retried, eutil=eutil)
+                if not stream:
+                    span.set_attribute('bytes', len(response.content))
+                    instrumentation.add('client.bytes', len(response.content), eutil=eutil)
+        return response
+
+    def _acquire(self, eutil: str) -> None:
+        """Wait for a rate-limiter token, reporting the wait to instrumentation."""
+        if instrumentation.enabled():
+            waited = time.perf_counter()
+            self.rate_limiter.acquire()
+            instrumentation.record('client.throttle_seconds',
+                                   time.perf_counter() - waited, eutil=eutil)
+        else:
+            self.rate_limiter.acquire()
+
+    def _record_response(self, response: requests.Response) -> int:
+        """Count one request; return the connection retries the adapter made for it."""
+        retries = getattr(getattr(response, 'raw', None), 'retries', None)
+        retried = len(retries.history) if isinstance(retries, Retry) else 0
+        with self._stats_lock:
+            self._request_count += 1
+            self._retry_count += retried
+        return retried
+
+    def connection_stats(self) -> Dict[str, int]:
+        """Return connection reuse statistics for this client.
+
+        Returns:
+            Dictionary with the number of requests issued, retries performed,
+            connections opened by the pool and requests served over reused
+            connections.
+        """
+        connections = 0
+        pooled_requests = 0
+        # The same adapter is mounted for http:// and https://; count it once.
+        adapters = {id(adapter): adapter for adapter in self.session.adapters.values()}
+        for adapter in adapters.values():
+            pools = getattr(getattr(adapter, 'poolmanager', None), 'pools', None)
+            if pools is None:
+                continue
+            for key in list(pools.keys()):
+                pool = pools.get(key)
+                if pool is None:
+                    continue
+                connections += pool.num_connections
+                pooled_requests += pool.num_requests
+        with self._stats_lock:
+            return {
+                'requests': self._request_count,
+                'retries': self._retry_count,
+                'connections_opened': connections,
+                'connections_reused': max(pooled_requests - connections, 0),
+            }
+
+    def close(self) -> None:
+        """Close the underlying session and release pooled connections."""
+        self.session.close()
+
+    def __enter__(self) -> 'PubMedClient':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def search(self, query: str, use_history: bool = False, retmax: int = 100,
+               mindate: Optional[str] = None,
+               maxdate: Optional[str] = None,
+               datetype: Optional[str] = None) -> Dict[str, Any]:
         """Search PubMed and return results.
         
         Args:
@@ -36,38 +322,40 @@ class PubMedClient:
             use_history: If True, store results on NCBI server and return WebEnv and query_key
                          for subsequent operations
             retmax: Maximum number of results to return
+            mindate: Start of a date range (YYYY/MM/DD, YYYY/MM or YYYY); requires maxdate
+            maxdate: End of a date range; requires mindate
+            datetype: Date field the range applies to (e.g. 'edat', 'pdat', 'mdat')
         
         Returns:
             Dictionary containing search results, including id_list and optionally WebEnv and query_key
         """
+        if (mindate is None) != (maxdate is None):
+            raise ValueError("mindate and maxdate must be given together")
+        date_range = {name: value for name, value in (('mindate', mindate),
+                                                      ('maxdate', maxdate),
+                                                      ('datetype', datetype))
+                      if value is not None}
+        if self.search_cache is not None:
+            cached = self.search_cache.get(query, retmax=retmax, use_history=use_history,
+                                           **date_range)
+            if cached is not None:
+                return cached
         eutil = 'esearch.fcgi'
         params = {
             'db': 'pubmed',
             'term': query,
             'usehistory': 'y' if use_history else 'n',
             'retmode': 'xml',
-            'retmax': retmax
+            'retmax': retmax,
+            **date_range
         }
-        response = requests.get(f"{self.base_url}{eutil}", params=params)
+        response = self._request(eutil, params)
         response.raise_for_status()
-        xml = xmltodict.parse(response.content)
-        result = xml.get('eSearchResult', {})
-        id_list = result.get('IdList', {}).get('Id', [])
-        if isinstance(id_list, str):
-            id_list = [id_list]
-        elif not isinstance(id_list, list):
-            id_list = []
-        out = {
-            'count': result.get('Count', '0'),
-            'ret_max': result.get('RetMax', '0'),
-            'ret_start': result.get('RetStart', '0'),
-            'id_list': id_list,
-        }
-        if 'WebEnv' in result:
-            out['webenv'] = result['WebEnv']
-        if 'QueryKey' in result:
-            out['query_key'] = result['QueryKey']
-        return out
+        result = _parse_search_result(response.content)
+        if self.search_cache is not None:
+            self.search_cache.put(query, result, retmax=retmax, use_history=use_history,
+                                  **date_range)
+        return result
 
     def fetch_details(self, id_list: Optional[List[str]] = None, 
                      webenv: Optional[str] = None, 
@@ -75,42 +363,130 @@ class PubMedClient:
                      retmax: int = 100,
                      retstart: int = 0) -> List[dict]:
         """Fetch article details for given IDs or from a previous search.
+
+        Large ID lists are split into batches of `batch_size` and fetched
+        concurrently; articles are returned in the order of `id_list`.
         
         Args:
             id_list: List of PubMed IDs to fetch details for
             webenv: WebEnv string from a previous search
             query_key: Query key from a previous search
-            retmax: Maximum number of records to retrieve
-            retstart: Index of first record to retrieve
+            retmax: Maximum number of records to retrieve from a WebEnv
+            retstart: Index of first record to retrieve from a WebEnv
             
         Returns:
             List of article details dictionaries. Returns empty list if no results found.
         """
         if not id_list and not (webenv and query_key):
             return []
-        eutil = 'efetch.fcgi'
+        if id_list:
+            ids = [str(i) for i in id_list]
+            if self.article_store is not None:
+                return self._fetch_ids_through_store(ids)
+            return self._fetch_id_batches(ids)
         params = {
             'db': 'pubmed',
             'retmode': 'xml',
             'retmax': retmax,
-            'retstart': retstart
+            'retstart': retstart,
+            'WebEnv': webenv,
+            'query_key': query_key,
         }
-        if id_list:
-            params['id'] = ','.join(str(i) for i in id_list)
-        else:
-            params['WebEnv'] = webenv
-            params['query_key'] = query_key
-        response = requests.get(f"{self.base_url}{eutil}", params=params)
+        return self._efetch(params)
+
+    def _fetch_ids_through_store(self, ids: List[str]) -> List[dict]:
+        """Serve IDs from the article store, fetching and storing only the missing ones."""
+        records = self.article_store.get_records(ids)
+        missing = [pmid for pmid in dict.fromkeys(ids) if pmid not in records]
+        if missing:
+            fetched = self._fetch_id_batches(missing)
+            self.article_store.put_records(fetched)
+            for record in fetched:
+                records[record_pmid(record)] = record
+        return [records[pmid] for pmid in ids if pmid in records]
+
+    def _efetch(self, params: Dict[str, Any], method: str = 'GET') -> List[dict]:
+        """Run a single efetch request and parse the returned articles."""
+        response = self._request('efetch.fcgi', params, method)
         if response.status_code != 200:
             return []
-        xml_dict = xmltodict.parse(response.content)
-        data = xml_dict.get('PubmedArticleSet', {})
-        articles = data.get('PubmedArticle', [])
-        if not articles:
-            return []
-        if not isinstance(articles, list):
-            return [articles]
-        return articles
+        return _parse_article_set(response.content)
+
+    @staticmethod
+    def _id_batch_request(batch: List[str]) -> Tuple[Dict[str, Any], str]:
+        """Build efetch parameters for a batch of IDs, using POST for long ID lists."""
+        params = {
+            'db': 'pubmed',
+            'retmode': 'xml',
+            'retmax': len(batch),
+            'retstart': 0,
+            'id': ','.join(batch),
+        }
+        method = 'POST' if len(batch) > POST_ID_THRESHOLD else 'GET'
+        return params, method
+
+    def _fetch_id_batch(self, batch: List[str]) -> List[dict]:
+        """Fetch one batch of IDs."""
+        return self._efetch(*self._id_batch_request(batch))
+
+    def iter_details(self, id_list: Optional[List[str]] = None,
+                     webenv: Optional[str] = None,
+                     query_key: Optional[str] = None,
+                     retmax: int = 100,
+                     retstart: int = 0) -> Iterator[dict]:
+        """Stream article details, parsing each response incrementally.
+
+        Accepts the same arguments as `fetch_details`, but reads each efetch
+        response as it downloads and yields one article at a time instead of
+        building the whole payload's dictionary tree first. ID batches are
+        fetched one after another.
+
+        Yields:
+            Article details dictionaries, in the order of `id_list`
+        """
+        if not id_list and not (webenv and query_key):
+            return
+        if id_list:
+            ids = [str(i) for i in id_list]
+            size = max(1, self.batch_size)
+            efetch_requests = [self._id_batch_request(ids[i:i + size])
+                               for i in range(0, len(ids), size)]
+        else:
+            efetch_requests = [({
+                'db': 'pubmed',
+                'retmode': 'xml',
+                'retmax': retmax,
+                'retstart': retstart,
+                'WebEnv': webenv,
+                'query_key': query_key,
+            }, 'GET')]
+        for params, method in efetch_requests:
+            response = self._request('efetch.fcgi', params, method, stream=True)
+            try:
+                if response.status_code != 200:
+                    continue
+                chunks = response.iter_content(chunk_size=STREAM_CHUNK_SIZE)
+                if instrumentation.enabled():
+                    chunks = _count_bytes(chunks, 'efetch.fcgi')
+                yield from iter_pubmed_articles(chunks)
+            finally:
+                response.close()
+
+    def _fetch_id_batches(self, id_list: List[str]) -> List[dict]:
+        """Fetch IDs in batches of `batch_size` on a bounded worker pool.
+
+        Batches run concurrently but still pass through the shared rate
+        limiter. Results are concatenated in input order.
+        """
+        size = max(1, self.batch_size)
+        batches = [id_list[i:i + size] for i in range(0, len(id_list), size)]
+        if len(batches) == 1 or self.max_workers <= 1:
+            results = [self._fetch_id_batch(batch) for batch in batches]
+        else:
+            workers = min(self.max_workers, len(batches))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                results = list(executor.map(self._fetch_id_batch, batches))
+        return [article for batch in results for article in batch]
 
     def search_and_fetch(self, query: str, max_results: int = 100) -> List[dict]:
         """Convenience method to search and fetch details in one operation.
@@ -122,15 +498,52 @@ class PubMedClient:
         Returns:
             List of article details dictionaries
         """
-        search_results = self.search(query, use_history=True)
-        if not search_results or int(search_results.get('count', 0)) == 0:
-            return []
+        return list(self.iter_articles(query, max_results=max_results))
+
+    def iter_articles(self, query: str,
+                      batch_size: int = 500,
+                      max_results: Optional[int] = None,
+                      **search_options: Any) -> Iterator[dict]:
+        """Iterate over every article matching a query via the NCBI history server.
+
+        The query is stored server-side (WebEnv/query_key) and fetched in
+        `retstart` windows of `batch_size`. The next window is prefetched in
+        the background while the caller consumes the current one, so at most
+        two windows are held in memory regardless of the result size.
+
+        Args:
+            query: The search query string
+            batch_size: Number of articles per efetch window
+            max_results: Stop after this many articles (None for all matches)
+            **search_options: Extra `search` arguments, e.g. mindate/maxdate/datetype
+
+        Yields:
+            Article details dictionaries, in search result order
+        """
+        search_results = self.search(query, use_history=True, retmax=0, **search_options)
+        total = int(search_results.get('count', 0) or 0)
+        if max_results is not None:
+            total = min(total, max_results)
+        if total <= 0:
+            return
         webenv = search_results.get('webenv')
         query_key = search_results.get('query_key')
         if not webenv or not query_key:
-            id_list = search_results.get('id_list', [])
-            if not id_list:
-                return []
-            id_list = id_list[:max_results]
-            return self.fetch_details(id_list=id_list)
-        return self.fetch_details(webenv=webenv, query_key=query_key, retmax=max_results)
+            id_list = self.search(query, retmax=total, **search_options).get('id_list', [])
+            yield from self.fetch_details(id_list=id_list[:total])
+            return
+
+        def fetch_window(start: int) -> List[dict]:
+            return self.fetch_details(webenv=webenv, query_key=query_key,
+                                      retmax=min(batch_size, total - start),
+                                      retstart=start)
+
+        starts = range(0, total, batch_size)
+        with ThreadPoolExecutor(max_workers=1) as prefetcher:
+            pending = prefetcher.submit(fetch_window, starts[0])
+            for index in range(len(starts)):
+                articles = pending.result()
+                if index + 1 < len(starts):
+                    pending = prefetcher.submit(fetch_window, starts[index + 1])
+                yield from articles
+                del articles
@@ -1,4 +1,4 @@
-from typing import TypedDict, List, Union
+from typing import TypedDict, List, Optional, Union
 
 
 class ArticleDetails(TypedDict):
@@ -25,3 +25,11 @@ class SearchResult(TypedDict):
     count: str
     webenv: str
     query_key: str
+
+
+class ExportResult(TypedDict):
+    """Outcome of one exporter in a multi-format export."""
+    exporter: str
+    filename: str
+    seconds: float
+    error: Optional[str]
@@ -0,0 +1,112 @@
+"""
+Client-side rate limiting for NCBI E-utilities.
+
+NCBI allows 3 requests per second per IP address, or 10 requests per second
+when an API key is supplied. `TokenBucket` spaces requests so that a process
+stays at that ceiling without exceeding it, and `get_rate_limiter` hands out
+one shared bucket per API key so every client in the process draws from the
+same budget.
+
+Example:
+    limiter = get_rate_limiter(api_key=None)
+    limiter.acquire()              # blocking, from any thread
+    await limiter.acquire_async()  # non-blocking, from a coroutine
+"""
+
+import asyncio
+import logging
+import threading
+import time
+from typing import Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_RATE = 3.0
+API_KEY_RATE = 10.0
+
+
+class TokenBucket:
+    """Thread-safe and asyncio-safe token bucket.
+
+    Tokens are reserved under a lock and any wait happens outside of it, so
+    threads sleep with `time.sleep` and coroutines with `asyncio.sleep`
+    without blocking each other. Reservations may drive the token count
+    negative, which queues callers in arrival order.
+    """
+
+    def __init__(self, rate: float, capacity: float = 1.0) -> None:
+        """Create a bucket.
+
+        Args:
+            rate: Tokens added per second (requests per second)
+            capacity: Maximum burst size. The default of 1 spaces requests
+                      evenly, so no one-second window ever exceeds `rate`.
+        """
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        self.rate = float(rate)
+        self.capacity = float(capacity)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """Reserve one token and return how long the caller must wait, in seconds."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity,
+                               self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.rate
+
+    def acquire(self) -> None:
+        """Block the current thread until a token is available."""
+        delay = self.reserve()
+        if delay > 0:
+            time.sleep(delay)
+
+    async def acquire_async(self) -> None:
+        """Wait without blocking the event loop until a token is available."""
+        delay = self.reserve()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+
+_limiters: Dict[Optional[str], TokenBucket] = {}
+_limiters_lock = threading.Lock()
+
+
+def default_rate(api_key: Optional[str] = None) -> float:
+    """Return NCBI's allowed request rate with or without an API key."""
+    return API_KEY_RATE if api_key else DEFAULT_RATE
+
+
+def get_rate_limiter(api_key: Optional[str] = None,
+                     rate: Optional[float] = None) -> TokenBucket:
+    """Return the process-wide bucket for an API key.
+
+    NCBI's limit applies per key, so there is one bucket per key whatever
+    rate callers ask for. The first caller's rate sets it; a later caller
+    asking for a different rate shares the existing bucket, with a warning.
+
+    Args:
+        api_key: NCBI API key, or None for keyless access
+        rate: Requests per second. Defaults to 3, or 10 with an API key.
+
+    Returns:
+        A `TokenBucket` shared by every caller using the same key
+    """
+    key = api_key or None
+    with _limiters_lock:
+        limiter = _limiters.get(key)
+        if limiter is None:
+            limiter = _limiters[key] = TokenBucket(default_rate(api_key) if rate is None else rate)
+        elif rate is not None and float(rate) != limiter.rate:
+            logger.warning("Ignoring rate_limit=%s: this API key already shares a bucket at %s "
+                           "requests per second", rate, limiter.rate)
+        return limiter
@@ -2,7 +2,7 @@
 Basic PubMed Tools Usage Example
 
 This script demonstrates how to search PubMed, parse articles, and export results
-in various formats (CSV, Excel, PDF).
+in various formats (CSV, Excel, PDF). Selected formats are written concurrently.
 
 Usage:
     python basic_usage.py "search query" [--csv] [--xlsx] [--pdf] [--all] [--max-results N]
@@ -25,13 +25,14 @@ Example:
 
 import argparse
 import logging
-from typing import List, Tuple
+from typing import List
 
 from pubmed_tools.core.client import PubMedClient
 from pubmed_tools.parsers.article import ArticleParser
 from pubmed_tools.exporters.csv_exporter import CSVExporter
 from pubmed_tools.exporters.excel_exporter import ExcelExporter
 from pubmed_tools.exporters.pdf_exporter import PDFExporter
+from pubmed_tools.exporters.fanout import ExportFanout
 
 
 def setup_logging() -> None:
@@ -92,21 +93,20 @@ def main(
             logging.warning("No articles could be parsed.")
             return
 
-        exporters: List[Tuple[str, object]] = []
+        # Run all selected exporters at once; PDF rendering goes to a worker process.
+        fanout = ExportFanout()
         if export_csv:
-            exporters.append(('csv', CSVExporter()))
+            fanout.add(CSVExporter(), 'output.csv')
         if export_xlsx:
-            exporters.append(('xlsx', ExcelExporter()))
+            fanout.add(ExcelExporter(), 'output.xlsx')
         if export_pdf:
-            exporters.append(('pdf', PDFExporter()))
-
-        for format_name, exporter in exporters:
-            filename = f"output.{format_name}"
-            try:
-                exporter.export(parsed_articles, filename)
-                logging.info("Exported to %s", filename)
-            except Exception as e:
-                logging.error("Failed to export to %s: %s", filename, e)
+            fanout.add(PDFExporter(), 'output.pdf')
+
+        for result in fanout.run(parsed_articles):
+            if result['error']:
+                logging.error("Failed to export to %s: %s", result['filename'], result['error'])
+            else:
+                logging.info("Exported to %s in %.2fs", result['filename'], result['seconds'])
     except Exception as exc:
         logging.error("An error occurred: %s", exc)
 
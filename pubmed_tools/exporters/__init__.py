@@ -1,6 +1,33 @@
-from .base import BaseExporter
-from .csv_exporter import CSVExporter
-from .excel_exporter import ExcelExporter
-from .pdf_exporter import PDFExporter
+from typing import TYPE_CHECKING
 
-__all__ = ['BaseExporter', 'CSVExporter', 'ExcelExporter', 'PDFExporter']
+from .._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .base import BaseExporter
+    from .csv_exporter import CSVExporter
+    from .excel_exporter import ExcelExporter
+    from .pdf_exporter import PDFExporter
+    from .parquet_exporter import ParquetExporter, FeatherExporter
+    from .jsonl_exporter import JSONLExporter, iter_jsonl, load_jsonl
+    from .fanout import ExportFanout
+
+_LAZY_ATTRS = {
+    'BaseExporter': '.base',
+    'CSVExporter': '.csv_exporter',
+    'ExcelExporter': '.excel_exporter',
+    'PDFExporter': '.pdf_exporter',
+    'ParquetExporter': '.parquet_exporter',
+    'FeatherExporter': '.parquet_exporter',
+    'JSONLExporter': '.jsonl_exporter',
+    'iter_jsonl': '.jsonl_exporter',
+    'load_jsonl': '.jsonl_exporter',
+    'ExportFanout': '.fanout',
+}
+
+__all__ = ['BaseExporter', 'CSVExporter', 'ExcelExporter', 'PDFExporter',
+           'ParquetExporter', 'FeatherExporter', 'JSONLExporter',
+           'iter_jsonl', 'load_jsonl', 'ExportFanout']
+
+
+# Public names are imported on first access.
+__getattr__, __dir__ = lazy_exports(_LAZY_ATTRS, globals())
@@ -1,11 +1,66 @@
+import functools
+import gzip
+import inspect
+import io
+import itertools
 import os
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from collections.abc import Sequence
+from typing import IO, Iterable, List, Mapping, Optional, Tuple
+from .. import instrumentation
 from ..core.models import ArticleDetails
 from ..config import OUTPUT_DIR
 
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - exercised only without zstandard
+    zstandard = None
+
+# Write buffer used by streaming exporters.
+DEFAULT_BUFFER_SIZE = 1024 * 1024
+
+
+def _instrumented_export(export):
+    """Wrap an `export` or `export_async` implementation in an `exporter.export` span."""
+    parameter = inspect.signature(export).parameters.get('filename')
+    default = None if parameter is None or parameter.default is parameter.empty \
+        else parameter.default
+
+    def span(self, args, kwargs):
+        filename = args[0] if args else kwargs.get('filename', default)
+        return instrumentation.span('exporter.export', exporter=type(self).__name__,
+                                    filename=filename)
+
+    if inspect.iscoroutinefunction(export):
+        @functools.wraps(export)
+        async def async_wrapper(self, data, *args, **kwargs):
+            if not instrumentation.enabled():
+                return await export(self, data, *args, **kwargs)
+            with span(self, args, kwargs):
+                return await export(self, data, *args, **kwargs)
+        return async_wrapper
+
+    @functools.wraps(export)
+    def wrapper(self, data, *args, **kwargs):
+        if not instrumentation.enabled():
+            return export(self, data, *args, **kwargs)
+        with span(self, args, kwargs):
+            return export(self, data, *args, **kwargs)
+    return wrapper
+
 
 class BaseExporter(ABC):
+    # Whether `export` accepts append=True to add rows to an existing file.
+    supports_append = False
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+        # Every concrete exporter reports its write time without having to
+        # instrument its own `export` (or `export_async`).
+        for name in ('export', 'export_async'):
+            if name in cls.__dict__:
+                setattr(cls, name, _instrumented_export(cls.__dict__[name]))
+
     @abstractmethod
     def export(self,
                data: List[ArticleDetails],
@@ -27,17 +82,78 @@ class BaseExporter(ABC):
         if not data:
             raise ValueError("Data cannot be empty")
 
+        return self._resolve_fields(data[0], fields)
+
+    @staticmethod
+    def _resolve_fields(first: Mapping, fields: Optional[List[str]]) -> List[str]:
+        """Return the fields to export, checking them against the first record."""
         if fields is None:
-            return list(data[0].keys())
+            return list(first.keys())
 
-        missing = set(fields) - set(data[0].keys())
+        missing = set(fields) - set(first.keys())
         if missing:
             raise ValueError(f"Fields {missing} not found in data")
 
         return fields
 
+    def _validate_stream(self,
+                         data: Iterable[ArticleDetails],
+                         fields: Optional[List[str]] = None
+                         ) -> Tuple[List[str], Iterable[ArticleDetails]]:
+        """Validate any iterable of records without materializing it.
+
+        Returns:
+            The fields to export and an iterable that still yields every
+            record, including the one inspected for validation
+        """
+        if isinstance(data, Sequence):
+            return self._validate_data(data, fields), data
+        records = iter(data)
+        first = next(records, None)
+        if first is None:
+            raise ValueError("Data cannot be empty")
+        return self._resolve_fields(first, fields), itertools.chain([first], records)
+
     def _get_output_path(self, filename: str) -> str:
-        """Get the full output path for a filename."""
+        """Get the full output path for a filename, creating OUTPUT_DIR if needed."""
         if os.path.isabs(filename):
             return filename
+        os.makedirs(OUTPUT_DIR, exist_ok=True)
         return os.path.join(OUTPUT_DIR, filename)
+
+    @staticmethod
+    def _open_binary(path: str,
+                     append: bool = False,
+                     compression: Optional[str] = None,
+                     buffer_size: int = DEFAULT_BUFFER_SIZE) -> IO[bytes]:
+        """Open a buffered binary stream for writing, compressed with 'gzip' or 'zstd'.
+
+        Appending to a compressed file adds a new gzip member or zstd frame,
+        which standard readers handle.
+        """
+        mode = 'ab' if append else 'wb'
+        if compression == 'gzip':
+            return io.BufferedWriter(gzip.GzipFile(path, mode, compresslevel=6), buffer_size)
+        if compression == 'zstd':
+            if zstandard is None:
+                raise ImportError(
+                    "zstd compression requires zstandard. Install it with `pip install zstandard`.")
+            return io.BufferedWriter(zstandard.open(path, mode), buffer_size)
+        if compression is not None:
+            raise ValueError(f"Unsupported compression: {compression!r}")
+        return open(path, mode, buffering=buffer_size)
+
+    @classmethod
+    def _open_text(cls,
+                   path: str,
+                   append: bool = False,
+                   compress: Optional[bool] = None,
+                   buffer_size: int = DEFAULT_BUFFER_SIZE) -> IO[str]:
+        """Open a buffered UTF-8 text stream for writing, gzip-compressed if requested.
+
+        Compression defaults to on for paths ending in '.gz'.
+        """
+        if compress is None:
+            compress = path.endswith('.gz')
+        binary = cls._open_binary(path, append, 'gzip' if compress else None, buffer_size)
+        return io.TextIOWrapper(binary, encoding='utf-8', newline='')
@@ -1,19 +1,81 @@
 import csv
-from typing import List, Optional
-from .base import BaseExporter
+import os
+from contextlib import contextmanager
+from typing import AsyncIterable, Iterable, Iterator, List, Optional, Union
+from .base import BaseExporter, DEFAULT_BUFFER_SIZE
 from ..core.models import ArticleDetails
 
 
 class CSVExporter(BaseExporter):
+    supports_append = True
+
+    def __init__(self, buffer_size: int = DEFAULT_BUFFER_SIZE) -> None:
+        self.buffer_size = buffer_size
+
     def export(self,
-               data: List[ArticleDetails],
+               data: Iterable[ArticleDetails],
                filename: str = 'output.csv',
-               fields: Optional[List[str]] = None) -> None:
-        fields = self._validate_data(data, fields)
-        output_path = self._get_output_path(filename)
+               fields: Optional[List[str]] = None,
+               append: bool = False,
+               compress: Optional[bool] = None) -> None:
+        """Export data to a CSV file, streaming rows as they are produced.
+
+        `data` may be any iterable, including a generator; rows are written
+        through a buffered stream without being collected first.
+
+        Args:
+            data: ArticleDetails to export
+            filename: Output filename
+            fields: Optional list of fields to include
+            append: Add rows to an existing file; the header is only written
+                    if the file is new or empty
+            compress: Gzip the output (defaults to True for '.gz' filenames)
+        """
+        self._write(data, filename, fields, append, compress)
 
-        with open(output_path, 'w', newline='', encoding='utf-8') as output_file:
-            dict_writer = csv.DictWriter(
-                output_file, fieldnames=fields, extrasaction='ignore')
-            dict_writer.writeheader()
-            dict_writer.writerows(data)
+    def _write(self, data: Iterable[ArticleDetails], filename: str,
+               fields: Optional[List[str]], append: bool,
+               compress: Optional[bool]) -> None:
+        fields, rows = self._validate_stream(data, fields)
+        with self._open_writer(filename, fields, append, compress) as writer:
+            for row in rows:
+                writer.writerow(row)
+
+    async def export_async(self,
+                           data: Union[AsyncIterable[ArticleDetails], Iterable[ArticleDetails]],
+                           filename: str = 'output.csv',
+                           fields: Optional[List[str]] = None,
+                           append: bool = False,
+                           compress: Optional[bool] = None) -> None:
+        """Export rows from an async iterable (or a plain iterable) to CSV.
+
+        Accepts the same arguments as `export`. Rows are written as they
+        arrive, so an async fetch/parse pipeline can feed the file directly.
+        """
+        if not hasattr(data, '__aiter__'):
+            # Not through `export`, which would report a second span.
+            self._write(data, filename, fields, append, compress)
+            return
+        records = data.__aiter__()
+        try:
+            first = await records.__anext__()
+        except StopAsyncIteration:
+            raise ValueError("Data cannot be empty")
+        fields = self._resolve_fields(first, fields)
+        with self._open_writer(filename, fields, append, compress) as writer:
+            writer.writerow(first)
+            async for row in records:
+                writer.writerow(row)
+
+    @contextmanager
+    def _open_writer(self, filename: str, fields: List[str], append: bool,
+                     compress: Optional[bool]) -> Iterator[csv.DictWriter]:
+        """Open the output file and yield a DictWriter whose header is already written."""
+        output_path = self._get_output_path(filename)
+        write_header = not (append and os.path.exists(output_path)
+                            and os.path.getsize(output_path) > 0)
+        with self._open_text(output_path, append, compress, self.buffer_size) as output_file:
+            writer = csv.DictWriter(output_file, fieldnames=fields, extrasaction='ignore')
+            if write_header:
+                writer.writeheader()
+            yield writer
@@ -1,21 +1,60 @@
-import pandas as pd
-from typing import List, Optional
+from typing import Any, Iterable, List, Optional
+from openpyxl import Workbook
 from .base import BaseExporter
 from ..core.models import ArticleDetails
 
+# Excel's hard limit on rows per worksheet, including the header row.
+EXCEL_MAX_ROWS = 1048576
+
+
+def _cell_value(value: Any) -> Any:
+    """Convert a field to something openpyxl can store in a cell."""
+    if value is None or isinstance(value, (str, int, float)):
+        return value
+    # Lists and dicts (authors, publication_date) are written as their repr,
+    # matching what `DataFrame.to_excel` produced.
+    return str(value)
+
 
 class ExcelExporter(BaseExporter):
+    def __init__(self, max_rows: int = EXCEL_MAX_ROWS) -> None:
+        """Create an Excel exporter.
+
+        Args:
+            max_rows: Rows per worksheet, including the header, before the
+                      export continues on a new sheet
+        """
+        if max_rows < 2:
+            raise ValueError("max_rows must leave room for a header and one row")
+        self.max_rows = max_rows
+
     def export(self,
-               data: List[ArticleDetails],
+               data: Iterable[ArticleDetails],
                filename: str = 'output.xlsx',
                fields: Optional[List[str]] = None) -> None:
-        """Export data to Excel file."""
-        fields = self._validate_data(data, fields)
-        output_path = self._get_output_path(filename)
+        """Export data to an Excel file, streaming rows as they are produced.
 
-        if fields:
-            df = pd.DataFrame(data)[fields]
-        else:
-            df = pd.DataFrame(data)
+        The workbook is written in openpyxl's write-only mode, so memory use
+        stays flat regardless of the number of rows. When a sheet reaches
+        `max_rows`, export continues on a new sheet (Sheet2, Sheet3, ...)
+        with its own header row.
+
+        Args:
+            data: ArticleDetails to export; any iterable, including a generator
+            filename: Output filename
+            fields: Optional list of fields to include
+        """
+        fields, rows = self._validate_stream(data, fields)
+        output_path = self._get_output_path(filename)
 
-        df.to_excel(output_path, index=False)
+        workbook = Workbook(write_only=True)
+        sheet = None
+        sheet_rows = self.max_rows
+        for row in rows:
+            if sheet_rows == self.max_rows:
+                sheet = workbook.create_sheet(f"Sheet{len(workbook.worksheets) + 1}")
+                sheet.append(fields)
+                sheet_rows = 1
+            sheet.append([_cell_value(row.get(field)) for field in fields])
+            sheet_rows += 1
+        workbook.save(output_path)
@@ -0,0 +1,266 @@
+"""
+Concurrent export of one article stream to several formats.
+
+`ExportFanout` feeds the same articles to several exporters at once instead
+of running them one after another. I/O-bound writers (CSV, Excel, JSONL,
+Parquet, ...) run on threads. CPU-bound ones (PDF by default) run in a
+process pool, so they don't compete with the other writers for the GIL.
+
+Lists and `ArticleBatch`es are handed to every exporter as they are. Other iterables, such as
+generators, are read once and passed to the threaded exporters in chunks
+through bounded queues, so a slow writer applies back-pressure instead of
+letting memory grow. Process exporters need their input pickled, so they
+receive the stream once it has been fully read.
+
+Example:
+    from pubmed_tools.exporters import CSVExporter, ExportFanout, PDFExporter
+
+    fanout = ExportFanout()
+    fanout.add(CSVExporter(), 'articles.csv')
+    fanout.add(PDFExporter(), 'articles.pdf')
+    for result in fanout.run(articles):
+        print(result['filename'], result['seconds'], result['error'])
+"""
+
+import itertools
+import logging
+import os
+import queue
+import threading
+import time
+from collections.abc import Sequence
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+from .base import BaseExporter
+from .pdf_exporter import PDFExporter
+from ..core.batch import ArticleBatch
+from ..core.models import ArticleDetails, ExportResult
+
+logger = logging.getLogger(__name__)
+
+# Exporter types that run in the process pool unless `add(process=...)` says otherwise.
+CPU_BOUND_EXPORTERS: Tuple[type, ...] = (PDFExporter,)
+
+DEFAULT_CHUNK_SIZE = 256
+DEFAULT_QUEUE_CHUNKS = 8
+
+_END = object()
+_ABORT = object()
+
+
+class _FeedAborted(Exception):
+    """Raised inside threaded exporters when reading the source failed."""
+
+
+def _export_in_process(exporter: BaseExporter, data: List[ArticleDetails],
+                       filename: str, options: Dict[str, Any]) -> float:
+    """Worker: run one exporter in a child process and return its export time."""
+    start = time.perf_counter()
+    exporter.export(data, filename, **options)
+    return time.perf_counter() - start
+
+
+class _QueueReader:
+    """Iterator over the chunks a threaded exporter receives from the reader."""
+
+    def __init__(self, maxsize: int) -> None:
+        self.chunks: 'queue.Queue' = queue.Queue(maxsize)
+        self._done = False
+
+    def __iter__(self) -> Iterator[ArticleDetails]:
+        while not self._done:
+            chunk = self.chunks.get()
+            if chunk is _END or chunk is _ABORT:
+                self._done = True
+                if chunk is _ABORT:
+                    raise _FeedAborted("reading the source failed")
+                return
+            yield from chunk
+
+    def drain(self) -> None:
+        """Discard what is left, so an exporter that stopped early never blocks the reader."""
+        while not self._done:
+            self._done = self.chunks.get() in (_END, _ABORT)
+
+
+class _Target:
+    def __init__(self, exporter: BaseExporter, filename: str, process: bool,
+                 options: Dict[str, Any]) -> None:
+        self.exporter = exporter
+        self.filename = filename
+        self.process = process
+        self.options = options
+        self.seconds = 0.0
+        self.error: Optional[str] = None
+
+    def export_options(self, fields: Optional[List[str]]) -> Dict[str, Any]:
+        if fields is None or 'fields' in self.options:
+            return self.options
+        return dict(self.options, fields=fields)
+
+    def result(self) -> ExportResult:
+        return {'exporter': type(self.exporter).__name__,
+                'filename': self.filename,
+                'seconds': self.seconds,
+                'error': self.error}
+
+
+class ExportFanout:
+    def __init__(self,
+                 chunk_size: int = DEFAULT_CHUNK_SIZE,
+                 queue_chunks: int = DEFAULT_QUEUE_CHUNKS) -> None:
+        """Create an empty fan-out.
+
+        Args:
+            chunk_size: Articles passed to threaded exporters per queue item
+            queue_chunks: Chunks buffered per exporter before the reader waits
+        """
+        self.chunk_size = max(1, chunk_size)
+        self.queue_chunks = max(1, queue_chunks)
+        self._targets: List[_Target] = []
+
+    def add(self, exporter: BaseExporter, filename: str,
+            process: Optional[bool] = None, **options: Any) -> 'ExportFanout':
+        """Register an exporter and its output file.
+
+        Args:
+            exporter: Exporter to run
+            filename: Output filename passed to `exporter.export`
+            process: Run in the process pool (defaults to True for
+                     `CPU_BOUND_EXPORTERS`, False otherwise)
+            **options: Extra keyword arguments for `exporter.export`
+
+        Returns:
+            The fan-out itself, so calls can be chained
+        """
+        if process is None:
+            process = isinstance(exporter, CPU_BOUND_EXPORTERS)
+        self._targets.append(_Target(exporter, filename, process, options))
+        return self
+
+    def run(self, data: Iterable[ArticleDetails],
+            fields: Optional[List[str]] = None) -> List[ExportResult]:
+        """Export `data` with every registered exporter concurrently.
+
+        Failures are logged and reported rather than raised, so one broken
+        format does not lose the others.
+
+        Args:
+            data: Articles to export; any iterable, read once
+            fields: Optional list of fields passed to every exporter
+
+        Returns:
+            One `ExportResult` per exporter, in registration order, with the
+            wall-clock seconds its `export` call took and any error message.
+            Streaming exporters also spend part of that time waiting for the
+            source.
+
+        Raises:
+            Whatever reading `data` raised. Writer threads are stopped first
+            and the files they had created are deleted.
+        """
+        for target in self._targets:
+            target.seconds, target.error = 0.0, None
+        threaded = [t for t in self._targets if not t.process]
+        processed = [t for t in self._targets if t.process]
+        streaming = not isinstance(data, (Sequence, ArticleBatch))
+
+        executor = None
+        if processed:
+            executor = ProcessPoolExecutor(max_workers=len(processed))
+            # Start the workers before any writer thread exists, so forking
+            # never copies a thread that holds a lock.
+            for future in [executor.submit(os.getpid) for _ in processed]:
+                future.result()
+
+        try:
+            readers = []
+            threads = []
+            # Files that exist before the run (e.g. append targets) are never deleted.
+            existing = {id(t) for t in threaded
+                        if os.path.exists(t.exporter._get_output_path(t.filename))}
+            for target in threaded:
+                reader = _QueueReader(self.queue_chunks) if streaming else None
+                if reader is not None:
+                    readers.append(reader)
+                thread = threading.Thread(target=self._run_in_thread,
+                                          args=(target, reader or data, fields),
+                                          name=f"export-{target.filename}", daemon=True)
+                thread.start()
+                threads.append(thread)
+
+            if streaming:
+                try:
+                    data = self._feed(data, readers, collect=bool(processed))
+                except BaseException:
+                    for thread in threads:
+                        thread.join()
+                    self._discard_outputs(threaded, existing)
+                    raise
+            futures = [(target, executor.submit(_export_in_process, target.exporter, data,
+                                                target.filename, target.export_options(fields)))
+                       for target in processed]
+            for target, future in futures:
+                try:
+                    target.seconds = future.result()
+                except Exception as e:
+                    self._record_error(target, e)
+            for thread in threads:
+                thread.join()
+        finally:
+            if executor is not None:
+                executor.shutdown()
+        return [target.result() for target in self._targets]
+
+    def _feed(self, data: Iterable[ArticleDetails], readers: List[_QueueReader],
+              collect: bool) -> List[ArticleDetails]:
+        """Read `data` once, pushing chunks to every reader; return the articles if collected."""
+        collected: List[ArticleDetails] = []
+        records = iter(data)
+        end = _ABORT
+        try:
+            while True:
+                chunk = list(itertools.islice(records, self.chunk_size))
+                if not chunk:
+                    break
+                for reader in readers:
+                    reader.chunks.put(chunk)
+                if collect:
+                    collected.extend(chunk)
+            end = _END
+        finally:
+            # On failure the exporters see _FeedAborted instead of a normal
+            # end of stream, so none of them finalizes a partial file as complete.
+            for reader in readers:
+                reader.chunks.put(end)
+        return collected
+
+    def _run_in_thread(self, target: _Target, source: Iterable[ArticleDetails],
+                       fields: Optional[List[str]]) -> None:
+        start = time.perf_counter()
+        try:
+            target.exporter.export(source, target.filename, **target.export_options(fields))
+        except Exception as e:
+            self._record_error(target, e)
+        finally:
+            if isinstance(source, _QueueReader):
+                source.drain()
+            target.seconds = time.perf_counter() - start
+
+    @staticmethod
+    def _discard_outputs(targets: List[_Target], existing: Set[int]) -> None:
+        """Delete the files of exports that were cut short, unless they predate the run."""
+        for target in targets:
+            path = target.exporter._get_output_path(target.filename)
+            if id(target) in existing:
+                logger.warning("Export to %s was cut short; rows written before the "
+                               "failure remain in the file", path)
+            elif os.path.exists(path):
+                os.remove(path)
+                logger.warning("Removed incomplete export %s", path)
+
+    @staticmethod
+    def _record_error(target: _Target, error: Exception) -> None:
+        target.error = str(error) or type(error).__name__
+        logger.error("Export to %s failed: %s", target.filename, target.error)
@@ -0,0 +1,136 @@
+"""
+JSON Lines (NDJSON) export and loading.
+
+`JSONLExporter` writes one JSON object per line and `iter_jsonl` reads
+them back, so parsed `ArticleDetails` can be checkpointed between pipeline
+stages and reloaded without fetching or parsing again. Both stream, both
+understand gzip ('.gz') and zstd ('.zst') files, and both use orjson when
+it is installed.
+
+Example:
+    from pubmed_tools.exporters.jsonl_exporter import JSONLExporter, iter_jsonl
+
+    exporter = JSONLExporter()
+    exporter.export(articles, 'articles.jsonl.gz')
+    exporter.export(more_articles, 'articles.jsonl.gz', append=True)
+    for article in exporter.iter_load('articles.jsonl.gz'):
+        ...
+"""
+
+import gzip
+import io
+import json
+from typing import Any, Callable, Iterable, Iterator, List, Optional
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised only without orjson
+    orjson = None
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - exercised only without zstandard
+    zstandard = None
+
+from .base import BaseExporter, DEFAULT_BUFFER_SIZE
+from ..core.models import ArticleDetails
+
+_SUFFIX_COMPRESSION = (('.gz', 'gzip'), ('.zst', 'zstd'))
+
+
+def compression_for_path(path: str) -> Optional[str]:
+    """Return 'gzip' or 'zstd' for '.gz' and '.zst' paths, otherwise None."""
+    for suffix, compression in _SUFFIX_COMPRESSION:
+        if path.endswith(suffix):
+            return compression
+    return None
+
+
+def _json_line_encoder() -> Callable[[Any], bytes]:
+    if orjson is not None:
+        options = orjson.OPT_APPEND_NEWLINE | orjson.OPT_NON_STR_KEYS
+
+        def encode(record: Any) -> bytes:
+            return orjson.dumps(record, option=options)
+    else:
+        dumps = json.JSONEncoder(ensure_ascii=False, separators=(',', ':')).encode
+
+        def encode(record: Any) -> bytes:
+            return (dumps(record) + '\n').encode('utf-8')
+    return encode
+
+
+_loads = orjson.loads if orjson is not None else json.loads
+
+
+def iter_jsonl(path: str, compression: Optional[str] = None) -> Iterator[ArticleDetails]:
+    """Stream records from a JSON Lines file; blank lines are skipped.
+
+    Args:
+        path: File to read
+        compression: 'gzip', 'zstd' or None (defaults to the file suffix)
+    """
+    if compression is None:
+        compression = compression_for_path(path)
+    if compression == 'gzip':
+        stream = gzip.open(path, 'rb')
+    elif compression == 'zstd':
+        if zstandard is None:
+            raise ImportError(
+                "zstd compression requires zstandard. Install it with `pip install zstandard`.")
+        stream = io.BufferedReader(zstandard.open(path, 'rb'), DEFAULT_BUFFER_SIZE)
+    elif compression is None:
+        stream = open(path, 'rb', buffering=DEFAULT_BUFFER_SIZE)
+    else:
+        raise ValueError(f"Unsupported compression: {compression!r}")
+    with stream:
+        for line in stream:
+            if line.strip():
+                yield _loads(line)
+
+
+def load_jsonl(path: str, compression: Optional[str] = None) -> List[ArticleDetails]:
+    """Read every record from a JSON Lines file into a list."""
+    return list(iter_jsonl(path, compression))
+
+
+class JSONLExporter(BaseExporter):
+    supports_append = True
+
+    def __init__(self, buffer_size: int = DEFAULT_BUFFER_SIZE) -> None:
+        self.buffer_size = buffer_size
+
+    def export(self,
+               data: Iterable[ArticleDetails],
+               filename: str = 'output.jsonl',
+               fields: Optional[List[str]] = None,
+               append: bool = False,
+               compression: Optional[str] = None) -> None:
+        """Export data as JSON Lines, streaming one record per line.
+
+        Args:
+            data: ArticleDetails to export; any iterable, including a generator
+            filename: Output filename
+            fields: Optional list of fields to include
+            append: Add records to the end of an existing file
+            compression: 'gzip', 'zstd' or None (defaults to the file suffix)
+        """
+        fields, rows = self._validate_stream(data, fields)
+        output_path = self._get_output_path(filename)
+        if compression is None:
+            compression = compression_for_path(output_path)
+        encode = _json_line_encoder()
+
+        with self._open_binary(output_path, append, compression, self.buffer_size) as output_file:
+            write = output_file.write
+            for row in rows:
+                write(encode({field: row.get(field) for field in fields}))
+
+    def iter_load(self, filename: str,
+                  compression: Optional[str] = None) -> Iterator[ArticleDetails]:
+        """Stream records back from a file written by `export`."""
+        return iter_jsonl(self._get_output_path(filename), compression)
+
+    def load(self, filename: str, compression: Optional[str] = None) -> List[ArticleDetails]:
+        """Read every record back from a file written by `export`."""
+        return list(self.iter_load(filename, compression))
@@ -0,0 +1,218 @@
+"""
+Columnar exporters for analytics pipelines.
+
+`ParquetExporter` writes Parquet files and `FeatherExporter` writes Arrow
+IPC (Feather v2) files. Both stream: records are collected into Arrow record
+batches of `row_group_size` rows and written one batch at a time, so an
+export never holds more than one batch in memory.
+
+Columns keep their natural types, so Spark, DuckDB or pandas can read them
+without re-parsing:
+
+- `authors` is a list<string> column
+- `publication_date` is a struct<year, month, day> column, or a string
+  column when dates were converted to YYYY-MM-DD; later batches are
+  converted to whichever shape the first batch chose
+- every other article field is a string column
+
+The schema is fixed by the first batch. Empty values do not decide a
+column's type, so a field that starts out as None still takes later values.
+
+Note:
+    Requires the optional `pyarrow` dependency (`pip install pubmed_tools[arrow]`).
+
+Example:
+    from pubmed_tools.exporters.parquet_exporter import ParquetExporter
+
+    ParquetExporter().export(articles, 'articles.parquet')
+"""
+
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, Optional, Sequence
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # pragma: no cover - exercised only without pyarrow
+    pa = pq = None
+
+from .base import BaseExporter
+from ..core.models import ArticleDetails
+from ..parsers.date import convert_publication_date
+
+DEFAULT_ROW_GROUP_SIZE = 10000
+
+# Columns whose values repeat across articles and compress well with
+# Parquet dictionary pages.
+DEFAULT_DICTIONARY_COLUMNS = ('authors', 'publication_date')
+
+
+_DATE_STRUCT_FIELDS = ('year', 'month', 'day')
+
+
+def _field_type(name: str, values: Sequence[Any]) -> 'pa.DataType':
+    """Return the Arrow type of a field from its values in the first batch.
+
+    Known article fields have fixed types. `publication_date` is a struct
+    unless the batch holds string dates, and other fields take the type of
+    their non-null values (string if there are none).
+    """
+    if name in ('title', 'abstract', 'pmid'):
+        return pa.string()
+    if name == 'authors':
+        return pa.list_(pa.string())
+    if name == 'publication_date':
+        if all(value is None or isinstance(value, Mapping) for value in values):
+            return pa.struct([(part, pa.string()) for part in _DATE_STRUCT_FIELDS])
+        return pa.string()
+    present = [value for value in values if value is not None]
+    return pa.array(present).type if present else pa.string()
+
+
+def _coerce_dates(values: List[Any], as_struct: bool) -> List[Any]:
+    """Convert dates to the column's shape: parts dicts or YYYY-MM-DD strings."""
+    if as_struct:
+        return [dict(zip(_DATE_STRUCT_FIELDS, (value.split('-') + ['', ''])[:3]))
+                if isinstance(value, str) else value
+                for value in values]
+    return [convert_publication_date(value) if isinstance(value, Mapping) else value
+            for value in values]
+
+
+def _leaf_paths(field: 'pa.Field', prefix: str = '') -> List[str]:
+    """Return the Parquet column paths under an Arrow field."""
+    path = f"{prefix}{field.name}"
+    if pa.types.is_list(field.type) or pa.types.is_large_list(field.type):
+        return _leaf_paths(pa.field('element', field.type.value_type), f"{path}.list.")
+    if pa.types.is_struct(field.type):
+        return [leaf for child in field.type for leaf in _leaf_paths(child, f"{path}.")]
+    return [path]
+
+
+class _ArrowExporter(BaseExporter):
+    """Shared batching for the Arrow-based exporters."""
+
+    def __init__(self,
+                 row_group_size: int = DEFAULT_ROW_GROUP_SIZE,
+                 compression: Optional[str] = 'zstd',
+                 compression_level: Optional[int] = None) -> None:
+        if pa is None:
+            raise ImportError(
+                f"{type(self).__name__} requires pyarrow. Install it with `pip install pyarrow`.")
+        self.row_group_size = max(1, row_group_size)
+        self.compression = compression
+        self.compression_level = compression_level
+
+    @staticmethod
+    def _schema(fields: Sequence[str], columns: Dict[str, List[Any]]) -> 'pa.Schema':
+        """Build the schema from the first batch's columns."""
+        return pa.schema([pa.field(name, _field_type(name, columns[name])) for name in fields])
+
+    @staticmethod
+    def _batch(schema: 'pa.Schema', columns: Dict[str, List[Any]]) -> 'pa.RecordBatch':
+        if 'publication_date' in columns:
+            as_struct = pa.types.is_struct(schema.field('publication_date').type)
+            columns['publication_date'] = _coerce_dates(columns['publication_date'], as_struct)
+        return pa.RecordBatch.from_pydict(columns, schema=schema)
+
+    def _record_batches(self, data: Iterable[ArticleDetails],
+                        fields: Optional[List[str]]) -> Iterator['pa.RecordBatch']:
+        """Yield record batches of `row_group_size` rows; the first fixes the schema."""
+        fields, rows = self._validate_stream(data, fields)
+        schema = None
+        columns: Dict[str, List[Any]] = {name: [] for name in fields}
+        count = 0
+        for row in rows:
+            for name in fields:
+                columns[name].append(row.get(name))
+            count += 1
+            if count == self.row_group_size:
+                if schema is None:
+                    schema = self._schema(fields, columns)
+                yield self._batch(schema, columns)
+                columns = {name: [] for name in fields}
+                count = 0
+        if count:
+            if schema is None:
+                schema = self._schema(fields, columns)
+            yield self._batch(schema, columns)
+
+
+class ParquetExporter(_ArrowExporter):
+    def __init__(self,
+                 row_group_size: int = DEFAULT_ROW_GROUP_SIZE,
+                 compression: Optional[str] = 'zstd',
+                 compression_level: Optional[int] = None,
+                 dictionary_columns: Optional[Sequence[str]] = DEFAULT_DICTIONARY_COLUMNS
+                 ) -> None:
+        """Create a Parquet exporter.
+
+        Args:
+            row_group_size: Rows per Parquet row group (and per write)
+            compression: Parquet codec, e.g. 'zstd', 'snappy', 'gzip' or None
+            compression_level: Optional codec level
+            dictionary_columns: Fields written with dictionary encoding
+                                (None to dictionary-encode every column)
+        """
+        super().__init__(row_group_size, compression, compression_level)
+        self.dictionary_columns = dictionary_columns
+
+    def export(self,
+               data: Iterable[ArticleDetails],
+               filename: str = 'output.parquet',
+               fields: Optional[List[str]] = None) -> None:
+        """Export data to a Parquet file, one row group at a time.
+
+        Args:
+            data: ArticleDetails to export; any iterable, including a generator
+            filename: Output filename
+            fields: Optional list of fields to include
+        """
+        output_path = self._get_output_path(filename)
+        writer = None
+        try:
+            for batch in self._record_batches(data, fields):
+                if writer is None:
+                    writer = pq.ParquetWriter(
+                        output_path, batch.schema,
+                        compression=self.compression or 'none',
+                        compression_level=self.compression_level,
+                        use_dictionary=self._use_dictionary(batch.schema))
+                writer.write_batch(batch, row_group_size=self.row_group_size)
+        finally:
+            if writer is not None:
+                writer.close()
+
+    def _use_dictionary(self, schema: 'pa.Schema') -> Any:
+        if self.dictionary_columns is None:
+            return True
+        return [path for field in schema
+                if field.name in self.dictionary_columns
+                for path in _leaf_paths(field)]
+
+
+class FeatherExporter(_ArrowExporter):
+    def export(self,
+               data: Iterable[ArticleDetails],
+               filename: str = 'output.feather',
+               fields: Optional[List[str]] = None) -> None:
+        """Export data to an Arrow IPC (Feather v2) file, one record batch at a time.
+
+        Args:
+            data: ArticleDetails to export; any iterable, including a generator
+            filename: Output filename
+            fields: Optional list of fields to include
+        """
+        output_path = self._get_output_path(filename)
+        compression = self.compression
+        if compression is not None and self.compression_level is not None:
+            compression = pa.Codec(compression, self.compression_level)
+        options = pa.ipc.IpcWriteOptions(compression=compression)
+        writer = None
+        try:
+            for batch in self._record_batches(data, fields):
+                if writer is None:
+                    writer = pa.ipc.new_file(output_path, batch.schema, options=options)
+                writer.write_batch(batch)
+        finally:
+            if writer is not None:
+                writer.close()
@@ -1,48 +1,178 @@
-from typing import List, Optional, Dict
+from typing import Iterable, List, Optional, Dict, Tuple
+import itertools
 import logging
+import os
+import tempfile
+import threading
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from xml.sax.saxutils import escape
 from reportlab.lib.pagesizes import letter
-from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, PageBreak
+from reportlab.platypus import (SimpleDocTemplate, Paragraph, Spacer, PageBreak,
+                                Flowable, LongTable, TableStyle)
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.pdfbase import pdfmetrics
 from reportlab.pdfbase.ttfonts import TTFont
 from reportlab.lib.fonts import addMapping
 
 from .base import BaseExporter
+from .. import instrumentation
 from ..core.models import ArticleDetails
 from ..parsers.date import convert_publication_date
 from ..config import PDF_FONT_PATH
 
+try:
+    from pypdf import PdfReader, PdfWriter
+except ImportError:  # pragma: no cover - exercised only without pypdf
+    PdfReader = PdfWriter = None
+
 logger = logging.getLogger(__name__)
 
-class PDFExporter(BaseExporter):
-    """PDF exporter for PubMed articles."""
-    
+FONT_NAME = 'DejaVuSans'
+
+# Articles rendered per part in chunked mode.
+DEFAULT_PDF_CHUNK_SIZE = 250
+
+# (label, 1-based page within the part) for each article in a rendered part.
+TocEntries = List[Tuple[str, int]]
+
+
+class _ArticleMarker(Flowable):
+    """Invisible flowable marking where an article starts, for the table of contents."""
+
+    def __init__(self, label: str) -> None:
+        super().__init__()
+        self.label = label
+
+    def wrap(self, available_width, available_height):
+        return 0, 0
+
+    def draw(self) -> None:
+        pass
+
+
+class _TrackingDocTemplate(SimpleDocTemplate):
+    """Document template that records the page each article starts on."""
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.toc_entries: TocEntries = []
+
+    def afterFlowable(self, flowable) -> None:
+        if isinstance(flowable, _ArticleMarker):
+            self.toc_entries.append((flowable.label, self.page))
+
+
+def _render_chunk_in_worker(articles: List[ArticleDetails],
+                            path: str) -> Tuple[TocEntries, int]:
+    """Worker: render one part; fonts and styles come from the process-wide registry."""
+    return PDFExporter()._render_chunk(articles, path)
+
+
+class _PDFResources:
+    """Process-wide, thread-safe cache of the registered font and paragraph styles.
+
+    Parsing the TTF and building the style sheet happens once per process;
+    every later `PDFExporter` reuses the result. Setup times and reuse
+    counts are kept for `pdf_resource_stats`.
+    """
+
     def __init__(self) -> None:
-        self._register_fonts()
-        self.styles = self._initialize_styles()
+        self._lock = threading.Lock()
+        self._fonts: Dict[str, str] = {}
+        self._styles: Optional[Dict[str, ParagraphStyle]] = None
+        self.font_seconds = 0.0
+        self.style_seconds = 0.0
+        self.reuses = 0
 
-    def _register_fonts(self) -> None:
-        """Register a Unicode-compatible font for use in the PDF."""
-        pdfmetrics.registerFont(TTFont('DejaVuSans', PDF_FONT_PATH))
-        addMapping('DejaVuSans', 0, 0, 'DejaVuSans')  # Can map Regular if needed
+    def register_font(self, name: str, path: str) -> None:
+        """Register a TrueType font under `name` unless it already is."""
+        if self._fonts.get(name) == path:
+            return
+        with self._lock:
+            if self._fonts.get(name) == path:
+                return
+            start = time.perf_counter()
+            pdfmetrics.registerFont(TTFont(name, path))
+            addMapping(name, 0, 0, name)  # Can map Regular if needed
+            elapsed = time.perf_counter() - start
+            self.font_seconds += elapsed
+            self._fonts[name] = path
+            logger.debug("Registered font %s from %s in %.3fs", name, path, elapsed)
 
-    def _initialize_styles(self) -> Dict[str, ParagraphStyle]:
+    def styles(self) -> Dict[str, ParagraphStyle]:
+        """Return the shared paragraph styles, building them on first use."""
+        with self._lock:
+            if self._styles is None:
+                start = time.perf_counter()
+                self._styles = self._build_styles()
+                self.style_seconds = time.perf_counter() - start
+            else:
+                self.reuses += 1
+            return self._styles
+
+    @staticmethod
+    def _build_styles() -> Dict[str, ParagraphStyle]:
         """Initialize custom paragraph styles for PDF export."""
         base_styles = getSampleStyleSheet()
         styles = {
             'title': ParagraphStyle(
                 'CustomTitle',
                 parent=base_styles['Heading1'],
-                fontName='DejaVuSans',
+                fontName=FONT_NAME,
             ),
             'body': ParagraphStyle(
                 'CustomBody',
                 parent=base_styles['Normal'],
-                fontName='DejaVuSans',
+                fontName=FONT_NAME,
             ),
         }
         return styles
+
+    def stats(self) -> Dict[str, float]:
+        with self._lock:
+            return {
+                'fonts': len(self._fonts),
+                'font_seconds': self.font_seconds,
+                'style_seconds': self.style_seconds,
+                'reuses': self.reuses,
+            }
+
+
+_resources = _PDFResources()
+
+
+def pdf_resource_stats() -> Dict[str, float]:
+    """Return one-off font/style setup times and how often they were reused since.
+
+    Every reuse saves roughly `font_seconds + style_seconds` compared with
+    setting the font and styles up again.
+    """
+    return _resources.stats()
+
+
+class PDFExporter(BaseExporter):
+    """PDF exporter for PubMed articles."""
     
+    def __init__(self) -> None:
+        self._register_fonts()
+        self.styles = self._initialize_styles()
+
+    def __setstate__(self, state: dict) -> None:
+        # Instances unpickled in a fresh worker process (e.g. by ExportFanout)
+        # must register the font there as well.
+        self.__dict__.update(state)
+        self._register_fonts()
+
+    def _register_fonts(self) -> None:
+        """Register a Unicode-compatible font for use in the PDF (once per process)."""
+        _resources.register_font(FONT_NAME, PDF_FONT_PATH)
+
+    def _initialize_styles(self) -> Dict[str, ParagraphStyle]:
+        """Return the custom paragraph styles shared by every exporter in the process."""
+        return dict(_resources.styles())
+
     def _sanitize_text(self, text: str) -> str:
         """Sanitize and prepare text for PDF export."""
         if not text:
@@ -50,46 +180,174 @@ class PDFExporter(BaseExporter):
         # The font change should handle the previously problematic characters
         return text
     
-    def export(self, 
-               data: List[ArticleDetails], 
-               filename: str = 'output.pdf', 
-               fields: Optional[List[str]] = None) -> None:
-        """Export data to formatted PDF file."""
+    def export(self,
+               data: Iterable[ArticleDetails],
+               filename: str = 'output.pdf',
+               fields: Optional[List[str]] = None,
+               chunk_size: Optional[int] = None,
+               workers: int = 1,
+               toc: bool = True) -> None:
+        """Export data to formatted PDF file.
+
+        By default the whole report is laid out in a single pass. Passing
+        `chunk_size` (or `workers` > 1) switches to chunked mode: articles are
+        rendered `chunk_size` at a time into part files, optionally in
+        parallel worker processes, and the parts are merged into one PDF with
+        a table of contents and bookmarks. Chunked mode keeps memory bounded
+        for reports with thousands of articles and requires `pypdf`.
+
+        Args:
+            data: ArticleDetails to export; any iterable, including a generator
+            filename: Output filename
+            fields: Optional list of fields to validate against the data
+            chunk_size: Articles per rendered part (enables chunked mode)
+            workers: Number of processes rendering parts in chunked mode
+            toc: Prepend a table of contents in chunked mode
+        """
         try:
-            fields = self._validate_data(data, fields)
+            fields, articles = self._validate_stream(data, fields)
             output_path = self._get_output_path(filename)
-            
-            # Create PDF document
-            doc = SimpleDocTemplate(
-                output_path,
-                pagesize=letter,
-                rightMargin=30,
-                leftMargin=30)
-            elements = []
-
-            # Add each article as a separate section
-            for item in data:
-                try:
-                    elements.extend(self._format_article(item))
-                except Exception as e:
-                    logger.error(f"Failed to format article {item.get('pmid', 'unknown')}: {str(e)}")
-                    continue
-            
-            # Build PDF
-            try:
-                doc.build(elements)
-                logger.info(f"Successfully exported {len(data)} articles to {output_path}")
-            except Exception as e:
-                raise IOError(f"Failed to create PDF: {str(e)}")
-                
+
+            if chunk_size is not None or workers > 1:
+                count = self._export_chunked(articles, output_path,
+                                             chunk_size or DEFAULT_PDF_CHUNK_SIZE,
+                                             workers, toc)
+            else:
+                count, _ = self._build(articles, output_path)
+            logger.info(f"Successfully exported {count} articles to {output_path}")
+
         except Exception as e:
             logger.error(f"PDF export failed: {str(e)}")
             raise
 
+    def _build(self, articles: Iterable[ArticleDetails],
+               output_path: str) -> Tuple[int, TocEntries]:
+        """Lay out articles into one PDF, returning the article count and TOC entries."""
+        doc = _TrackingDocTemplate(
+            output_path,
+            pagesize=letter,
+            rightMargin=30,
+            leftMargin=30)
+        elements = []
+        count = 0
+
+        # Add each article as a separate section
+        for item in articles:
+            count += 1
+            try:
+                elements.extend(self._format_article(item))
+            except Exception as e:
+                logger.error(f"Failed to format article {item.get('pmid', 'unknown')}: {str(e)}")
+                continue
+
+        # Build PDF
+        try:
+            with instrumentation.span('exporter.pdf.build', articles=count):
+                doc.build(elements)
+        except Exception as e:
+            raise IOError(f"Failed to create PDF: {str(e)}")
+        return count, doc.toc_entries
+
+    def _render_chunk(self, articles: List[ArticleDetails],
+                      path: str) -> Tuple[TocEntries, int]:
+        """Render one part, returning its TOC entries and page count."""
+        _, entries = self._build(articles, path)
+        return entries, len(PdfReader(path).pages)
+
+    def _export_chunked(self,
+                        articles: Iterable[ArticleDetails],
+                        output_path: str,
+                        chunk_size: int,
+                        workers: int,
+                        toc: bool) -> int:
+        """Render articles in parts and merge them into `output_path`."""
+        if PdfWriter is None:
+            raise ImportError(
+                "Chunked PDF export requires pypdf. Install it with `pip install pypdf`.")
+        chunk_size = max(1, chunk_size)
+        records = iter(articles)
+        chunks = iter(lambda: list(itertools.islice(records, chunk_size)), [])
+        count = 0
+
+        with tempfile.TemporaryDirectory(dir=os.path.dirname(output_path) or None) as tmp:
+            parts: List[Tuple[str, TocEntries, int]] = []
+            paths = (os.path.join(tmp, f"part{index:05d}.pdf") for index in itertools.count())
+            if workers > 1:
+                with ProcessPoolExecutor(max_workers=workers) as executor:
+                    # Only a couple of chunks per worker are in flight, so the
+                    # input is never fully materialized.
+                    pending = deque()
+                    for chunk in chunks:
+                        count += len(chunk)
+                        path = next(paths)
+                        pending.append((path, executor.submit(
+                            _render_chunk_in_worker, chunk, path)))
+                        if len(pending) >= 2 * workers:
+                            path, future = pending.popleft()
+                            parts.append((path, *future.result()))
+                    for path, future in pending:
+                        parts.append((path, *future.result()))
+            else:
+                for chunk in chunks:
+                    count += len(chunk)
+                    path = next(paths)
+                    parts.append((path, *self._render_chunk(chunk, path)))
+
+            self._merge_parts(parts, output_path, toc, tmp)
+        return count
+
+    def _merge_parts(self,
+                     parts: List[Tuple[str, TocEntries, int]],
+                     output_path: str,
+                     toc: bool,
+                     tmp_dir: str) -> None:
+        """Concatenate rendered parts, adding a table of contents and bookmarks."""
+        entries = []
+        offset = 0
+        for _, part_entries, page_count in parts:
+            entries.extend((label, offset + page) for label, page in part_entries)
+            offset += page_count
+
+        toc_pages = 0
+        if toc and entries:
+            toc_path = os.path.join(tmp_dir, 'toc.pdf')
+            # The TOC shifts every page number by its own length; re-render
+            # until the page count settles.
+            while True:
+                rendered = self._render_toc(entries, toc_pages, toc_path)
+                if rendered == toc_pages:
+                    break
+                toc_pages = rendered
+            parts = [(toc_path, [], toc_pages)] + parts
+
+        writer = PdfWriter()
+        for path, _, _ in parts:
+            writer.append(path, import_outline=False)
+        if toc_pages:
+            writer.add_outline_item('Contents', 0)
+        for label, page in entries:
+            writer.add_outline_item(label, toc_pages + page - 1)
+        with open(output_path, 'wb') as output_file:
+            writer.write(output_file)
+
+    def _render_toc(self, entries: TocEntries, page_offset: int, path: str) -> int:
+        """Render the table of contents to `path` and return its page count."""
+        doc = SimpleDocTemplate(path, pagesize=letter, rightMargin=30, leftMargin=30)
+        rows = [[Paragraph(escape(label), self.styles['body']), str(page + page_offset)]
+                for label, page in entries]
+        table = LongTable(rows, colWidths=[doc.width - 50, 50])
+        table.setStyle(TableStyle([
+            ('FONTNAME', (0, 0), (-1, -1), FONT_NAME),
+            ('ALIGN', (1, 0), (1, -1), 'RIGHT'),
+            ('VALIGN', (0, 0), (-1, -1), 'TOP'),
+        ]))
+        doc.build([Paragraph('Contents', self.styles['title']), Spacer(1, 12), table])
+        return len(PdfReader(path).pages)
+
     def _format_article(self, item: ArticleDetails) -> List:
         """Format a single article for PDF export."""
-        elements = []
-        
+        elements = [_ArticleMarker(item.get('title') or f"PMID {item.get('pmid', 'unknown')}")]
+
         # Add title
         if title := item.get('title'):
             safe_title = self._sanitize_text(title)
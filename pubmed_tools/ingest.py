@@ -0,0 +1,217 @@
+"""
+Bulk ingestion of local PubMed baseline and update files.
+
+NCBI publishes the whole of PubMed as gzipped XML dumps
+(`pubmed25n0001.xml.gz`, ...): yearly baseline files plus daily update
+files. The update files also carry `<DeleteCitation>` blocks listing
+PMIDs that were withdrawn. `BulkIngest` reads these files directly, with no
+E-utilities calls.
+
+- Each file is streamed record by record (gzip is decompressed on the fly),
+  so memory is bounded by the articles of one file, not the whole dump.
+- Files are parsed in parallel worker processes with `ArticleParser`.
+  Results are applied in file-name order, so updates and deletions in later
+  files win over earlier ones.
+- Articles go to an `ArticleStore`, an `ArticleIndex` and/or an exporter
+  that supports appending. Deleted PMIDs are removed from the store and
+  the index.
+- A JSON checkpoint records every file once its results are written, so an
+  interrupted run resumes with the first unfinished file.
+
+Example:
+    from pubmed_tools.ingest import BulkIngest
+    from pubmed_tools.storage import ArticleStore
+
+    with ArticleStore('pubmed.sqlite') as store:
+        ingest = BulkIngest('ingest_checkpoint.json', workers=8)
+        print(ingest.run('/data/pubmed/baseline', store=store))
+"""
+
+import glob
+import logging
+import os
+import xml.etree.ElementTree as ET
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Tuple, Union
+
+import xmltodict
+
+from .core.models import ArticleDetails
+from .jsonfile import load_json, write_json_atomic
+from .parsers.article import ArticleParser
+from .parsers.stream import iter_record_bytes
+
+if TYPE_CHECKING:
+    from .exporters.base import BaseExporter
+    from .storage.article_store import ArticleStore
+    from .storage.search_index import ArticleIndex
+
+logger = logging.getLogger(__name__)
+
+DUMP_PATTERN = 'pubmed*.xml.gz'
+
+_RECORD_TAGS = ('PubmedArticle', 'DeleteCitation')
+
+# (articles, raw records or None, deleted PMIDs, records that failed to parse)
+FileResult = Tuple[List[ArticleDetails], Optional[List[dict]], List[str], int]
+
+
+def find_dump_files(source: Union[str, Iterable[str]],
+                    pattern: str = DUMP_PATTERN) -> List[str]:
+    """Return dump files in name order from a directory, a glob pattern or a list of paths."""
+    if isinstance(source, str):
+        if os.path.isdir(source):
+            source = glob.glob(os.path.join(source, pattern))
+        else:
+            source = glob.glob(source) or [source]
+    return sorted(source, key=os.path.basename)
+
+
+def parse_dump_file(path: str, keep_raw: bool = False,
+                    convert_date: bool = False) -> FileResult:
+    """Parse one baseline/update file.
+
+    Args:
+        path: XML file, gzipped if its name ends in '.gz'
+        keep_raw: Also return each article's xmltodict record (needed by `ArticleStore`)
+        convert_date: If True, publication dates are YYYY-MM-DD strings
+
+    Returns:
+        The parsed articles, their raw records (None unless `keep_raw`), the
+        PMIDs of `DeleteCitation` entries and the number of records skipped
+        because they failed to parse
+    """
+    articles: List[ArticleDetails] = []
+    raw: Optional[List[dict]] = [] if keep_raw else None
+    deleted: List[str] = []
+    failed = 0
+    for record in iter_record_bytes(path, _RECORD_TAGS):
+        try:
+            if record.startswith(b'<DeleteCitation'):
+                deleted.extend(pmid.text.strip() for pmid in ET.fromstring(record).iter('PMID')
+                               if pmid.text)
+                continue
+            if keep_raw:
+                parsed = xmltodict.parse(record)['PubmedArticle']
+                article = ArticleParser.parse_article_details(parsed, convert_date)
+            else:
+                parsed = None
+                article = ArticleParser.parse_article_element(ET.fromstring(record), convert_date)
+        except Exception as e:
+            logger.warning("Skipping record in %s that failed to parse: %s", path, e)
+            failed += 1
+            continue
+        if article is not None:
+            articles.append(article)
+            if raw is not None:
+                raw.append(parsed)
+    return articles, raw, deleted, failed
+
+
+class BulkIngest:
+    def __init__(self,
+                 checkpoint_path: str,
+                 workers: Optional[int] = None,
+                 convert_date: bool = False) -> None:
+        """Create an ingestion run.
+
+        Args:
+            checkpoint_path: JSON file recording the files already ingested
+            workers: Number of parsing processes (defaults to the CPU count);
+                     1 parses in the current process
+            convert_date: If True, publication dates are YYYY-MM-DD strings
+        """
+        self.checkpoint_path = checkpoint_path
+        self.workers = workers if workers is not None else (os.cpu_count() or 1)
+        self.convert_date = convert_date
+        self._checkpoint = load_json(checkpoint_path)
+
+    def completed(self) -> Dict[str, Dict[str, Any]]:
+        """Return the checkpoint entries of the files ingested so far, keyed by file name."""
+        return dict(self._checkpoint)
+
+    def _is_done(self, path: str) -> bool:
+        entry = self._checkpoint.get(os.path.basename(path))
+        return entry is not None and entry.get('size') == os.path.getsize(path)
+
+    def run(self,
+            source: Union[str, Iterable[str]],
+            store: Optional['ArticleStore'] = None,
+            index: Optional['ArticleIndex'] = None,
+            exporter: Optional['BaseExporter'] = None,
+            filename: Optional[str] = None) -> Dict[str, int]:
+        """Ingest every dump file not yet recorded in the checkpoint.
+
+        Args:
+            source: Directory (matched against `DUMP_PATTERN`), glob pattern or list of files
+            store: Optional `ArticleStore` receiving raw records and parsed details
+            index: Optional `ArticleIndex` receiving parsed articles
+            exporter: Optional exporter to append parsed articles to; it must
+                      support appending (e.g. `CSVExporter`)
+            filename: Output file for `exporter`
+
+        Returns:
+            Counts of files ingested and skipped, articles written, deleted
+            PMIDs and records that failed to parse
+        """
+        if exporter is not None and not exporter.supports_append:
+            raise ValueError(f"{type(exporter).__name__} cannot append to existing exports")
+        if exporter is not None and filename is None:
+            raise ValueError("filename is required when an exporter is given")
+
+        files = find_dump_files(source)
+        pending = [path for path in files if not self._is_done(path)]
+        summary = {'files': 0, 'skipped': len(files) - len(pending),
+                   'articles': 0, 'deleted': 0, 'failed': 0}
+        keep_raw = store is not None
+        for path, result in self._parse_in_order(pending, keep_raw):
+            articles, raw, deleted, failed = result
+            if store is not None:
+                store.put_records(raw)
+                store.delete(deleted)
+            if index is not None:
+                index.add(articles)
+                index.remove(deleted)
+            if exporter is not None and articles:
+                exporter.export(articles, filename, append=True)
+
+            self._checkpoint[os.path.basename(path)] = {
+                'size': os.path.getsize(path),
+                'articles': len(articles),
+                'deleted': len(deleted),
+                'failed': failed,
+            }
+            write_json_atomic(self.checkpoint_path, self._checkpoint)
+            summary['files'] += 1
+            summary['articles'] += len(articles)
+            summary['deleted'] += len(deleted)
+            summary['failed'] += failed
+            logger.info("Ingested %s: %d articles, %d deletions",
+                        os.path.basename(path), len(articles), len(deleted))
+        return summary
+
+    def _parse_in_order(self, paths: List[str],
+                        keep_raw: bool) -> Iterable[Tuple[str, FileResult]]:
+        """Yield (path, result) in the order of `paths`, parsing ahead on the process pool."""
+        if self.workers <= 1 or len(paths) <= 1:
+            for path in paths:
+                yield path, parse_dump_file(path, keep_raw, self.convert_date)
+            return
+        with ProcessPoolExecutor(max_workers=self.workers) as executor:
+            # Keep a bounded number of parsed files waiting to be written.
+            in_flight = deque()
+            remaining = iter(paths)
+            for path in remaining:
+                in_flight.append((path, executor.submit(
+                    parse_dump_file, path, keep_raw, self.convert_date)))
+                if len(in_flight) >= self.workers:
+                    break
+            while in_flight:
+                path, future = in_flight.popleft()
+                result = future.result()
+                next_path = next(remaining, None)
+                if next_path is not None:
+                    in_flight.append((next_path, executor.submit(
+                        parse_dump_file, next_path, keep_raw, self.convert_date)))
+                yield path, result
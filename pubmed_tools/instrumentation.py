@@ -0,0 +1,296 @@
+"""
+Pluggable instrumentation for the client, parsers and exporters.
+
+The package reports where time goes through three kinds of events:
+
+- spans, which time one operation and carry attributes (an E-utilities
+  request, decoding a response, a parse, an export);
+- counters, which add up values (requests, bytes downloaded, retries,
+  articles parsed, parse failures);
+- histograms, which record one measurement per event (time spent waiting
+  for the rate limiter, articles parsed per second).
+
+Nothing is reported until an `Instrumentation` is installed with
+`set_instrumentation` (or temporarily with `use`). While none is installed,
+every hook returns after checking a single module global, so the cost on the
+hot paths is negligible. Hooks fire per request, per parse call and per
+export, never per article.
+
+Events emitted by the package:
+
+    span       client.request             eutil, method, status, bytes, retries
+    span       client.decode              eutil, articles
+    span       parser.parse               method, articles, failures
+    span       exporter.export            exporter, filename, error
+    span       exporter.pdf.build         articles
+    counter    client.requests            eutil, status
+    counter    client.bytes               eutil
+    counter    client.retries             eutil
+    counter    parser.articles            method
+    counter    parser.failures            method
+    histogram  client.throttle_seconds    eutil
+    histogram  parser.articles_per_second method
+
+Streamed efetch responses (`PubMedClient.iter_details`) count bytes as the
+body is read, so their `client.request` span ends when the headers arrive.
+Work done in worker processes (parallel parsing, chunked PDF rendering) is
+reported by the parent call that waits for it.
+
+Example:
+    from pubmed_tools import instrumentation
+
+    recorder = instrumentation.MetricsRecorder()
+    with instrumentation.use(recorder):
+        articles = ArticleParser.parse_all_details(client.search_and_fetch("cancer"))
+    print(recorder.snapshot()['histograms']['client.request'])
+
+To forward events to OpenTelemetry, Prometheus or a log, subclass
+`Instrumentation` or pass callbacks to `CallbackInstrumentation`.
+"""
+
+import math
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Any, Callable, Deque, Dict, Iterator, Optional, Sequence
+
+Attributes = Dict[str, Any]
+
+# Samples kept per histogram by `MetricsRecorder` for percentiles.
+DEFAULT_MAX_SAMPLES = 10000
+
+
+class Span:
+    """One timed operation; attributes can be added while it is open."""
+
+    __slots__ = ('name', 'attributes', 'start', 'seconds', '_hooks')
+
+    def __init__(self, hooks: 'Instrumentation', name: str, attributes: Attributes) -> None:
+        self.name = name
+        self.attributes = attributes
+        self.start = 0.0
+        self.seconds: Optional[float] = None
+        self._hooks = hooks
+
+    @property
+    def recording(self) -> bool:
+        return True
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        self.attributes[key] = value
+
+    def __enter__(self) -> 'Span':
+        self._hooks.span_started(self)
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.seconds = time.perf_counter() - self.start
+        if exc_type is not None:
+            self.attributes['error'] = exc_type.__name__
+        self._hooks.span_ended(self)
+
+
+class _NoopSpan:
+    """Shared stand-in returned by `span` while instrumentation is disabled."""
+
+    __slots__ = ()
+    name = ''
+    attributes: Attributes = {}
+    seconds = None
+    recording = False
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        pass
+
+    def __enter__(self) -> '_NoopSpan':
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        pass
+
+
+_NOOP_SPAN = _NoopSpan()
+
+
+class Instrumentation:
+    """Receiver of instrumentation events; every hook does nothing by default.
+
+    Hooks may be called from several threads at once.
+    """
+
+    def span_started(self, span: Span) -> None:
+        """Called when a span opens (before its clock starts)."""
+
+    def span_ended(self, span: Span) -> None:
+        """Called when a span closes; `span.seconds` holds its duration."""
+
+    def add(self, name: str, value: float, attributes: Attributes) -> None:
+        """Called when counter `name` increases by `value`."""
+
+    def record(self, name: str, value: float, attributes: Attributes) -> None:
+        """Called with one measurement for histogram `name`."""
+
+
+class CallbackInstrumentation(Instrumentation):
+    def __init__(self,
+                 on_span: Optional[Callable[[Span], None]] = None,
+                 on_counter: Optional[Callable[[str, float, Attributes], None]] = None,
+                 on_histogram: Optional[Callable[[str, float, Attributes], None]] = None) -> None:
+        """Forward ended spans, counter increments and histogram values to callbacks.
+
+        Args:
+            on_span: Called with each ended `Span`
+            on_counter: Called with (name, value, attributes) for counters
+            on_histogram: Called with (name, value, attributes) for histograms
+        """
+        self.on_span = on_span
+        self.on_counter = on_counter
+        self.on_histogram = on_histogram
+
+    def span_ended(self, span: Span) -> None:
+        if self.on_span is not None:
+            self.on_span(span)
+
+    def add(self, name: str, value: float, attributes: Attributes) -> None:
+        if self.on_counter is not None:
+            self.on_counter(name, value, attributes)
+
+    def record(self, name: str, value: float, attributes: Attributes) -> None:
+        if self.on_histogram is not None:
+            self.on_histogram(name, value, attributes)
+
+
+def percentile(sorted_values: Sequence[float], fraction: float) -> float:
+    """Return the nearest-rank percentile (`fraction` in [0, 1]) of sorted values."""
+    if not sorted_values:
+        return 0.0
+    rank = max(0, min(len(sorted_values) - 1, math.ceil(fraction * len(sorted_values)) - 1))
+    return sorted_values[rank]
+
+
+class _Histogram:
+    def __init__(self, max_samples: int) -> None:
+        self.count = 0
+        self.total = 0.0
+        self.min = float('inf')
+        self.max = float('-inf')
+        self.samples: Deque[float] = deque(maxlen=max_samples)
+
+    def add(self, value: float) -> None:
+        self.count += 1
+        self.total += value
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+        self.samples.append(value)
+
+    def summary(self) -> Dict[str, float]:
+        ordered = sorted(self.samples)
+        return {'count': self.count,
+                'sum': self.total,
+                'min': self.min,
+                'max': self.max,
+                'mean': self.total / self.count,
+                'p50': percentile(ordered, 0.50),
+                'p95': percentile(ordered, 0.95),
+                'p99': percentile(ordered, 0.99)}
+
+
+class MetricsRecorder(Instrumentation):
+    def __init__(self, max_samples: int = DEFAULT_MAX_SAMPLES) -> None:
+        """Aggregate events in memory, by name.
+
+        Counters are summed. Histogram values and span durations (in seconds,
+        under the span's name) are summarized; percentiles are computed over
+        the most recent `max_samples` values. Attributes are not aggregated.
+        """
+        self.max_samples = max_samples
+        self._lock = threading.Lock()
+        self._counters: Dict[str, float] = {}
+        self._histograms: Dict[str, _Histogram] = {}
+
+    def _observe(self, name: str, value: float) -> None:
+        with self._lock:
+            histogram = self._histograms.get(name)
+            if histogram is None:
+                histogram = self._histograms[name] = _Histogram(self.max_samples)
+            histogram.add(value)
+
+    def span_ended(self, span: Span) -> None:
+        self._observe(span.name, span.seconds)
+
+    def add(self, name: str, value: float, attributes: Attributes) -> None:
+        with self._lock:
+            self._counters[name] = self._counters.get(name, 0) + value
+
+    def record(self, name: str, value: float, attributes: Attributes) -> None:
+        self._observe(name, value)
+
+    def counter(self, name: str) -> float:
+        """Return the current value of a counter (0 if it never fired)."""
+        with self._lock:
+            return self._counters.get(name, 0)
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """Return counters and histogram summaries (count, sum, min, max, mean, p50, p95, p99)."""
+        with self._lock:
+            return {'counters': dict(self._counters),
+                    'histograms': {name: histogram.summary()
+                                   for name, histogram in self._histograms.items()}}
+
+    def reset(self) -> None:
+        with self._lock:
+            self._counters.clear()
+            self._histograms.clear()
+
+
+_active: Optional[Instrumentation] = None
+
+
+def set_instrumentation(hooks: Optional[Instrumentation]) -> Optional[Instrumentation]:
+    """Install `hooks` process-wide (None disables instrumentation); return the previous one."""
+    global _active
+    previous, _active = _active, hooks
+    return previous
+
+
+def get_instrumentation() -> Optional[Instrumentation]:
+    return _active
+
+
+@contextmanager
+def use(hooks: Optional[Instrumentation]) -> Iterator[Optional[Instrumentation]]:
+    """Install `hooks` for the duration of a `with` block."""
+    previous = set_instrumentation(hooks)
+    try:
+        yield hooks
+    finally:
+        set_instrumentation(previous)
+
+
+def enabled() -> bool:
+    return _active is not None
+
+
+def span(name: str, **attributes: Any):
+    """Return a context manager timing one operation (a shared no-op while disabled)."""
+    hooks = _active
+    if hooks is None:
+        return _NOOP_SPAN
+    return Span(hooks, name, attributes)
+
+
+def add(name: str, value: float = 1, **attributes: Any) -> None:
+    """Increase counter `name` by `value`."""
+    hooks = _active
+    if hooks is not None:
+        hooks.add(name, value, attributes)
+
+
+def record(name: str, value: float, **attributes: Any) -> None:
+    """Record one measurement for histogram `name`."""
+    hooks = _active
+    if hooks is not None:
+        hooks.record(name, value, attributes)
+
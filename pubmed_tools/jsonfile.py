@@ -0,0 +1,29 @@
+"""
+JSON state files shared by incremental sync and bulk ingestion.
+
+`IncrementalSync` keeps its per-query state and `BulkIngest` its checkpoint in
+small JSON files that are rewritten after every step, so writes go through
+a temporary file and an atomic rename.
+"""
+
+import json
+import os
+import tempfile
+from typing import Any, Dict
+
+
+def load_json(path: str) -> Dict[str, Any]:
+    """Load a JSON state file, or return an empty dict if it does not exist yet."""
+    if not os.path.exists(path):
+        return {}
+    with open(path, encoding='utf-8') as f:
+        return json.load(f)
+
+
+def write_json_atomic(path: str, data: Any) -> None:
+    """Write a JSON file atomically so an interrupted run cannot corrupt it."""
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+    with os.fdopen(fd, 'w', encoding='utf-8') as f:
+        json.dump(data, f, indent=2, sort_keys=True)
+    os.replace(tmp_path, path)
@@ -1,4 +1,6 @@
 from .article import ArticleParser
 from .date import convert_publication_date
+from .stream import iter_pubmed_articles, iter_record_bytes, iter_record_elements
 
-__all__ = ['ArticleParser', 'convert_publication_date']
+__all__ = ['ArticleParser', 'convert_publication_date',
+           'iter_pubmed_articles', 'iter_record_bytes', 'iter_record_elements']
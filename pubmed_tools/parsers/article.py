@@ -1,6 +1,14 @@
-from typing import List, Optional
+import logging
+import xml.etree.ElementTree as ET
+from typing import Iterator, List, Optional, Union
+from ..core.batch import ArticleBatch
 from ..core.models import ArticleDetails
 from .date import convert_publication_date
+from .element import _parse_span, iter_article_details, parse_article_element, parse_batch
+from .parallel import DEFAULT_CHUNK_SIZE, parse_records_parallel, parse_xml_parallel
+from .stream import XMLSource
+
+logger = logging.getLogger(__name__)
 
 
 class ArticleParser:
@@ -16,7 +24,7 @@ class ArticleParser:
 
         parsed_authors = []
         for author in authors:
-            author_info = f"{author.get('ForeName', '')} {author.get('LastName', '')}".strip(
+            author_info = f"{author.get('ForeName') or ''} {author.get('LastName') or ''}".strip(
             )
             parsed_authors.append(author_info)
 
@@ -39,7 +47,7 @@ class ArticleParser:
                 content = text.get('#text', '')
                 sections.append(f"{label}: {content}" if label else content)
             else:
-                sections.append(str(text))
+                sections.append('' if text is None else str(text))
 
         return ' '.join(sections)
 
@@ -48,6 +56,8 @@ class ArticleParser:
         """Parse text with formatting elements (italics, bold, etc) into plain text."""
         if isinstance(text_data, str):
             return text_data
+        if text_data is None:
+            return ''
         if not isinstance(text_data, dict):
             return str(text_data)
 
@@ -60,6 +70,8 @@ class ArticleParser:
                 # Handle both string and list cases
                 if isinstance(formatted_text, list):
                     formatted_text = ' '.join(str(item) for item in formatted_text)
+                elif formatted_text is None:
+                    formatted_text = ''
                 elif not isinstance(formatted_text, str):
                     formatted_text = str(formatted_text)
                 
@@ -99,6 +111,19 @@ class ArticleParser:
             'pmid': pmid
         }
 
+    @staticmethod
+    def parse_article_element(
+            elem: ET.Element,
+            convert_date: bool = False) -> Optional[ArticleDetails]:
+        """Parse a PubmedArticle XML element directly, without an xmltodict tree."""
+        return parse_article_element(elem, convert_date)
+
+    @staticmethod
+    def parse_xml(source: XMLSource,
+                  convert_date: bool = False) -> Iterator[ArticleDetails]:
+        """Stream-parse an efetch payload (bytes, path or file) into articles."""
+        return iter_article_details(source, convert_date)
+
     @staticmethod
     def _extract_publication_date(article: dict) -> dict:
         """Extract publication date from article data."""
@@ -111,9 +136,9 @@ class ArticleParser:
         for source in date_sources:
             if source:
                 pub_date = {
-                    'year': source.get('Year', ''),
-                    'month': source.get('Month', ''),
-                    'day': source.get('Day', '')
+                    'year': source.get('Year') or '',
+                    'month': source.get('Month') or '',
+                    'day': source.get('Day') or ''
                 }
                 if any(pub_date.values()):
                     return pub_date
@@ -121,7 +146,65 @@ class ArticleParser:
         return {'year': '', 'month': '', 'day': ''}
 
     @classmethod
-    def parse_all_details(cls, details: List[dict]) -> List[ArticleDetails]:
-        """Parse all articles in the details list."""
-        return [cls.parse_article_details(detail)
-                for detail in details if detail]
+    def parse_all_details(cls,
+                          details: List[dict],
+                          workers: int = 1,
+                          chunk_size: int = DEFAULT_CHUNK_SIZE,
+                          convert_date: bool = False) -> List[ArticleDetails]:
+        """Parse all articles in the details list.
+
+        Records that fail to parse are logged and skipped, and records that
+        are not journal articles are dropped; the rest keep their order.
+        With `workers` > 1, records are parsed on a process pool in chunks of
+        `chunk_size`, with the same result.
+        """
+        if workers > 1:
+            return parse_records_parallel(details, workers, chunk_size, convert_date)
+        parsed = []
+        failures = 0
+        with _parse_span('parse_all_details') as span:
+            for detail in details:
+                if not detail:
+                    continue
+                try:
+                    article = cls.parse_article_details(detail, convert_date)
+                except Exception as e:
+                    logger.warning("Skipping record that failed to parse: %s", e)
+                    article = None
+                if article is None:
+                    failures += 1
+                else:
+                    parsed.append(article)
+            span.set_attribute('articles', len(parsed))
+            span.set_attribute('failures', failures)
+        return parsed
+
+    @classmethod
+    def parse_batch(cls, details: List[dict], convert_date: bool = False) -> ArticleBatch:
+        """Parse xmltodict records into a columnar `ArticleBatch`."""
+        batch = ArticleBatch()
+        failures = 0
+        with _parse_span('parse_batch') as span:
+            for detail in details:
+                if detail:
+                    article = cls.parse_article_details(detail, convert_date)
+                    if article is None:
+                        failures += 1
+                    else:
+                        batch.append(article)
+            span.set_attribute('articles', len(batch))
+            span.set_attribute('failures', failures)
+        return batch
+
+    @staticmethod
+    def parse_xml_batch(source: XMLSource, convert_date: bool = False) -> ArticleBatch:
+        """Stream-parse an efetch payload directly into a columnar `ArticleBatch`."""
+        return parse_batch(source, convert_date)
+
+    @staticmethod
+    def parse_xml_parallel(source: Union[bytes, str],
+                           workers: Optional[int] = None,
+                           chunk_size: int = DEFAULT_CHUNK_SIZE,
+                           convert_date: bool = False) -> List[ArticleDetails]:
+        """Parse XML bytes or an XML file on a process pool, sending workers byte ranges."""
+        return parse_xml_parallel(source, workers, chunk_size, convert_date)
@@ -0,0 +1,224 @@
+"""
+Direct ElementTree-to-ArticleDetails parsing.
+
+`ArticleParser.parse_article_details` works on `xmltodict` output, which
+means building a generic dictionary tree first and then resolving its
+dict/list/str ambiguity at every level. The functions here read the
+PubmedArticle element tree directly and produce identical `ArticleDetails`,
+skipping the intermediate tree entirely. Combined with
+`parsers.stream.iter_record_elements`, a payload goes from bytes to parsed
+articles one record at a time.
+
+Example:
+    from pubmed_tools.parsers.element import iter_article_details
+
+    with open('pubmed_result.xml', 'rb') as f:
+        for article in iter_article_details(f):
+            print(article['pmid'], article['title'])
+"""
+
+import xml.etree.ElementTree as ET
+from contextlib import contextmanager
+from typing import Any, Iterator, List, Optional, Tuple
+
+from .. import instrumentation
+from ..core.batch import ArticleBatch
+from ..core.models import ArticleDetails
+from .date import convert_publication_date
+from .stream import XMLSource, element_to_dict, iter_record_elements
+
+# Inline formatting tags folded into titles, in the order ArticleParser applies them.
+FORMAT_TAGS = ('i', 'b', 'sup', 'sub')
+
+# Publication date sources relative to <Article>, in order of preference.
+DATE_PATHS = ('ArticleDate', 'Journal/JournalIssue/PubDate', 'DateCompleted')
+
+
+@contextmanager
+def _parse_span(method: str) -> Iterator[Any]:
+    """Time one parse call; the caller sets the span's `articles` and `failures`."""
+    with instrumentation.span('parser.parse', method=method) as span:
+        yield span
+    if span.recording:
+        _count_parsed(method, span.attributes.get('articles', 0),
+                      span.attributes.get('failures', 0), span.seconds)
+
+
+def _count_parsed(method: str, articles: int, failures: int,
+                  seconds: Optional[float] = None) -> None:
+    instrumentation.add('parser.articles', articles, method=method)
+    instrumentation.add('parser.failures', failures, method=method)
+    if seconds:
+        instrumentation.record('parser.articles_per_second', articles / seconds, method=method)
+
+
+def _text(elem: ET.Element) -> str:
+    """Return an element's own character data the way xmltodict collects it."""
+    if len(elem) == 0:
+        return (elem.text or '').strip()
+    parts = [elem.text or '']
+    parts.extend(child.tail or '' for child in elem)
+    return ''.join(parts).strip()
+
+
+def _child_text(parent: ET.Element, tag: str) -> str:
+    child = parent.find(tag)
+    return '' if child is None else _text(child)
+
+
+def _value(elem: ET.Element) -> Any:
+    """Return the value xmltodict would produce for an element."""
+    if len(elem) == 0 and not elem.attrib:
+        return (elem.text or '').strip() or None
+    return element_to_dict(elem)
+
+
+def _formatted_text(elem: ET.Element) -> str:
+    main_text = _text(elem)
+    if len(elem) == 0:
+        return main_text
+    for tag in FORMAT_TAGS:
+        children = elem.findall(tag)
+        if not children:
+            continue
+        if len(children) > 1:
+            formatted_text = ' '.join(str(_value(child)) for child in children)
+        else:
+            value = _value(children[0])
+            formatted_text = '' if value is None else str(value)
+        if main_text.startswith(' '):
+            main_text = formatted_text + main_text
+        else:
+            main_text = formatted_text + ' ' + main_text
+    return main_text.strip()
+
+
+def _abstract(article: ET.Element) -> str:
+    abstract = article.find('Abstract')
+    if abstract is None:
+        return ''
+    sections = []
+    for text in abstract.iterfind('AbstractText'):
+        if text.attrib or len(text):
+            label = text.get('Label') or ''
+            content = _text(text)
+            sections.append(f"{label}: {content}" if label else content)
+        else:
+            sections.append(_text(text))
+    return ' '.join(sections)
+
+
+def _authors(article: ET.Element) -> List[str]:
+    author_list = article.find('AuthorList')
+    if author_list is None:
+        return []
+    return [
+        f"{_child_text(author, 'ForeName')} {_child_text(author, 'LastName')}".strip()
+        for author in author_list.iterfind('Author')
+    ]
+
+
+def _publication_date(article: ET.Element) -> dict:
+    for path in DATE_PATHS:
+        source = article.find(path)
+        if source is None:
+            continue
+        pub_date = {
+            'year': _child_text(source, 'Year'),
+            'month': _child_text(source, 'Month'),
+            'day': _child_text(source, 'Day')
+        }
+        if any(pub_date.values()):
+            return pub_date
+    return {'year': '', 'month': '', 'day': ''}
+
+
+def article_fields(elem: ET.Element,
+                   convert_date: bool = False) -> Optional[Tuple[str, str, List[str], Any, str]]:
+    """Extract (title, abstract, authors, publication_date, pmid) from a PubmedArticle element.
+
+    Returns None for records without a MedlineCitation.
+    """
+    citation = elem.find('MedlineCitation')
+    if citation is None:
+        return None
+
+    pmid = _child_text(citation, 'PMID')
+    article = citation.find('Article')
+    if article is None:
+        pub_date = {'year': '', 'month': '', 'day': ''}
+        title, abstract, authors = '', '', []
+    else:
+        pub_date = _publication_date(article)
+        title_elem = article.find('ArticleTitle')
+        title = '' if title_elem is None else _formatted_text(title_elem)
+        abstract = _abstract(article)
+        authors = _authors(article)
+    if convert_date:
+        pub_date = convert_publication_date(pub_date)
+    return title, abstract, authors, pub_date, pmid
+
+
+def parse_article_element(elem: ET.Element,
+                          convert_date: bool = False) -> Optional[ArticleDetails]:
+    """Parse a PubmedArticle element into `ArticleDetails`.
+
+    Produces the same result as `ArticleParser.parse_article_details` on the
+    xmltodict form of the same element.
+    """
+    fields = article_fields(elem, convert_date)
+    if fields is None:
+        return None
+    title, abstract, authors, pub_date, pmid = fields
+    return {
+        'title': title,
+        'abstract': abstract,
+        'authors': authors,
+        'publication_date': pub_date,
+        'pmid': pmid
+    }
+
+
+def iter_article_details(source: XMLSource,
+                         convert_date: bool = False) -> Iterator[ArticleDetails]:
+    """Stream-parse an efetch payload straight into `ArticleDetails`.
+
+    Args:
+        source: XML as bytes, a file path (optionally .gz), a binary file
+                object or an iterable of byte chunks
+        convert_date: If True, publication dates are YYYY-MM-DD strings
+
+    Yields:
+        Parsed articles in document order; records without a
+        MedlineCitation are skipped
+    """
+    # The caller's time between articles is not the parser's, so only counts
+    # are reported here.
+    articles = failures = 0
+    try:
+        for elem in iter_record_elements(source):
+            parsed = parse_article_element(elem, convert_date)
+            if parsed is None:
+                failures += 1
+                continue
+            articles += 1
+            yield parsed
+    finally:
+        if instrumentation.enabled():
+            _count_parsed('parse_xml', articles, failures)
+
+
+def parse_batch(source: XMLSource, convert_date: bool = False) -> ArticleBatch:
+    """Stream-parse an efetch payload straight into a columnar `ArticleBatch`."""
+    batch = ArticleBatch()
+    failures = 0
+    with _parse_span('parse_xml_batch') as span:
+        for elem in iter_record_elements(source):
+            fields = article_fields(elem, convert_date)
+            if fields is None:
+                failures += 1
+                continue
+            batch.append_fields(*fields)
+        span.set_attribute('articles', len(batch))
+        span.set_attribute('failures', failures)
+    return batch
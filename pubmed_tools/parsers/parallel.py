@@ -0,0 +1,130 @@
+"""
+Multi-process article parsing.
+
+Parsing is CPU-bound, so a single process only uses one core. The helpers
+here shard records across a `ProcessPoolExecutor` while keeping input order.
+
+For XML input, workers receive byte ranges rather than parsed objects: a
+file is addressed by (path, start, end) and memory-mapped by each worker,
+and an in-memory payload is sent as raw byte slices. Only the compact
+parsed `ArticleDetails` travel back, so pickling stays cheap.
+
+Both entry points share one contract with the serial
+`ArticleParser.parse_all_details`: records that fail to parse are logged and
+skipped instead of aborting the whole run, records that are not journal
+articles are dropped, and the remaining articles come back in input order.
+
+Example:
+    from pubmed_tools.parsers.article import ArticleParser
+
+    articles = ArticleParser.parse_xml_parallel('pubmed_dump.xml', workers=8)
+"""
+
+import logging
+import mmap
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Optional, Sequence, Tuple, Union
+import xml.etree.ElementTree as ET
+
+from ..core.models import ArticleDetails
+from .element import _parse_span, parse_article_element
+from .stream import find_record_spans, iter_record_bytes
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CHUNK_SIZE = 500
+
+
+def _parse_record_chunk(chunk: Sequence[dict], convert_date: bool) -> List[ArticleDetails]:
+    """Worker: parse xmltodict records with the serial `ArticleParser.parse_all_details`."""
+    # Imported here to avoid a circular import with parsers.article.
+    from .article import ArticleParser
+
+    return ArticleParser.parse_all_details(chunk, convert_date=convert_date)
+
+
+def _parse_xml_records(data: Union[bytes, memoryview], convert_date: bool) -> List[ArticleDetails]:
+    parsed = []
+    for record in iter_record_bytes(bytes(data)):
+        try:
+            article = parse_article_element(ET.fromstring(record), convert_date)
+        except Exception as e:
+            logger.warning("Skipping record that failed to parse: %s", e)
+            continue
+        if article is not None:
+            parsed.append(article)
+    return parsed
+
+
+def _parse_file_range(path: str, start: int, end: int,
+                      convert_date: bool) -> List[ArticleDetails]:
+    """Worker: memory-map `path` and parse the records in [start, end)."""
+    with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+        return _parse_xml_records(mapped[start:end], convert_date)
+
+
+def _chunk_ranges(spans: List[Tuple[int, int]], chunk_size: int) -> List[Tuple[int, int]]:
+    """Group record spans into contiguous byte ranges of `chunk_size` records."""
+    return [(spans[i][0], spans[min(i + chunk_size, len(spans)) - 1][1])
+            for i in range(0, len(spans), chunk_size)]
+
+
+def parse_records_parallel(details: Sequence[dict],
+                           workers: Optional[int] = None,
+                           chunk_size: int = DEFAULT_CHUNK_SIZE,
+                           convert_date: bool = False) -> List[ArticleDetails]:
+    """Parse xmltodict records on a process pool, preserving order.
+
+    Returns the same list as the serial `ArticleParser.parse_all_details`;
+    failing records are skipped. Prefer `parse_xml_parallel` when the raw
+    XML is available; dict records have to be pickled to reach the workers.
+    """
+    chunks = [details[i:i + chunk_size] for i in range(0, len(details), chunk_size)]
+    with _parse_span('parse_records_parallel') as span, \
+            ProcessPoolExecutor(max_workers=workers) as executor:
+        results = executor.map(_parse_record_chunk, chunks, [convert_date] * len(chunks))
+        parsed = [article for chunk in results for article in chunk]
+        if span.recording:
+            span.set_attribute('articles', len(parsed))
+            span.set_attribute('failures', sum(1 for detail in details if detail) - len(parsed))
+    return parsed
+
+
+def parse_xml_parallel(source: Union[bytes, str],
+                       workers: Optional[int] = None,
+                       chunk_size: int = DEFAULT_CHUNK_SIZE,
+                       convert_date: bool = False) -> List[ArticleDetails]:
+    """Parse an efetch payload or uncompressed XML file on a process pool.
+
+    Args:
+        source: XML bytes, or a path to an uncompressed XML file
+        workers: Number of worker processes (defaults to the CPU count)
+        chunk_size: Number of records handed to a worker at a time
+        convert_date: If True, publication dates are YYYY-MM-DD strings
+
+    Returns:
+        Parsed articles in document order; failing records are skipped
+    """
+    chunk_size = max(1, chunk_size)
+    with _parse_span('parse_xml_parallel') as span:
+        if isinstance(source, str):
+            if os.path.getsize(source) == 0:
+                return []
+            with open(source, 'rb') as f, \
+                    mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                records = find_record_spans(mapped)
+            tasks = [(_parse_file_range, (source, start, end, convert_date))
+                     for start, end in _chunk_ranges(records, chunk_size)]
+        else:
+            records = find_record_spans(source)
+            tasks = [(_parse_xml_records, (source[start:end], convert_date))
+                     for start, end in _chunk_ranges(records, chunk_size)]
+        if not tasks:
+            return []
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = [executor.submit(func, *args) for func, args in tasks]
+            parsed = [article for future in futures for article in future.result()]
+        span.set_attribute('articles', len(parsed))
+        span.set_attribute('failures', len(records) - len(parsed))
+    return parsed
@@ -0,0 +1,188 @@
+"""
+Incremental parsing of efetch PubmedArticleSet payloads.
+
+`xmltodict.parse` builds a dictionary tree for the whole response before
+any article can be used. The functions here scan the payload chunk by chunk
+for complete top-level records (`<PubmedArticle>...</PubmedArticle>`) with
+a byte-level regular expression, so peak memory stays at roughly one record
+plus one read chunk and the tokenizer never runs over the whole payload.
+
+What happens to each record depends on the caller:
+
+- `iter_record_bytes` hands out the raw bytes, and `iter_record_elements`
+  parses them with `ET.fromstring`, which builds the element tree in C
+  without Python callbacks. `parsers.element` reads `ArticleDetails`
+  straight from those trees.
+- `iter_pubmed_articles` (used by `PubMedClient.iter_details`) runs
+  `xmltodict.parse` on every record to keep the dict shape `ArticleParser`
+  expects. xmltodict fires a Python callback for every element, so this
+  path bounds memory but costs as much CPU per article as parsing the whole
+  payload with xmltodict.
+
+The scanner stands in for `ET.iterparse` with `elem.clear()`. Both keep
+one record in memory at a time, but `iter_pubmed_articles` needs the
+xmltodict dict shape, and an iterparse element would have to be serialized
+back to bytes before xmltodict could read it. The scanner hands xmltodict
+the record's own bytes. Its byte offsets also let `parsers.parallel` send
+byte ranges to worker processes. The CPU saving comes from the element
+path (`parsers.element`), not from the streaming itself.
+
+Record boundaries are found by tag name, which is safe for PubMed output:
+top-level record tags never nest and cannot appear unescaped in text.
+Payloads are assumed to be UTF-8, as NCBI serves them.
+
+Example:
+    from pubmed_tools.parsers.stream import iter_pubmed_articles
+
+    with open('pubmed_result.xml', 'rb') as f:
+        for article in iter_pubmed_articles(f):
+            print(article['MedlineCitation']['PMID'])
+"""
+
+import gzip
+import io
+import re
+import xml.etree.ElementTree as ET
+from functools import lru_cache
+from typing import Iterable, Iterator, List, Tuple, Union
+
+import xmltodict
+
+CHUNK_SIZE = 64 * 1024
+
+# Top-level records of a PubmedArticleSet that callers usually care about.
+ARTICLE_TAGS = ('PubmedArticle',)
+
+XMLSource = Union[bytes, str, io.IOBase, Iterable[bytes]]
+
+
+def _iter_chunks(source: XMLSource, chunk_size: int = CHUNK_SIZE) -> Iterator[bytes]:
+    """Yield raw byte chunks from bytes, a file path, a binary file or an iterable of chunks."""
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        view = memoryview(source)
+        for start in range(0, len(view), chunk_size):
+            yield bytes(view[start:start + chunk_size])
+    elif isinstance(source, str):
+        opener = gzip.open if source.endswith('.gz') else open
+        with opener(source, 'rb') as f:
+            yield from _iter_chunks(f, chunk_size)
+    elif hasattr(source, 'read'):
+        while True:
+            chunk = source.read(chunk_size)
+            if not chunk:
+                break
+            yield chunk
+    else:
+        yield from source
+
+
+@lru_cache(maxsize=None)
+def _record_pattern(tags: Tuple[str, ...]) -> 're.Pattern[bytes]':
+    names = b'|'.join(re.escape(tag.encode('ascii')) for tag in tags)
+    return re.compile(b'<(' + names + rb')(?=[\s/>])')
+
+
+def _scan_records(buffer: bytes, pattern: 're.Pattern[bytes]', keep: int,
+                  final: bool = False) -> Tuple[List[Tuple[int, int]], int]:
+    """Find complete records in `buffer`.
+
+    Returns:
+        The (start, end) byte offsets of each complete record, and the offset
+        from which the buffer must be kept to resume scanning once more data
+        arrives.
+    """
+    spans = []
+    pos = 0
+    while True:
+        match = pattern.search(buffer, pos)
+        if match is None:
+            return spans, pos if final else max(pos, len(buffer) - keep)
+        start = match.start()
+        open_end = buffer.find(b'>', match.end())
+        if open_end < 0:
+            break
+        if buffer[open_end - 1:open_end] == b'/':
+            end = open_end + 1
+        else:
+            closing = b'</' + match.group(1) + b'>'
+            close = buffer.find(closing, open_end)
+            if close < 0:
+                break
+            end = close + len(closing)
+        spans.append((start, end))
+        pos = end
+    if final:
+        raise ET.ParseError(f"unclosed <{match.group(1).decode()}> record at byte {start}")
+    return spans, start
+
+
+def find_record_spans(data: bytes,
+                      tags: Tuple[str, ...] = ARTICLE_TAGS) -> List[Tuple[int, int]]:
+    """Return the (start, end) byte offsets of every top-level record in `data`."""
+    spans, _ = _scan_records(data, _record_pattern(tuple(tags)), 0, final=True)
+    return spans
+
+
+def iter_record_bytes(source: XMLSource,
+                      tags: Tuple[str, ...] = ARTICLE_TAGS) -> Iterator[bytes]:
+    """Incrementally split a PubmedArticleSet into the raw bytes of its records.
+
+    Args:
+        source: XML as bytes, a file path (optionally .gz), a binary file
+                object or an iterable of byte chunks
+        tags: Top-level element names to yield; other content is skipped
+
+    Yields:
+        One standalone XML document per matching record
+    """
+    tags = tuple(tags)
+    pattern = _record_pattern(tags)
+    keep = max(len(tag) for tag in tags) + 2
+    buffer = b''
+    for chunk in _iter_chunks(source):
+        buffer = buffer + chunk if buffer else bytes(chunk)
+        spans, resume = _scan_records(buffer, pattern, keep)
+        for start, end in spans:
+            yield buffer[start:end]
+        buffer = buffer[resume:]
+    spans, _ = _scan_records(buffer, pattern, keep, final=True)
+    for start, end in spans:
+        yield buffer[start:end]
+
+
+def iter_record_elements(source: XMLSource,
+                         tags: Tuple[str, ...] = ARTICLE_TAGS) -> Iterator[ET.Element]:
+    """Incrementally parse a PubmedArticleSet and yield its top-level records.
+
+    Each yielded element is a standalone tree; nothing else from the
+    payload is retained, so memory stays flat however large the input is.
+
+    Args:
+        source: XML as bytes, a file path (optionally .gz), a binary file
+                object or an iterable of byte chunks
+        tags: Top-level element names to yield; other records are discarded
+
+    Yields:
+        `xml.etree.ElementTree.Element` for each matching record
+    """
+    for record in iter_record_bytes(source, tags):
+        yield ET.fromstring(record)
+
+
+def element_to_dict(elem: ET.Element) -> dict:
+    """Convert a record element into the same dict shape `xmltodict` produces."""
+    return xmltodict.parse(ET.tostring(elem))[elem.tag]
+
+
+def iter_pubmed_articles(source: XMLSource) -> Iterator[dict]:
+    """Stream PubmedArticle records as dicts compatible with `ArticleParser`.
+
+    Args:
+        source: XML as bytes, a file path (optionally .gz), a binary file
+                object or an iterable of byte chunks
+
+    Yields:
+        One article dictionary at a time, in document order
+    """
+    for record in iter_record_bytes(source):
+        yield xmltodict.parse(record)['PubmedArticle']
@@ -0,0 +1,5 @@
+from .article_store import ArticleStore
+from .search_cache import SearchCache, normalize_query
+from .search_index import ArticleIndex
+
+__all__ = ['ArticleStore', 'SearchCache', 'normalize_query', 'ArticleIndex']
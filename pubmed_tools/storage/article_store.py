@@ -0,0 +1,199 @@
+"""
+Persistent on-disk store of fetched PubMed articles.
+
+`ArticleStore` keeps raw efetch records (the dicts `PubMedClient` returns)
+and their parsed `ArticleDetails` in a single SQLite file keyed by PMID.
+`PubMedClient` consults it before the network so that repeated pipelines
+only download the PMIDs they have not seen yet.
+
+Entries expire after an optional TTL, and the store evicts least recently
+used entries once it grows past an optional size budget.
+
+Example:
+    from pubmed_tools.core.client import PubMedClient
+    from pubmed_tools.storage import ArticleStore
+
+    store = ArticleStore('articles.sqlite', ttl=7 * 24 * 3600, max_bytes=2 * 1024**3)
+    client = PubMedClient(article_store=store)
+    articles_raw = client.fetch_details(id_list=['12345', '67890'])
+    print(store.stats())
+"""
+
+import json
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, Iterable, List, Optional
+
+from ..core.client import record_pmid
+from ..core.models import ArticleDetails
+from ..parsers.article import ArticleParser
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS articles (
+    pmid TEXT PRIMARY KEY,
+    raw TEXT NOT NULL,
+    details TEXT,
+    size INTEGER NOT NULL,
+    fetched_at REAL NOT NULL,
+    accessed_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS articles_accessed_at ON articles (accessed_at);
+"""
+
+# SQLite limits the number of bound parameters per statement.
+_MAX_PARAMS = 500
+
+
+class ArticleStore:
+    def __init__(self,
+                 path: str,
+                 ttl: Optional[float] = None,
+                 max_bytes: Optional[int] = None,
+                 max_entries: Optional[int] = None) -> None:
+        """Open (or create) an article store.
+
+        Args:
+            path: SQLite database file (':memory:' for a throwaway store)
+            ttl: Seconds after which a stored article is treated as missing
+                 and re-fetched (None keeps articles indefinitely)
+            max_bytes: Evict least recently used articles once the stored
+                       raw records and details exceed this many UTF-8 bytes
+            max_entries: Evict least recently used articles once the store
+                         holds more than this many articles
+        """
+        self.path = path
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, timeout=30)
+        if path != ':memory:':
+            self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.executescript(_SCHEMA)
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        with self._lock:
+            self._conn.close()
+
+    def __enter__(self) -> 'ArticleStore':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def _fresh_after(self) -> float:
+        return time.time() - self.ttl if self.ttl is not None else float('-inf')
+
+    def _select(self, column: str, pmids: Iterable[str]) -> Dict[str, Any]:
+        """Load `column` for the fresh entries among `pmids`, updating hit/miss counters."""
+        wanted = list(dict.fromkeys(str(p) for p in pmids))
+        found: Dict[str, Any] = {}
+        now = time.time()
+        fresh_after = self._fresh_after()
+        with self._lock, self._conn:
+            for i in range(0, len(wanted), _MAX_PARAMS):
+                chunk = wanted[i:i + _MAX_PARAMS]
+                marks = ','.join('?' * len(chunk))
+                rows = self._conn.execute(
+                    f'SELECT pmid, {column} FROM articles '
+                    f'WHERE pmid IN ({marks}) AND fetched_at > ?',
+                    (*chunk, fresh_after)).fetchall()
+                for pmid, value in rows:
+                    if value is not None:
+                        found[pmid] = json.loads(value)
+                self._conn.executemany(
+                    'UPDATE articles SET accessed_at = ? WHERE pmid = ?',
+                    [(now, pmid) for pmid, _ in rows])
+            self.hits += len(found)
+            self.misses += len(wanted) - len(found)
+        return found
+
+    def get_records(self, pmids: Iterable[str]) -> Dict[str, dict]:
+        """Return stored raw records for the given PMIDs, keyed by PMID.
+
+        Expired and unknown PMIDs are absent from the result.
+        """
+        return self._select('raw', pmids)
+
+    def get_details(self, pmids: Iterable[str]) -> Dict[str, ArticleDetails]:
+        """Return stored parsed `ArticleDetails` for the given PMIDs, keyed by PMID."""
+        return self._select('details', pmids)
+
+    def put_records(self, records: Iterable[dict]) -> int:
+        """Store raw records and their parsed details, then apply eviction.
+
+        Returns:
+            The number of records stored (records without a PMID are skipped)
+        """
+        now = time.time()
+        rows = []
+        for record in records:
+            pmid = record_pmid(record)
+            if not pmid:
+                continue
+            raw = json.dumps(record, ensure_ascii=False, separators=(',', ':'))
+            details = json.dumps(ArticleParser.parse_article_details(record),
+                                 ensure_ascii=False, separators=(',', ':'))
+            # Both columns are stored as UTF-8, so count their encoded bytes.
+            size = len(raw.encode('utf-8')) + len(details.encode('utf-8'))
+            rows.append((pmid, raw, details, size, now, now))
+        if not rows:
+            return 0
+        with self._lock, self._conn:
+            self._conn.executemany(
+                'INSERT OR REPLACE INTO articles '
+                '(pmid, raw, details, size, fetched_at, accessed_at) '
+                'VALUES (?, ?, ?, ?, ?, ?)', rows)
+            self._evict_locked()
+        return len(rows)
+
+    def delete(self, pmids: Iterable[str]) -> None:
+        """Remove articles from the store."""
+        with self._lock, self._conn:
+            self._conn.executemany('DELETE FROM articles WHERE pmid = ?',
+                                   [(str(p),) for p in pmids])
+
+    def evict(self) -> None:
+        """Drop expired articles and trim the store to its size budget."""
+        with self._lock, self._conn:
+            self._evict_locked()
+
+    def _evict_locked(self) -> None:
+        if self.ttl is not None:
+            self._conn.execute('DELETE FROM articles WHERE fetched_at <= ?',
+                               (self._fresh_after(),))
+        if self.max_entries is not None:
+            self._conn.execute(
+                'DELETE FROM articles WHERE pmid IN ('
+                'SELECT pmid FROM articles ORDER BY accessed_at DESC LIMIT -1 OFFSET ?)',
+                (self.max_entries,))
+        if self.max_bytes is not None:
+            total, = self._conn.execute(
+                'SELECT COALESCE(SUM(size), 0) FROM articles').fetchone()
+            if total <= self.max_bytes:
+                return
+            excess = total - self.max_bytes
+            victims: List[tuple] = []
+            for pmid, size in self._conn.execute(
+                    'SELECT pmid, size FROM articles ORDER BY accessed_at ASC'):
+                victims.append((pmid,))
+                excess -= size
+                if excess <= 0:
+                    break
+            self._conn.executemany('DELETE FROM articles WHERE pmid = ?', victims)
+
+    def stats(self) -> Dict[str, int]:
+        """Return hit/miss counters and the current number and size of stored articles."""
+        with self._lock:
+            entries, size = self._conn.execute(
+                'SELECT COUNT(*), COALESCE(SUM(size), 0) FROM articles').fetchone()
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'entries': entries,
+                'bytes': size,
+            }
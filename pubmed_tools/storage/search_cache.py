@@ -0,0 +1,167 @@
+"""
+Cache of esearch results keyed by normalized query.
+
+`SearchCache` keeps recent `PubMedClient.search` results in an in-memory
+LRU, optionally backed by a SQLite file so results survive across
+processes. Queries that differ only in whitespace or term case map to the
+same entry; Boolean operators keep their case because PubMed only treats
+upper-case AND/OR/NOT as operators.
+
+Results that carry a WebEnv/query_key point at NCBI's history server,
+which discards them after a period of inactivity. Those entries are only
+served for `history_ttl` seconds, so a cached result never hands out a
+history session NCBI may already have dropped.
+
+Example:
+    from pubmed_tools.core.client import PubMedClient
+    from pubmed_tools.storage import SearchCache
+
+    client = PubMedClient(search_cache=SearchCache(ttl=3600, path='searches.sqlite'))
+    client.search("cancer treatment")   # network
+    client.search("Cancer  treatment")  # cache hit
+"""
+
+import json
+import re
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+BOOLEAN_OPERATORS = frozenset(['AND', 'OR', 'NOT'])
+
+# Conservative lifetime for cached WebEnv/query_key values. NCBI expires
+# history sessions after inactivity, so reuse must stay well inside that.
+DEFAULT_HISTORY_TTL = 600.0
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS searches (
+    key TEXT PRIMARY KEY,
+    result TEXT NOT NULL,
+    stored_at REAL NOT NULL
+);
+"""
+
+_TOKEN = re.compile(r'"[^"]*"|\S+')
+
+
+def normalize_query(query: str) -> str:
+    """Normalize a PubMed query for use as a cache key.
+
+    Collapses whitespace and lower-cases every token except the Boolean
+    operators AND, OR and NOT, whose case is significant to PubMed.
+    """
+    tokens = _TOKEN.findall(query)
+    return ' '.join(t if t in BOOLEAN_OPERATORS else t.lower() for t in tokens)
+
+
+def _copy_result(result: Dict[str, Any]) -> Dict[str, Any]:
+    return dict(result, id_list=list(result.get('id_list', [])))
+
+
+class SearchCache:
+    def __init__(self,
+                 max_entries: int = 256,
+                 ttl: float = 3600.0,
+                 history_ttl: float = DEFAULT_HISTORY_TTL,
+                 path: Optional[str] = None) -> None:
+        """Create a search cache.
+
+        Args:
+            max_entries: Maximum number of results kept in memory (LRU)
+            ttl: Seconds a cached result stays valid
+            history_ttl: Seconds a result with a WebEnv/query_key stays valid;
+                         the shorter of `ttl` and `history_ttl` applies
+            path: Optional SQLite file used as a second, persistent layer
+        """
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.history_ttl = history_ttl
+        self.path = path
+        self.hits = 0
+        self.misses = 0
+        self._entries: 'OrderedDict[str, Tuple[float, Dict[str, Any]]]' = OrderedDict()
+        self._lock = threading.Lock()
+        self._conn = None
+        if path is not None:
+            self._conn = sqlite3.connect(path, check_same_thread=False, timeout=30)
+            self._conn.executescript(_SCHEMA)
+
+    @staticmethod
+    def make_key(query: str, **options: Any) -> str:
+        """Build the cache key for a query and its esearch options."""
+        return json.dumps([normalize_query(query), sorted(options.items())],
+                          separators=(',', ':'), default=str)
+
+    def _is_fresh(self, stored_at: float, result: Dict[str, Any]) -> bool:
+        lifetime = self.ttl
+        if 'webenv' in result or 'query_key' in result:
+            lifetime = min(lifetime, self.history_ttl)
+        return time.time() - stored_at < lifetime
+
+    def get(self, query: str, **options: Any) -> Optional[Dict[str, Any]]:
+        """Return a cached search result, or None if absent or expired."""
+        key = self.make_key(query, **options)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None and self._conn is not None:
+                row = self._conn.execute(
+                    'SELECT stored_at, result FROM searches WHERE key = ?',
+                    (key,)).fetchone()
+                if row is not None:
+                    entry = (row[0], json.loads(row[1]))
+                    self._remember(key, entry)
+            if entry is not None and self._is_fresh(*entry):
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return _copy_result(entry[1])
+            if entry is not None:
+                self._forget(key)
+            self.misses += 1
+            return None
+
+    def put(self, query: str, result: Dict[str, Any], **options: Any) -> None:
+        """Store a search result."""
+        key = self.make_key(query, **options)
+        entry = (time.time(), _copy_result(result))
+        with self._lock:
+            self._remember(key, entry)
+            if self._conn is not None:
+                with self._conn:
+                    self._conn.execute(
+                        'INSERT OR REPLACE INTO searches (key, result, stored_at) '
+                        'VALUES (?, ?, ?)',
+                        (key, json.dumps(entry[1]), entry[0]))
+
+    def invalidate(self, query: str, **options: Any) -> None:
+        """Drop a cached result, e.g. after NCBI rejects its WebEnv."""
+        with self._lock:
+            self._forget(self.make_key(query, **options))
+
+    def clear(self) -> None:
+        """Drop every cached result from memory and disk."""
+        with self._lock:
+            self._entries.clear()
+            if self._conn is not None:
+                with self._conn:
+                    self._conn.execute('DELETE FROM searches')
+
+    def close(self) -> None:
+        """Close the on-disk layer, if any."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def _remember(self, key: str, entry: Tuple[float, Dict[str, Any]]) -> None:
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def _forget(self, key: str) -> None:
+        self._entries.pop(key, None)
+        if self._conn is not None:
+            with self._conn:
+                self._conn.execute('DELETE FROM searches WHERE key = ?', (key,))
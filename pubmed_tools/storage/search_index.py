@@ -0,0 +1,247 @@
+"""
+Local full-text search over fetched articles.
+
+`ArticleIndex` is an inverted index over the title, abstract and authors of
+`ArticleDetails`, stored in a SQLite FTS5 table. It lives on disk, is
+updated incrementally (adding an article that is already indexed replaces
+it), and ranks matches with BM25. Refining a query over articles that have
+already been fetched then needs no esearch round trip.
+
+Queries use FTS5 syntax:
+
+- terms are ANDed: `insulin resistance`
+- boolean operators: `fasting AND (insulin OR glucose) NOT mice`
+- phrases: `"intermittent fasting"`
+- prefixes: `immuno*`
+- field filters: `title:fasting`, `authors:smith`, `{title abstract}:obesity`
+
+Terms are stemmed (Porter) and accent-insensitive, so `fasting` also
+matches `fasted`. `search` can additionally restrict matches to some fields
+and to a range of publication years.
+
+Example:
+    from pubmed_tools.storage import ArticleIndex
+
+    with ArticleIndex('articles.index.sqlite') as index:
+        index.add(parsed_articles)
+        for article in index.search('"intermittent fasting" NOT mice', limit=10):
+            print(article['pmid'], article['title'])
+"""
+
+import json
+import sqlite3
+import threading
+from typing import Iterable, List, Optional, Sequence, Tuple
+
+from ..core.models import ArticleDetails
+
+INDEXED_FIELDS = ('title', 'abstract', 'authors')
+
+# BM25 weights for title, abstract and authors: title hits count the most.
+DEFAULT_WEIGHTS = (10.0, 1.0, 5.0)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS documents (
+    id INTEGER PRIMARY KEY,
+    pmid TEXT NOT NULL UNIQUE,
+    title TEXT NOT NULL,
+    abstract TEXT NOT NULL,
+    authors TEXT NOT NULL,
+    publication_date TEXT NOT NULL,
+    year INTEGER
+);
+CREATE INDEX IF NOT EXISTS documents_year ON documents (year);
+CREATE VIRTUAL TABLE IF NOT EXISTS documents_fts USING fts5(
+    title, abstract, authors,
+    content='documents', content_rowid='id',
+    tokenize='porter unicode61 remove_diacritics 2'
+);
+CREATE TRIGGER IF NOT EXISTS documents_ai AFTER INSERT ON documents BEGIN
+    INSERT INTO documents_fts (rowid, title, abstract, authors)
+    VALUES (new.id, new.title, new.abstract, new.authors);
+END;
+CREATE TRIGGER IF NOT EXISTS documents_ad AFTER DELETE ON documents BEGIN
+    INSERT INTO documents_fts (documents_fts, rowid, title, abstract, authors)
+    VALUES ('delete', old.id, old.title, old.abstract, old.authors);
+END;
+CREATE TRIGGER IF NOT EXISTS documents_au AFTER UPDATE ON documents BEGIN
+    INSERT INTO documents_fts (documents_fts, rowid, title, abstract, authors)
+    VALUES ('delete', old.id, old.title, old.abstract, old.authors);
+    INSERT INTO documents_fts (rowid, title, abstract, authors)
+    VALUES (new.id, new.title, new.abstract, new.authors);
+END;
+"""
+
+# Author names never contain newlines, so they can be joined and split losslessly.
+_AUTHOR_SEPARATOR = '\n'
+
+
+def _publication_year(date) -> Optional[int]:
+    year = date.get('year', '') if isinstance(date, dict) else str(date or '')[:4]
+    return int(year) if year.isdigit() else None
+
+
+class ArticleIndex:
+    def __init__(self, path: str, weights: Sequence[float] = DEFAULT_WEIGHTS) -> None:
+        """Open (or create) a search index.
+
+        Args:
+            path: SQLite database file (':memory:' for a throwaway index)
+            weights: BM25 weights for the title, abstract and authors fields
+        """
+        self.path = path
+        self.weights = tuple(weights)
+        if len(self.weights) != len(INDEXED_FIELDS):
+            raise ValueError(f"weights must give one value per field in {INDEXED_FIELDS}")
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, timeout=30)
+        if path != ':memory:':
+            self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.executescript(_SCHEMA)
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        with self._lock:
+            self._conn.close()
+
+    def __enter__(self) -> 'ArticleIndex':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute('SELECT COUNT(*) FROM documents').fetchone()[0]
+
+    def add(self, articles: Iterable[ArticleDetails]) -> int:
+        """Index articles, replacing any already indexed under the same PMID.
+
+        Returns:
+            The number of articles indexed (articles without a PMID are skipped)
+        """
+        rows = []
+        for article in articles:
+            pmid = article.get('pmid') if article else None
+            if not pmid:
+                continue
+            date = article.get('publication_date', '')
+            rows.append((str(pmid),
+                         article.get('title') or '',
+                         article.get('abstract') or '',
+                         _AUTHOR_SEPARATOR.join(article.get('authors') or []),
+                         json.dumps(date, ensure_ascii=False),
+                         _publication_year(date)))
+        if not rows:
+            return 0
+        with self._lock, self._conn:
+            self._conn.executemany(
+                'INSERT INTO documents (pmid, title, abstract, authors, publication_date, year) '
+                'VALUES (?, ?, ?, ?, ?, ?) '
+                'ON CONFLICT (pmid) DO UPDATE SET title = excluded.title, '
+                'abstract = excluded.abstract, authors = excluded.authors, '
+                'publication_date = excluded.publication_date, year = excluded.year',
+                rows)
+        return len(rows)
+
+    def remove(self, pmids: Iterable[str]) -> None:
+        """Remove articles from the index."""
+        with self._lock, self._conn:
+            self._conn.executemany('DELETE FROM documents WHERE pmid = ?',
+                                   [(str(p),) for p in pmids])
+
+    def optimize(self) -> None:
+        """Merge the index's internal segments; worthwhile after large incremental updates."""
+        with self._lock, self._conn:
+            self._conn.execute("INSERT INTO documents_fts (documents_fts) VALUES ('optimize')")
+
+    def _match(self, query: str, fields: Optional[Sequence[str]],
+               year_from: Optional[int], year_to: Optional[int]) -> Tuple[str, list]:
+        """Return the FROM/WHERE clause and parameters shared by `search` and `count`."""
+        if fields:
+            unknown = set(fields) - set(INDEXED_FIELDS)
+            if unknown:
+                raise ValueError(f"Fields {unknown} are not indexed")
+            query = f"{{{' '.join(fields)}}}: ({query})"
+        clause = ('FROM documents_fts JOIN documents ON documents.id = documents_fts.rowid '
+                  'WHERE documents_fts MATCH ?')
+        params: list = [query]
+        if year_from is not None:
+            clause += ' AND documents.year >= ?'
+            params.append(year_from)
+        if year_to is not None:
+            clause += ' AND documents.year <= ?'
+            params.append(year_to)
+        return clause, params
+
+    def _execute(self, sql: str, params: list) -> list:
+        with self._lock:
+            try:
+                return self._conn.execute(sql, params).fetchall()
+            except sqlite3.OperationalError as e:
+                # Anything but a locked or unreadable database is the query's fault.
+                if 'database' in str(e) or 'disk' in str(e):
+                    raise
+                raise ValueError(f"Invalid search query: {e}") from e
+
+    def search_pmids(self,
+                     query: str,
+                     limit: Optional[int] = 20,
+                     offset: int = 0,
+                     fields: Optional[Sequence[str]] = None,
+                     year_from: Optional[int] = None,
+                     year_to: Optional[int] = None) -> List[Tuple[str, float]]:
+        """Return (pmid, score) pairs for the best matches, best first.
+
+        Scores are BM25 relevance, higher is better. Arguments are as for `search`.
+        """
+        clause, params = self._match(query, fields, year_from, year_to)
+        weights = ', '.join('?' * len(self.weights))
+        rows = self._execute(
+            f'SELECT documents.pmid, -bm25(documents_fts, {weights}) AS score {clause} '
+            'ORDER BY score DESC LIMIT ? OFFSET ?',
+            [*self.weights, *params, -1 if limit is None else limit, offset])
+        return [(pmid, score) for pmid, score in rows]
+
+    def search(self,
+               query: str,
+               limit: Optional[int] = 20,
+               offset: int = 0,
+               fields: Optional[Sequence[str]] = None,
+               year_from: Optional[int] = None,
+               year_to: Optional[int] = None) -> List[ArticleDetails]:
+        """Return the best-matching articles, best first.
+
+        Args:
+            query: FTS5 query (see the module docstring)
+            limit: Maximum number of articles to return (None for all)
+            offset: Number of top-ranked matches to skip, for paging
+            fields: Only match within these of `INDEXED_FIELDS`
+            year_from: Only articles published in or after this year
+            year_to: Only articles published in or before this year
+
+        Raises:
+            ValueError: If the query is not valid FTS5 syntax
+        """
+        clause, params = self._match(query, fields, year_from, year_to)
+        weights = ', '.join('?' * len(self.weights))
+        rows = self._execute(
+            'SELECT documents.pmid, documents.title, documents.abstract, documents.authors, '
+            f'documents.publication_date {clause} '
+            f'ORDER BY bm25(documents_fts, {weights}) LIMIT ? OFFSET ?',
+            [*params, *self.weights, -1 if limit is None else limit, offset])
+        return [{'title': title,
+                 'abstract': abstract,
+                 'authors': authors.split(_AUTHOR_SEPARATOR) if authors else [],
+                 'publication_date': json.loads(date),
+                 'pmid': pmid}
+                for pmid, title, abstract, authors, date in rows]
+
+    def count(self,
+              query: str,
+              fields: Optional[Sequence[str]] = None,
+              year_from: Optional[int] = None,
+              year_to: Optional[int] = None) -> int:
+        """Return the number of articles matching a query."""
+        clause, params = self._match(query, fields, year_from, year_to)
+        return self._execute(f'SELECT COUNT(*) {clause}', params)[0][0]
@@ -0,0 +1,150 @@
+"""
+Incremental synchronisation of saved PubMed queries.
+
+`IncrementalSync` remembers, per query, the Entrez date (EDAT) up to which
+articles have already been fetched. Each run searches only
+`mindate=<watermark>` to `maxdate=<today>` with `datetype=edat`, parses the
+new articles, and appends them to an `ArticleStore` and/or an exporter that
+supports appending. Watermarks live in a small JSON state file.
+
+EDAT has day granularity, so the watermark day is searched again on the
+next run to pick up articles added later that day; PMIDs already delivered
+for that day are remembered and skipped.
+
+Example:
+    from pubmed_tools.core.client import PubMedClient
+    from pubmed_tools.exporters.csv_exporter import CSVExporter
+    from pubmed_tools.sync import IncrementalSync
+
+    sync = IncrementalSync(PubMedClient(), 'sync_state.json')
+    new_articles = sync.run("longitudinal fasting",
+                            exporter=CSVExporter(), filename='fasting.csv')
+"""
+
+import datetime
+import logging
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
+
+from .core.client import PubMedClient, record_pmid
+from .core.models import ArticleDetails
+from .jsonfile import load_json, write_json_atomic
+from .parsers.article import ArticleParser
+from .storage.search_cache import normalize_query
+
+if TYPE_CHECKING:
+    from .exporters.base import BaseExporter
+    from .storage.article_store import ArticleStore
+
+logger = logging.getLogger(__name__)
+
+DATE_FORMAT = '%Y/%m/%d'
+
+
+def entrez_date(record: dict) -> Optional[str]:
+    """Return a raw record's Entrez date as YYYY/MM/DD, if its history lists one."""
+    history = (record.get('PubmedData') or {}).get('History') or {}
+    history = history.get('PubMedPubDate', [])
+    if isinstance(history, dict):
+        history = [history]
+    for date in history:
+        if isinstance(date, dict) and date.get('@PubStatus') == 'entrez':
+            try:
+                return datetime.date(int(date['Year']), int(date['Month']),
+                                     int(date['Day'])).strftime(DATE_FORMAT)
+            except (KeyError, TypeError, ValueError):
+                return None
+    return None
+
+
+class IncrementalSync:
+    def __init__(self,
+                 client: PubMedClient,
+                 state_path: str,
+                 store: Optional['ArticleStore'] = None) -> None:
+        """Create a sync helper.
+
+        Args:
+            client: Client used for searching and fetching
+            state_path: JSON file holding per-query watermarks
+            store: Optional `ArticleStore` that receives every new article
+        """
+        self.client = client
+        self.state_path = state_path
+        self.store = store
+        self._state = self._load_state()
+
+    def _load_state(self) -> Dict[str, Dict[str, Any]]:
+        return load_json(self.state_path)
+
+    def _save_state(self) -> None:
+        write_json_atomic(self.state_path, self._state)
+
+    def watermark(self, query: str) -> Optional[str]:
+        """Return the last synced Entrez date (YYYY/MM/DD) for a query, if any."""
+        entry = self._state.get(normalize_query(query))
+        return entry['last_date'] if entry else None
+
+    def reset(self, query: str) -> None:
+        """Forget a query's watermark so the next run fetches everything again."""
+        if self._state.pop(normalize_query(query), None) is not None:
+            self._save_state()
+
+    def run(self,
+            query: str,
+            exporter: Optional['BaseExporter'] = None,
+            filename: Optional[str] = None,
+            initial_mindate: Optional[str] = None,
+            convert_date: bool = False,
+            today: Optional[datetime.date] = None) -> List[ArticleDetails]:
+        """Fetch and deliver the articles added since the previous run.
+
+        Args:
+            query: Saved PubMed query
+            exporter: Optional exporter to append new articles to; it must
+                      support appending (e.g. `CSVExporter`)
+            filename: Output file for `exporter`
+            initial_mindate: Lower bound (YYYY/MM/DD) for the first run;
+                             without it the first run fetches every match
+            convert_date: If True, publication dates are YYYY-MM-DD strings
+            today: Upper bound of the search (defaults to the current date)
+
+        Returns:
+            The newly fetched, parsed articles
+        """
+        if exporter is not None and not exporter.supports_append:
+            raise ValueError(f"{type(exporter).__name__} cannot append to existing exports")
+        if exporter is not None and filename is None:
+            raise ValueError("filename is required when an exporter is given")
+
+        key = normalize_query(query)
+        entry = self._state.get(key, {})
+        maxdate = (today or datetime.date.today()).strftime(DATE_FORMAT)
+        mindate = entry.get('last_date', initial_mindate)
+        seen = set(entry.get('seen_pmids', []))
+
+        date_range = {}
+        if mindate is not None:
+            date_range = {'mindate': mindate, 'maxdate': maxdate, 'datetype': 'edat'}
+        records = [record for record in self.client.iter_articles(query, **date_range)
+                   if record_pmid(record) not in seen]
+
+        articles = [article for article in
+                    (ArticleParser.parse_article_details(record, convert_date)
+                     for record in records)
+                    if article is not None]
+        if self.store is not None and records:
+            self.store.put_records(records)
+        if exporter is not None and articles:
+            exporter.export(articles, filename, append=True)
+
+        # Only PMIDs entered on the watermark day can come back next run.
+        delivered = [record_pmid(record) for record in records
+                     if (entrez_date(record) or maxdate) >= maxdate]
+        if entry.get('last_date') == maxdate:
+            delivered.extend(seen)
+        self._state[key] = {'last_date': maxdate,
+                            'seen_pmids': sorted(set(delivered))}
+        self._save_state()
+        logger.info("Synced %d new articles for %r (edat %s to %s)",
+                    len(articles), query, mindate or 'start', maxdate)
+        return articles
@@ -0,0 +1,6 @@
+from .eutils_server import StubEutilsServer
+from .synthetic import (generate_efetch_xml, iter_article_xml, minimal_article_set,
+                        write_efetch_xml)
+
+__all__ = ['StubEutilsServer', 'generate_efetch_xml', 'iter_article_xml', 'minimal_article_set',
+           'write_efetch_xml']
@@ -0,0 +1,262 @@
+"""
+Local stand-in for the NCBI E-utilities endpoints used by `PubMedClient`.
+
+`StubEutilsServer` serves `esearch.fcgi` and `efetch.fcgi` from a
+deterministic synthetic corpus on a background thread, so client code can
+be benchmarked, load-tested and exercised end to end over real HTTP without
+touching NCBI. Every search matches the whole corpus.
+
+- efetch accepts PMIDs via GET or POST, or a WebEnv/query_key from a
+  `usehistory=y` search, paged with `retstart`/`retmax`.
+- Articles are generated on demand from their PMID, so corpora of millions
+  of articles cost no memory up front.
+- `latency`/`jitter` delay every response. `error_rate` answers a random
+  share of requests with 429, and `rate_limit` answers 429 once more than
+  that many requests arrive within a second, as NCBI does.
+
+Example:
+    from pubmed_tools.core.client import PubMedClient
+    from pubmed_tools.core.ratelimit import TokenBucket
+    from pubmed_tools.testing.eutils_server import StubEutilsServer
+
+    with StubEutilsServer(corpus_size=10000) as server:
+        client = PubMedClient(base_url=server.base_url, rate_limiter=TokenBucket(1000))
+        ids = client.search("anything", retmax=500)['id_list']
+        articles = client.fetch_details(id_list=ids)
+
+`pubmed_tools.testing.load` drives a client against this server with
+concurrent workers.
+"""
+
+import random
+import threading
+import time
+import uuid
+from collections import deque
+from functools import lru_cache
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Deque, Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+from .synthetic import XML_FOOTER, XML_HEADER, article_xml
+
+EUTILS_PATH = '/entrez/eutils/'
+
+# Default window returned by esearch and by history efetch, as on NCBI.
+DEFAULT_RETMAX = 20
+
+_RATE_LIMIT_BODY = b'{"error":"API rate limit exceeded"}'
+
+
+class StubEutilsServer:
+    def __init__(self,
+                 corpus_size: int = 1000,
+                 seed: int = 0,
+                 start_pmid: int = 1,
+                 host: str = '127.0.0.1',
+                 port: int = 0,
+                 latency: float = 0.0,
+                 jitter: float = 0.0,
+                 error_rate: float = 0.0,
+                 rate_limit: Optional[float] = None) -> None:
+        """Create a stub server; call `start` (or use it as a context manager) to serve.
+
+        Args:
+            corpus_size: Number of synthetic articles the server knows
+            seed: Seed for the synthetic articles and for injected latency and errors
+            start_pmid: PMID of the first article; PMIDs are consecutive
+            host: Interface to bind
+            port: Port to bind (0 picks a free port)
+            latency: Seconds added before every response
+            jitter: Up to this many extra seconds, drawn uniformly per response
+            error_rate: Share of requests (0-1) answered with 429
+            rate_limit: Requests per second above which requests are answered with 429
+        """
+        self.corpus_size = corpus_size
+        self.seed = seed
+        self.start_pmid = start_pmid
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.rate_limit = rate_limit
+        self.requests: Dict[str, int] = {'esearch': 0, 'efetch': 0, 'throttled': 0}
+        # TCP connections accepted; lower than the request count when clients keep alive.
+        self.connections = 0
+        self._lock = threading.Lock()
+        self._rng = random.Random(seed)
+        self._recent: Deque[float] = deque()
+        # WebEnv -> query_key -> search term
+        self._history: Dict[str, Dict[str, str]] = {}
+        self._httpd = ThreadingHTTPServer((host, port), self._handler_class())
+        self._httpd.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+        self._article = lru_cache(maxsize=4096)(self._generate_article)
+
+    @property
+    def base_url(self) -> str:
+        """E-utilities base URL to pass to `PubMedClient(base_url=...)`."""
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}{EUTILS_PATH}"
+
+    def start(self) -> 'StubEutilsServer':
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._httpd.serve_forever,
+                                            name='stub-eutils', daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        if self._thread is not None:
+            self._httpd.shutdown()
+            self._thread.join()
+            self._thread = None
+        self._httpd.server_close()
+
+    def __enter__(self) -> 'StubEutilsServer':
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+    def _count(self, eutil: str) -> None:
+        with self._lock:
+            self.requests[eutil] += 1
+
+    def _generate_article(self, pmid: int) -> bytes:
+        # Seeded per PMID, so any article can be produced without generating
+        # the ones before it.
+        return article_xml(pmid, random.Random(f"{self.seed}:{pmid}")).encode('utf-8')
+
+    def _pmids(self) -> range:
+        return range(self.start_pmid, self.start_pmid + self.corpus_size)
+
+    @staticmethod
+    def _window(params: Dict[str, str]) -> Tuple[int, int]:
+        return (max(0, int(params.get('retstart') or 0)),
+                max(0, int(params.get('retmax') or DEFAULT_RETMAX)))
+
+    def _admit(self) -> Tuple[bool, float]:
+        """Decide whether to throttle a request and how long to delay the response."""
+        with self._lock:
+            now = time.monotonic()
+            throttled = self.error_rate > 0 and self._rng.random() < self.error_rate
+            if self.rate_limit is not None:
+                while self._recent and now - self._recent[0] >= 1.0:
+                    self._recent.popleft()
+                if len(self._recent) >= self.rate_limit:
+                    throttled = True
+                else:
+                    self._recent.append(now)
+            if throttled:
+                self.requests['throttled'] += 1
+            delay = self.latency + (self._rng.uniform(0, self.jitter) if self.jitter else 0.0)
+        return throttled, delay
+
+    def esearch(self, params: Dict[str, str]) -> bytes:
+        """Return an eSearchResult listing a `retstart`/`retmax` window of the corpus.
+
+        With `usehistory=y` the search is also stored on the history server,
+        under the given `WebEnv` if it is known, otherwise under a new one.
+        """
+        self._count('esearch')
+        retstart, retmax = self._window(params)
+        ids = self._pmids()[retstart:retstart + retmax]
+        history = ''
+        if params.get('usehistory') == 'y':
+            webenv, query_key = self._remember(params.get('WebEnv'), params.get('term', ''))
+            history = f'<QueryKey>{query_key}</QueryKey><WebEnv>{webenv}</WebEnv>'
+        id_list = ''.join(f'<Id>{pmid}</Id>' for pmid in ids)
+        return ('<?xml version="1.0" encoding="UTF-8" ?>\n<eSearchResult>'
+                f'<Count>{self.corpus_size}</Count><RetMax>{len(ids)}</RetMax>'
+                f'<RetStart>{retstart}</RetStart>{history}<IdList>{id_list}</IdList>'
+                '</eSearchResult>').encode('utf-8')
+
+    def _remember(self, webenv: Optional[str], term: str) -> Tuple[str, str]:
+        with self._lock:
+            if webenv not in self._history:
+                webenv = f"MCID_{uuid.UUID(int=self._rng.getrandbits(128)).hex}"
+                self._history[webenv] = {}
+            queries = self._history[webenv]
+            query_key = str(len(queries) + 1)
+            queries[query_key] = term
+        return webenv, query_key
+
+    def efetch(self, params: Dict[str, str]) -> Optional[bytes]:
+        """Return a PubmedArticleSet for the requested PMIDs or history window.
+
+        Returns:
+            The payload, or None if the WebEnv/query_key is unknown
+        """
+        self._count('efetch')
+        corpus = self._pmids()
+        pmids: List[int] = []
+        if 'id' in params:
+            for value in params['id'].split(','):
+                value = value.strip()
+                if value.isdigit() and int(value) in corpus:
+                    pmids.append(int(value))
+        else:
+            with self._lock:
+                known = params.get('query_key') in self._history.get(params.get('WebEnv'), {})
+            if not known:
+                return None
+            retstart, retmax = self._window(params)
+            pmids = list(corpus[retstart:retstart + retmax])
+        return b''.join([XML_HEADER.encode('utf-8'),
+                         *(self._article(pmid) for pmid in pmids),
+                         XML_FOOTER.encode('utf-8')])
+
+    def _handler_class(self) -> type:
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+
+            def setup(self) -> None:
+                super().setup()
+                with server._lock:
+                    server.connections += 1
+
+            def log_message(self, format, *args) -> None:
+                pass
+
+            def _send(self, status: int, body: bytes, content_type: str) -> None:
+                self.send_response(status)
+                self.send_header('Content-Type', content_type)
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def _respond(self, params: Dict[str, str]) -> None:
+                eutil = urlsplit(self.path).path.rsplit('/', 1)[-1]
+                throttled, delay = server._admit()
+                if delay > 0:
+                    time.sleep(delay)
+                if throttled:
+                    self._send(429, _RATE_LIMIT_BODY, 'application/json')
+                    return
+                if eutil == 'esearch.fcgi':
+                    body = server.esearch(params)
+                elif eutil == 'efetch.fcgi':
+                    body = server.efetch(params)
+                    if body is None:
+                        self._send(400, b'<?xml version="1.0" encoding="UTF-8" ?>\n'
+                                        b'<eFetchResult><ERROR>Unable to obtain query #'
+                                        b'</ERROR></eFetchResult>',
+                                   'text/xml; charset=UTF-8')
+                        return
+                else:
+                    self._send(404, b'Unknown E-utility', 'text/plain')
+                    return
+                self._send(200, body, 'text/xml; charset=UTF-8')
+
+            def do_GET(self) -> None:
+                query = parse_qs(urlsplit(self.path).query)
+                self._respond({key: values[-1] for key, values in query.items()})
+
+            def do_POST(self) -> None:
+                length = int(self.headers.get('Content-Length', 0))
+                form = parse_qs(self.rfile.read(length).decode('utf-8'))
+                self._respond({key: values[-1] for key, values in form.items()})
+
+        return Handler
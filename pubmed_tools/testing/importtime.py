@@ -0,0 +1,55 @@
+"""
+Import-time measurement for startup budgets.
+
+Each measurement runs in a fresh interpreter, so nothing is already cached
+in `sys.modules`. The unit tests only check which modules an import loads;
+the time budgets are enforced by `benchmarks/bench_import.py`
+(`make bench-import`), since wall-clock limits depend on the machine.
+"""
+
+import json
+import subprocess
+import sys
+from typing import Dict, List, Set
+
+# Statements a light-weight caller runs, with the most each may take in a
+# fresh interpreter (seconds). Generous, to absorb slow CI machines; the
+# numbers that matter are an order of magnitude below.
+IMPORT_BUDGETS: Dict[str, float] = {
+    'import pubmed_tools': 0.1,
+    'from pubmed_tools.exporters import CSVExporter': 0.25,
+    'from pubmed_tools.exporters import JSONLExporter': 0.25,
+}
+
+# Dependencies that only the code paths needing them may import.
+HEAVY_MODULES = ('requests', 'httpx', 'pandas', 'reportlab', 'openpyxl', 'pyarrow', 'pypdf')
+
+_PROBE = """
+import json, sys, time
+start = time.perf_counter()
+exec({statement!r})
+elapsed = time.perf_counter() - start
+print(json.dumps({{'seconds': elapsed, 'modules': sorted(sys.modules)}}))
+"""
+
+
+def _probe(statement: str) -> dict:
+    output = subprocess.run([sys.executable, '-c', _PROBE.format(statement=statement)],
+                            check=True, capture_output=True, text=True).stdout
+    return json.loads(output.splitlines()[-1])
+
+
+def measure_import(statement: str, repeat: int = 5) -> float:
+    """Return the fastest time, in seconds, `statement` takes in a fresh interpreter."""
+    return min(_probe(statement)['seconds'] for _ in range(repeat))
+
+
+def loaded_modules(statement: str) -> Set[str]:
+    """Return the top-level modules loaded after running `statement` in a fresh interpreter."""
+    return {name.partition('.')[0] for name in _probe(statement)['modules']}
+
+
+def heavy_imports(statement: str) -> List[str]:
+    """Return the `HEAVY_MODULES` that `statement` imports."""
+    loaded = loaded_modules(statement)
+    return [name for name in HEAVY_MODULES if name in loaded]
@@ -0,0 +1,243 @@
+"""
+Load driver for `PubMedClient`.
+
+`run_load` runs N worker threads that share one client, each repeating an
+operation, and reports throughput and latency percentiles. Operations:
+
+- 'search': one esearch returning `batch_size` IDs
+- 'fetch': `fetch_details` for `batch_size` random PMIDs from the corpus
+- 'history': an esearch with `usehistory=y`, then an efetch of a random
+  `batch_size` window through the WebEnv
+
+Latency is measured per operation, including client-side retries and rate
+limiting. Real NCBI must not be load-tested, so the command line starts a
+local `StubEutilsServer` unless `--base-url` points elsewhere. It refuses
+NCBI hosts, and `--rate` only lifts the client's rate limit for local
+targets:
+
+    python -m pubmed_tools.testing.load --workers 8 --operations 200 \\
+        --corpus-size 1000000 --latency 0.05 --error-rate 0.02
+
+Example:
+    from pubmed_tools.core.client import PubMedClient
+    from pubmed_tools.core.ratelimit import TokenBucket
+    from pubmed_tools.testing.eutils_server import StubEutilsServer
+    from pubmed_tools.testing.load import run_load
+
+    with StubEutilsServer(corpus_size=100000, latency=0.02) as server, \\
+            PubMedClient(base_url=server.base_url, rate_limiter=TokenBucket(1000),
+                         pool_size=8) as client:
+        report = run_load(client, workers=8, operations=100)
+        print(report['throughput'], report['latency']['p99'])
+"""
+
+import argparse
+import json
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+from ..core.client import PubMedClient
+from ..core.ratelimit import TokenBucket
+from ..instrumentation import percentile
+from .eutils_server import StubEutilsServer
+
+OPERATIONS = ('search', 'fetch', 'history')
+
+# IDs sampled from the server for the 'fetch' operation.
+ID_POOL_SIZE = 10000
+
+SEARCH_TERM = 'load test'
+
+# Hosts the driver refuses to target: NCBI forbids load testing its E-utilities.
+REFUSED_HOST_SUFFIX = 'ncbi.nlm.nih.gov'
+
+LOCAL_HOSTS = ('localhost', '127.0.0.1', '::1')
+
+
+def is_local_url(url: str) -> bool:
+    """Return True if `url` points at this machine."""
+    host = (urlsplit(url).hostname or '').lower()
+    return host in LOCAL_HOSTS or host.startswith('127.')
+
+
+def _operation(client: PubMedClient, operation: str, batch_size: int,
+               rng: random.Random, id_pool: List[str],
+               total: int) -> Callable[[], Tuple[int, int]]:
+    """Return a callable performing one operation.
+
+    The callable returns the number of items (IDs or articles) received and
+    the number expected; `PubMedClient` drops efetch batches that still fail
+    after its retries, so a short answer is how such failures show up.
+    """
+    if operation == 'search':
+        def search() -> Tuple[int, int]:
+            ids = client.search(SEARCH_TERM, retmax=batch_size)['id_list']
+            return len(ids), min(batch_size, total)
+        return search
+
+    if operation == 'fetch':
+        def fetch() -> Tuple[int, int]:
+            ids = rng.sample(id_pool, min(batch_size, len(id_pool)))
+            return len(client.fetch_details(id_list=ids)), len(ids)
+        return fetch
+
+    def history() -> Tuple[int, int]:
+        result = client.search(SEARCH_TERM, use_history=True, retmax=0)
+        start = rng.randrange(max(1, total - batch_size + 1))
+        articles = client.fetch_details(webenv=result.get('webenv'),
+                                        query_key=result.get('query_key'),
+                                        retmax=batch_size, retstart=start)
+        return len(articles), min(batch_size, total - start)
+    return history
+
+
+def run_load(client: PubMedClient,
+             workers: int = 4,
+             operations: int = 100,
+             duration: Optional[float] = None,
+             operation: str = 'fetch',
+             batch_size: int = 100,
+             seed: int = 0) -> Dict[str, Any]:
+    """Drive `client` with concurrent workers and report throughput and latency.
+
+    Args:
+        client: Client to load; shared by every worker, so its `pool_size`
+                should be at least `workers`
+        workers: Number of concurrent worker threads
+        operations: Operations per worker (ignored when `duration` is given)
+        duration: Run each worker for this many seconds instead
+        operation: One of `OPERATIONS`
+        batch_size: IDs or articles requested per operation
+        seed: Seed for the PMIDs and windows requested
+
+    Returns:
+        Operations completed and failed (raised, or received fewer items
+        than requested), wall-clock seconds, completed operations per
+        second, items received per second, retries performed by the client
+        and latency statistics of completed operations in seconds (mean,
+        p50, p95, p99, max)
+    """
+    if operation not in OPERATIONS:
+        raise ValueError(f"operation must be one of {OPERATIONS}")
+    probe = client.search(SEARCH_TERM, retmax=ID_POOL_SIZE if operation == 'fetch' else 0)
+    id_pool = probe['id_list']
+    total = int(probe.get('count', 0) or 0)
+    if operation == 'fetch' and not id_pool:
+        raise ValueError("The server returned no PMIDs to fetch")
+
+    latencies: List[float] = []
+    counts = {'operations': 0, 'errors': 0, 'items': 0}
+    lock = threading.Lock()
+    retries_before = client.connection_stats()['retries']
+
+    def worker(index: int) -> None:
+        run_once = _operation(client, operation, batch_size,
+                              random.Random(f"{seed}:{index}"), id_pool, total)
+        deadline = None if duration is None else time.perf_counter() + duration
+        done = 0
+        while (done < operations) if deadline is None else (time.perf_counter() < deadline):
+            started = time.perf_counter()
+            try:
+                items, expected = run_once()
+            except Exception:
+                items, expected = 0, 1
+            elapsed = time.perf_counter() - started
+            with lock:
+                counts['items'] += items
+                if items < expected:
+                    counts['errors'] += 1
+                else:
+                    counts['operations'] += 1
+                    latencies.append(elapsed)
+            done += 1
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        list(executor.map(worker, range(workers)))
+    seconds = time.perf_counter() - start
+
+    ordered = sorted(latencies)
+    return {
+        'operation': operation,
+        'workers': workers,
+        'operations': counts['operations'],
+        'errors': counts['errors'],
+        'seconds': seconds,
+        'throughput': counts['operations'] / seconds if seconds else 0.0,
+        'items_per_second': counts['items'] / seconds if seconds else 0.0,
+        'retries': client.connection_stats()['retries'] - retries_before,
+        'latency': {
+            'mean': sum(ordered) / len(ordered) if ordered else 0.0,
+            'p50': percentile(ordered, 0.50),
+            'p95': percentile(ordered, 0.95),
+            'p99': percentile(ordered, 0.99),
+            'max': ordered[-1] if ordered else 0.0,
+        },
+    }
+
+
+def get_arg_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        description="Load-test PubMedClient against a local stub E-utilities server.")
+    parser.add_argument('--base-url',
+                        help="Target this E-utilities URL instead of a local stub "
+                             "(NCBI is refused; --rate only applies to local targets)")
+    parser.add_argument('--workers', type=int, default=4)
+    parser.add_argument('--operations', type=int, default=100, help="Operations per worker")
+    parser.add_argument('--duration', type=float, help="Seconds per worker (overrides --operations)")
+    parser.add_argument('--operation', choices=OPERATIONS, default='fetch')
+    parser.add_argument('--batch-size', type=int, default=100)
+    parser.add_argument('--rate', type=float, default=1e6,
+                        help="Client-side requests per second against a local target "
+                             "(default: effectively unlimited)")
+    parser.add_argument('--corpus-size', type=int, default=100000)
+    parser.add_argument('--latency', type=float, default=0.0, help="Stub latency in seconds")
+    parser.add_argument('--jitter', type=float, default=0.0, help="Stub latency jitter in seconds")
+    parser.add_argument('--error-rate', type=float, default=0.0, help="Share of stub 429s")
+    parser.add_argument('--server-rate-limit', type=float,
+                        help="Stub requests per second before it answers 429")
+    parser.add_argument('--seed', type=int, default=0)
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> Dict[str, Any]:
+    parser = get_arg_parser()
+    args = parser.parse_args(argv)
+    server = None
+    base_url = args.base_url
+    if base_url is not None:
+        host = (urlsplit(base_url).hostname or '').lower()
+        if host == REFUSED_HOST_SUFFIX or host.endswith('.' + REFUSED_HOST_SUFFIX):
+            parser.error("refusing to load-test NCBI; run against a local StubEutilsServer")
+    # Remote targets keep the default NCBI-rate limiter, whatever --rate says.
+    rate_limiter = (TokenBucket(args.rate, capacity=max(1.0, args.rate))
+                    if base_url is None or is_local_url(base_url) else None)
+    if base_url is None:
+        server = StubEutilsServer(corpus_size=args.corpus_size, seed=args.seed,
+                                  latency=args.latency, jitter=args.jitter,
+                                  error_rate=args.error_rate,
+                                  rate_limit=args.server_rate_limit).start()
+        base_url = server.base_url
+    try:
+        with PubMedClient(base_url=base_url, pool_size=max(10, args.workers),
+                          max_workers=1,
+                          rate_limiter=rate_limiter,
+                          api_key=None, email=None, tool=None) as client:
+            report = run_load(client, workers=args.workers, operations=args.operations,
+                              duration=args.duration, operation=args.operation,
+                              batch_size=args.batch_size, seed=args.seed)
+        if server is not None:
+            report['server_requests'] = dict(server.requests)
+    finally:
+        if server is not None:
+            server.stop()
+    print(json.dumps(report, indent=2))
+    return report
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,191 @@
+"""
+Synthetic efetch payloads for tests and benchmarks.
+
+Generates deterministic PubmedArticleSet XML that exercises the same shapes
+real efetch responses do: versioned PMIDs, labelled and unlabelled abstract
+sections, inline formatting in titles, collective authors, ArticleDate vs
+PubDate vs MedlineDate, and the MeSH/PubmedData blocks that make up most of
+a record's size.
+
+Example:
+    from pubmed_tools.testing.synthetic import generate_efetch_xml
+
+    xml = generate_efetch_xml(1000)
+"""
+
+import random
+from typing import Callable, Iterable, Iterator, Optional, Union
+from xml.sax.saxutils import escape
+
+XML_HEADER = (
+    '<?xml version="1.0" ?>\n'
+    '<!DOCTYPE PubmedArticleSet PUBLIC "-//NLM//DTD PubMedArticle, 1st January 2024//EN" '
+    '"https://dtd.nlm.nih.gov/ncbi/pubmed/out/pubmed_240101.dtd">\n'
+    '<PubmedArticleSet>\n'
+)
+XML_FOOTER = '</PubmedArticleSet>\n'
+
+_WORDS = (
+    'cancer therapy patients cohort randomized trial fasting nutrition glucose insulin '
+    'metabolic outcomes mortality risk association analysis clinical study effect '
+    'treatment response tumor immune cell expression protein gene pathway signaling '
+    'inflammation cardiovascular disease obesity diabetes intervention placebo dose '
+    'significant increased reduced compared baseline follow-up longitudinal systematic '
+    'review meta-analysis evidence model mice vivo vitro'
+).split()
+_FORE_NAMES = ('John', 'Jane', 'Wei', 'Maria', 'Ahmed', 'Yuki', 'Olga', 'Carlos',
+               'Priya', 'Lars', 'Fatima', 'Chen', 'Anna', 'José', 'Søren')
+_LAST_NAMES = ('Smith', 'Doe', 'Zhang', 'García', 'Khan', 'Tanaka', 'Ivanova',
+               'Silva', 'Patel', 'Nielsen', 'Müller', 'Li', 'Rossi', 'Kowalski')
+_MONTHS = ('Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep', 'Oct',
+           'Nov', 'Dec')
+_LABELS = ('BACKGROUND', 'METHODS', 'RESULTS', 'CONCLUSIONS')
+
+
+def _sentence(rng: random.Random, low: int, high: int) -> str:
+    return ' '.join(rng.choice(_WORDS) for _ in range(rng.randint(low, high)))
+
+
+def _title(rng: random.Random) -> str:
+    words = _sentence(rng, 6, 16)
+    if rng.random() < 0.2:
+        head, _, tail = words.partition(' ')
+        return f'{escape(head)} <i>in vivo</i> {escape(tail)}.'
+    return escape(words.capitalize()) + '.'
+
+
+def _abstract(rng: random.Random) -> str:
+    roll = rng.random()
+    if roll < 0.1:
+        return ''
+    if roll < 0.5:
+        sections = ''.join(
+            f'<AbstractText Label="{label}" NlmCategory="{label}">'
+            f'{escape(_sentence(rng, 20, 60))}.</AbstractText>'
+            for label in _LABELS)
+    else:
+        sections = f'<AbstractText>{escape(_sentence(rng, 80, 200))}.</AbstractText>'
+    return (f'<Abstract>{sections}'
+            '<CopyrightInformation>© 2024 The Authors.</CopyrightInformation></Abstract>')
+
+
+def _authors(rng: random.Random) -> str:
+    if rng.random() < 0.03:
+        return ''
+    authors = []
+    for _ in range(rng.randint(1, 15)):
+        if rng.random() < 0.03:
+            authors.append('<Author ValidYN="Y"><CollectiveName>Study Group'
+                           '</CollectiveName></Author>')
+            continue
+        fore = rng.choice(_FORE_NAMES)
+        authors.append(
+            f'<Author ValidYN="Y"><LastName>{rng.choice(_LAST_NAMES)}</LastName>'
+            f'<ForeName>{fore}</ForeName><Initials>{fore[0]}</Initials>'
+            '<AffiliationInfo><Affiliation>Department of Medicine, University Hospital.'
+            '</Affiliation></AffiliationInfo></Author>')
+    return f'<AuthorList CompleteYN="Y">{"".join(authors)}</AuthorList>'
+
+
+def _pub_date(rng: random.Random) -> str:
+    year = rng.randint(1990, 2024)
+    roll = rng.random()
+    if roll < 0.05:
+        return f'<PubDate><MedlineDate>{year} {_MONTHS[0]}-{_MONTHS[1]}</MedlineDate></PubDate>'
+    if roll < 0.4:
+        return f'<PubDate><Year>{year}</Year></PubDate>'
+    return (f'<PubDate><Year>{year}</Year><Month>{rng.choice(_MONTHS)}</Month>'
+            f'<Day>{rng.randint(1, 28):02d}</Day></PubDate>')
+
+
+def _article_date(rng: random.Random) -> str:
+    if rng.random() < 0.5:
+        return ''
+    return (f'<ArticleDate DateType="Electronic"><Year>{rng.randint(1990, 2024)}</Year>'
+            f'<Month>{rng.randint(1, 12):02d}</Month><Day>{rng.randint(1, 28):02d}</Day>'
+            '</ArticleDate>')
+
+
+def _mesh(rng: random.Random) -> str:
+    headings = ''.join(
+        f'<MeshHeading><DescriptorName UI="D{rng.randint(100000, 999999)}" '
+        f'MajorTopicYN="N">{escape(rng.choice(_WORDS).capitalize())}</DescriptorName>'
+        '</MeshHeading>'
+        for _ in range(rng.randint(3, 12)))
+    return f'<MeshHeadingList>{headings}</MeshHeadingList>'
+
+
+def article_xml(pmid: int, rng: random.Random) -> str:
+    """Return the XML for one synthetic PubmedArticle."""
+    return (
+        '<PubmedArticle>'
+        f'<MedlineCitation Status="MEDLINE" Owner="NLM"><PMID Version="1">{pmid}</PMID>'
+        '<Article PubModel="Print-Electronic">'
+        '<Journal><ISSN IssnType="Electronic">1234-5678</ISSN>'
+        f'<JournalIssue CitedMedium="Internet"><Volume>{rng.randint(1, 80)}</Volume>'
+        f'<Issue>{rng.randint(1, 12)}</Issue>{_pub_date(rng)}</JournalIssue>'
+        '<Title>Journal of Synthetic Medicine</Title></Journal>'
+        f'<ArticleTitle>{_title(rng)}</ArticleTitle>'
+        f'{_abstract(rng)}{_authors(rng)}'
+        '<Language>eng</Language>'
+        f'{_article_date(rng)}'
+        '</Article>'
+        f'{_mesh(rng)}'
+        '</MedlineCitation>'
+        '<PubmedData><PublicationStatus>ppublish</PublicationStatus>'
+        f'<ArticleIdList><ArticleId IdType="pubmed">{pmid}</ArticleId>'
+        f'<ArticleId IdType="doi">10.1000/synth.{pmid}</ArticleId></ArticleIdList>'
+        '</PubmedData>'
+        '</PubmedArticle>\n'
+    )
+
+
+def iter_article_xml(count: int, seed: int = 0, start_pmid: int = 1) -> Iterator[str]:
+    """Yield the XML of `count` deterministic synthetic articles."""
+    rng = random.Random(seed)
+    for offset in range(count):
+        yield article_xml(start_pmid + offset, rng)
+
+
+def generate_efetch_xml(count: int, seed: int = 0, start_pmid: int = 1) -> bytes:
+    """Return a complete efetch PubmedArticleSet payload with `count` articles."""
+    body = ''.join(iter_article_xml(count, seed, start_pmid))
+    return (XML_HEADER + body + XML_FOOTER).encode('utf-8')
+
+
+def minimal_article_set(pmids: Iterable[Union[int, str]], version: Optional[str] = None) -> str:
+    """Return a bare PubmedArticleSet with only a PMID and a title per article.
+
+    Titles read "Title <pmid>". Without `version` the PMIDs carry no Version
+    attribute, so xmltodict parses them to plain strings.
+    """
+    attribute = f' Version="{version}"' if version else ''
+    articles = ''.join(
+        f'<PubmedArticle><MedlineCitation><PMID{attribute}>{pmid}</PMID>'
+        f'<Article><ArticleTitle>Title {pmid}</ArticleTitle></Article>'
+        '</MedlineCitation></PubmedArticle>'
+        for pmid in pmids)
+    return f'<PubmedArticleSet>{articles}</PubmedArticleSet>'
+
+
+def write_efetch_xml(path: str, count: int, seed: int = 0,
+                     start_pmid: int = 1, opener: Optional[Callable] = None) -> str:
+    """Write a synthetic payload to `path` without holding it in memory.
+
+    Args:
+        path: Destination file
+        count: Number of articles
+        seed: Random seed; the same seed always produces the same file
+        start_pmid: PMID of the first article
+        opener: Optional replacement for `open` (e.g. `gzip.open`)
+
+    Returns:
+        The path written
+    """
+    opener = opener or open
+    with opener(path, 'wt', encoding='utf-8') as f:
+        f.write(XML_HEADER)
+        for article in iter_article_xml(count, seed, start_pmid):
+            f.write(article)
+        f.write(XML_FOOTER)
+    return path
@@ -0,0 +1,100 @@
+import time
+import pytest
+from unittest.mock import patch, Mock
+from pubmed_tools.core.client import PubMedClient
+from pubmed_tools.core.ratelimit import TokenBucket
+from pubmed_tools.storage import ArticleStore
+from pubmed_tools.testing.synthetic import minimal_article_set
+
+
+def _record(pmid, title="Title"):
+    return {
+        'MedlineCitation': {
+            'PMID': {'@Version': '1', '#text': pmid},
+            'Article': {'ArticleTitle': f'{title} {pmid}'},
+        }
+    }
+
+
+@pytest.fixture
+def store(tmp_path):
+    with ArticleStore(str(tmp_path / "articles.sqlite")) as store:
+        yield store
+
+
+def test_put_and_get(store):
+    assert store.put_records([_record('1'), _record('2')]) == 2
+    records = store.get_records(['1', '2', '3'])
+    assert records == {'1': _record('1'), '2': _record('2')}
+    details = store.get_details(['1'])
+    assert details['1']['title'] == 'Title 1'
+    assert details['1']['pmid'] == '1'
+    stats = store.stats()
+    assert stats['hits'] == 3
+    assert stats['misses'] == 1
+    assert stats['entries'] == 2
+
+
+def test_ttl_expiry(tmp_path):
+    store = ArticleStore(str(tmp_path / "a.sqlite"), ttl=60)
+    store.put_records([_record('1')])
+    assert '1' in store.get_records(['1'])
+    with patch('pubmed_tools.storage.article_store.time.time',
+               return_value=time.time() + 120):
+        assert store.get_records(['1']) == {}
+        store.evict()
+    assert store.stats()['entries'] == 0
+
+
+def test_lru_eviction_by_entries(store):
+    store.max_entries = 2
+    store.put_records([_record('1')])
+    store.put_records([_record('2')])
+    time.sleep(0.01)
+    store.get_records(['1'])
+    store.put_records([_record('3')])
+    assert set(store.get_records(['1', '2', '3'])) == {'1', '3'}
+
+
+def test_lru_eviction_by_bytes(store):
+    store.put_records([_record(str(i)) for i in range(10)])
+    entry_size = store.stats()['bytes'] // 10
+    store.max_bytes = entry_size * 4
+    store.evict()
+    assert store.stats()['entries'] <= 4
+
+
+def test_entry_size_counts_utf8_bytes_of_raw_and_details(store):
+    store.put_records([_record('1', title='Title')])
+    ascii_size = store.stats()['bytes']
+    store.delete(['1'])
+    # 'Titlé' is one character but two bytes longer once UTF-8 encoded: once
+    # in the raw record and once in the parsed details.
+    store.put_records([_record('1', title='Titlé')])
+    assert store.stats()['bytes'] == ascii_size + 2
+
+
+def test_delete(store):
+    store.put_records([_record('1'), _record('2')])
+    store.delete(['1'])
+    assert set(store.get_records(['1', '2'])) == {'2'}
+
+
+def test_client_fetches_only_missing_ids(store):
+    store.put_records([_record('1')])
+    client = PubMedClient(rate_limiter=TokenBucket(1000), article_store=store)
+
+    def fake_get(url, params=None, **kwargs):
+        response = Mock(status_code=200)
+        ids = params["id"].split(",")
+        response.content = minimal_article_set(ids, version="1").encode("utf-8")
+        return response
+
+    with patch("requests.Session.get", side_effect=fake_get) as mock_get:
+        result = client.fetch_details(['2', '1', '3'])
+        assert mock_get.call_args.kwargs["params"]["id"] == "2,3"
+        again = client.fetch_details(['3', '2'])
+    assert mock_get.call_count == 1
+    pmids = [r['MedlineCitation']['PMID']['#text'] for r in result]
+    assert pmids == ['2', '1', '3']
+    assert [r['MedlineCitation']['PMID']['#text'] for r in again] == ['3', '2']
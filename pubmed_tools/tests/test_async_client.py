@@ -0,0 +1,145 @@
+import asyncio
+import pytest
+
+httpx = pytest.importorskip("httpx")
+
+from pubmed_tools.core.async_client import AsyncPubMedClient
+from pubmed_tools.core.ratelimit import TokenBucket
+from pubmed_tools.testing.synthetic import minimal_article_set
+
+
+def _make_client(handler, **kwargs):
+    transport = httpx.MockTransport(handler)
+    return AsyncPubMedClient(client=httpx.AsyncClient(transport=transport),
+                             rate_limiter=TokenBucket(1000),
+                             backoff_factor=0, **kwargs)
+
+
+def _paging_handler(total, calls=None):
+    def handler(request):
+        params = dict(request.url.params)
+        if calls is not None:
+            calls.append(params)
+        if request.url.path.endswith("esearch.fcgi"):
+            return httpx.Response(200, text=(
+                f"<eSearchResult><Count>{total}</Count><IdList/>"
+                "<WebEnv>webenv123</WebEnv><QueryKey>1</QueryKey></eSearchResult>"))
+        start, size = int(params["retstart"]), int(params["retmax"])
+        return httpx.Response(200, text=minimal_article_set(range(start, min(start + size, total))))
+    return handler
+
+
+def test_search():
+    async def main():
+        async with _make_client(_paging_handler(2)) as client:
+            return await client.search("test query", use_history=True)
+
+    result = asyncio.run(main())
+    assert result["count"] == "2"
+    assert result["webenv"] == "webenv123"
+
+
+def test_fetch_details_batches_preserve_order():
+    def handler(request):
+        return httpx.Response(200, text=minimal_article_set(request.url.params["id"].split(",")))
+
+    async def main():
+        async with _make_client(handler, batch_size=3) as client:
+            return await client.fetch_details([str(i) for i in range(10)])
+
+    result = asyncio.run(main())
+    assert [a["MedlineCitation"]["PMID"] for a in result] == [str(i) for i in range(10)]
+
+
+def test_iter_articles_streams_all_windows():
+    calls = []
+
+    async def main():
+        async with _make_client(_paging_handler(25, calls)) as client:
+            return [a["MedlineCitation"]["PMID"]
+                    async for a in client.iter_articles("q", batch_size=10)]
+
+    assert asyncio.run(main()) == [str(i) for i in range(25)]
+    assert [c["retstart"] for c in calls if "WebEnv" in c] == ["0", "10", "20"]
+
+
+def test_iter_articles_closing_early_awaits_prefetch():
+    cancelled = []
+    prefetching = asyncio.Event()
+
+    async def handler(request):
+        if request.url.path.endswith("esearch.fcgi"):
+            return _paging_handler(25)(request)
+        if request.url.params["retstart"] != "0":
+            prefetching.set()
+            try:
+                await asyncio.sleep(60)
+            except asyncio.CancelledError:
+                cancelled.append(request.url.params["retstart"])
+                raise
+        return _paging_handler(25)(request)
+
+    async def main():
+        async with _make_client(handler) as client:
+            articles = client.iter_articles("q", batch_size=10)
+            first = await articles.__anext__()
+            await prefetching.wait()
+            await articles.aclose()
+            return first, asyncio.all_tasks() - {asyncio.current_task()}
+
+    first, leftover = asyncio.run(main())
+    assert first["MedlineCitation"]["PMID"] == "0"
+    assert cancelled == ["10"]
+    assert not leftover
+
+
+def test_search_and_fetch_respects_max_results():
+    async def main():
+        async with _make_client(_paging_handler(100)) as client:
+            return await client.search_and_fetch("q", max_results=7)
+
+    assert len(asyncio.run(main())) == 7
+
+
+def test_retries_on_429():
+    attempts = []
+
+    def handler(request):
+        attempts.append(request)
+        if len(attempts) < 3:
+            return httpx.Response(429)
+        return httpx.Response(200, text="<eSearchResult><Count>0</Count></eSearchResult>")
+
+    async def main():
+        async with _make_client(handler) as client:
+            return await client.search("q")
+
+    assert asyncio.run(main())["count"] == "0"
+    assert len(attempts) == 3
+
+
+def test_retry_honors_retry_after(monkeypatch):
+    delays = []
+
+    async def fake_sleep(seconds):
+        delays.append(seconds)
+
+    attempts = []
+
+    def handler(request):
+        attempts.append(request)
+        if len(attempts) == 1:
+            return httpx.Response(429, headers={"Retry-After": "2"})
+        return httpx.Response(200, text="<eSearchResult><Count>0</Count></eSearchResult>")
+
+    async def main():
+        transport = httpx.MockTransport(handler)
+        # A full bucket, so only the retry sleeps.
+        async with AsyncPubMedClient(client=httpx.AsyncClient(transport=transport),
+                                     rate_limiter=TokenBucket(1000, capacity=10),
+                                     backoff_factor=0) as client:
+            monkeypatch.setattr(asyncio, "sleep", fake_sleep)
+            return await client.search("q")
+
+    assert asyncio.run(main())["count"] == "0"
+    assert delays == [2.0]
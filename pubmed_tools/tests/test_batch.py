@@ -0,0 +1,92 @@
+import pickle
+import os
+import pytest
+from pubmed_tools.core.batch import ArticleBatch
+from pubmed_tools.exporters.csv_exporter import CSVExporter
+from pubmed_tools.exporters.excel_exporter import ExcelExporter
+from pubmed_tools.exporters.pdf_exporter import PDFExporter
+from pubmed_tools.parsers.article import ArticleParser
+from pubmed_tools.testing.synthetic import generate_efetch_xml
+
+XML = generate_efetch_xml(40, seed=11)
+
+
+@pytest.fixture
+def articles():
+    return list(ArticleParser.parse_xml(XML))
+
+
+def test_rows_round_trip(articles):
+    batch = ArticleBatch(articles)
+    assert len(batch) == len(articles)
+    assert batch.to_dicts() == articles
+    assert dict(batch[-1]) == articles[-1]
+    assert [dict(row) for row in batch[2:5]] == articles[2:5]
+    with pytest.raises(IndexError):
+        batch[len(articles)]
+
+
+def test_parser_fills_batch_directly(articles):
+    assert ArticleParser.parse_xml_batch(XML).to_dicts() == articles
+    converted = ArticleParser.parse_xml_batch(XML, convert_date=True)
+    assert converted.to_dicts() == list(ArticleParser.parse_xml(XML, convert_date=True))
+
+
+def test_unusual_values_round_trip():
+    rows = [
+        {'title': 't', 'abstract': '', 'authors': [], 'pmid': '',
+         'publication_date': {'year': '', 'month': '', 'day': ''}},
+        {'title': 't', 'abstract': 'a', 'authors': ['A B', 'A B'], 'pmid': '007',
+         'publication_date': '2020-Jan-'},
+    ]
+    assert ArticleBatch(rows).to_dicts() == [
+        {'title': 't', 'abstract': '', 'authors': [], 'publication_date':
+         {'year': '', 'month': '', 'day': ''}, 'pmid': ''},
+        {'title': 't', 'abstract': 'a', 'authors': ['A B', 'A B'],
+         'publication_date': '2020-Jan-', 'pmid': '007'},
+    ]
+
+
+def test_shared_strings_are_stored_once():
+    batch = ArticleBatch([{'title': str(i), 'abstract': '', 'authors': ['John Doe'],
+                           'publication_date': {'year': '2020', 'month': 'Jan', 'day': ''},
+                           'pmid': str(i + 1)} for i in range(100)])
+    assert batch._strings == ['John Doe']
+    assert batch.column('pmid')[:3] == ['1', '2', '3']
+
+
+def test_dates_are_integers_and_read_back_unchanged():
+    dates = [{'year': '2021', 'month': 'Mar', 'day': '05'},
+             {'year': '2021', 'month': '03', 'day': ''},
+             {'year': '', 'month': '', 'day': ''},
+             '2020-11-',
+             '2020 Nov-Dec',
+             {'year': '2021', 'month': '3', 'day': '5'}]
+    batch = ArticleBatch([{'publication_date': date} for date in dates])
+    assert batch.column('publication_date') == dates
+    assert list(batch._dates[:4]) == [20210305, 20210300, 0, 20201100]
+    assert len(batch._raw_dates) == 2
+    assert batch.date_key(5) == 20210305
+
+
+def test_exporters_accept_batches(articles, tmp_path):
+    batch = ArticleBatch(articles)
+    for exporter, name in ((CSVExporter(), 'batch.csv'), (ExcelExporter(), 'batch.xlsx'),
+                           (PDFExporter(), 'batch.pdf')):
+        path = str(tmp_path / name)
+        exporter.export(batch, path)
+        assert os.path.getsize(path) > 0
+
+    list_csv = str(tmp_path / 'list.csv')
+    CSVExporter().export(articles, list_csv)
+    with open(list_csv) as expected, open(tmp_path / 'batch.csv') as actual:
+        assert actual.read() == expected.read()
+
+
+def test_rows_pickle_as_plain_dicts(articles):
+    batch = ArticleBatch(articles)
+    row = batch[0]
+    restored = pickle.loads(pickle.dumps(row))
+    assert type(restored) is dict and restored == dict(row)
+    # Only the row travels, not the 40-article batch behind it.
+    assert len(pickle.dumps(row)) < 2 * len(pickle.dumps(dict(row)))
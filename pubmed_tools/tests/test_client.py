@@ -1,10 +1,15 @@
 import pytest
+import requests
+from concurrent.futures import ThreadPoolExecutor
 from unittest.mock import patch, Mock
 from pubmed_tools.core.client import PubMedClient
+from pubmed_tools.core.ratelimit import TokenBucket
+from pubmed_tools.testing.eutils_server import StubEutilsServer
+from pubmed_tools.testing.synthetic import minimal_article_set
 
 @pytest.fixture
 def client():
-    return PubMedClient()
+    return PubMedClient(rate_limiter=TokenBucket(1000))
 
 def _make_response(content: str, status_code: int = 200):
     mock_resp = Mock()
@@ -28,7 +33,7 @@ def test_search(client):
         <QueryKey>1</QueryKey>
     </eSearchResult>
     """
-    with patch("requests.get") as mock_get:
+    with patch("requests.Session.get") as mock_get:
         mock_get.return_value = _make_response(xml)
         # Act
         result = client.search("test query")
@@ -58,7 +63,7 @@ def test_fetch_details(client):
         </PubmedArticle>
     </PubmedArticleSet>
     """
-    with patch("requests.get") as mock_get:
+    with patch("requests.Session.get") as mock_get:
         mock_get.return_value = _make_response(xml)
         # Act
         result = client.fetch_details(["123", "456"])
@@ -71,3 +76,158 @@ def test_fetch_details(client):
         args, kwargs = mock_get.call_args
         assert "efetch.fcgi" in args[0]
         assert "123,456" in kwargs["params"]["id"]
+
+def test_session_reuses_pooled_connections():
+    with StubEutilsServer(corpus_size=10) as server, \
+            PubMedClient(base_url=server.base_url, rate_limiter=TokenBucket(1000),
+                         pool_size=4) as client:
+        for _ in range(5):
+            client.search("anything")
+        sequential = client.connection_stats()
+        assert server.connections == 1
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            list(executor.map(lambda _: client.search("anything"), range(20)))
+        concurrent = client.connection_stats()
+        connections = server.connections
+    assert server.requests['esearch'] == 25
+    assert sequential['connections_opened'] == 1
+    assert sequential['connections_reused'] == 4
+    # Four workers never need more connections than the pool keeps.
+    assert 1 <= connections <= 4
+    assert concurrent['connections_opened'] == connections
+    assert concurrent['connections_reused'] == 25 - connections
+
+class CountingBucket(TokenBucket):
+    def __init__(self):
+        super().__init__(1000)
+        self.acquired = 0
+
+    def acquire(self):
+        self.acquired += 1
+        super().acquire()
+
+def test_429_retries_take_a_rate_limit_token_each():
+    limiter = CountingBucket()
+    with StubEutilsServer(corpus_size=10, error_rate=1.0) as server, \
+            PubMedClient(base_url=server.base_url, rate_limiter=limiter,
+                         max_retries=2, backoff_factor=0) as client:
+        with pytest.raises(requests.HTTPError):
+            client.search("anything")
+        assert server.requests['throttled'] == 3
+        assert limiter.acquired == 3
+        assert client.connection_stats()['retries'] == 2
+
+        server.error_rate = 0.0
+        assert client.search("anything")['count'] == '10'
+        assert limiter.acquired == 4
+
+def test_connection_stats_counts_requests(client):
+    xml = "<eSearchResult><Count>0</Count></eSearchResult>"
+    with patch("requests.Session.get") as mock_get:
+        mock_get.return_value = _make_response(xml)
+        client.search("a")
+        client.search("b")
+    stats = client.connection_stats()
+    assert stats["requests"] == 2
+    assert stats["retries"] == 0
+    assert stats["connections_opened"] == 0
+
+def test_context_manager_closes_session():
+    with patch("requests.Session.close") as mock_close:
+        with PubMedClient():
+            pass
+    mock_close.assert_called_once()
+
+def test_identity_params_added_to_every_request():
+    client = PubMedClient(api_key="key123", email="me@example.com", tool="mytool",
+                          rate_limiter=TokenBucket(1000))
+    xml = "<eSearchResult><Count>0</Count></eSearchResult>"
+    with patch("requests.Session.get") as mock_get:
+        mock_get.return_value = _make_response(xml)
+        client.search("a")
+        _, kwargs = mock_get.call_args
+    assert kwargs["params"]["api_key"] == "key123"
+    assert kwargs["params"]["email"] == "me@example.com"
+    assert kwargs["params"]["tool"] == "mytool"
+
+def test_default_rate_limits_are_shared():
+    keyless = PubMedClient(api_key=None)
+    keyed = PubMedClient(api_key="key123")
+    assert keyless.rate_limiter.rate == 3
+    assert keyed.rate_limiter.rate == 10
+    assert PubMedClient(api_key=None).rate_limiter is keyless.rate_limiter
+
+def test_fetch_details_batches_preserve_order():
+    client = PubMedClient(rate_limiter=TokenBucket(1000), batch_size=2, max_workers=3)
+    ids = [str(i) for i in range(1, 8)]
+
+    def fake_get(url, params=None, **kwargs):
+        return _make_response(minimal_article_set(params["id"].split(",")))
+
+    with patch("requests.Session.get", side_effect=fake_get) as mock_get:
+        result = client.fetch_details(ids)
+    assert mock_get.call_count == 4
+    assert [a["MedlineCitation"]["PMID"] for a in result] == ids
+
+def test_fetch_details_uses_post_for_large_batches():
+    client = PubMedClient(rate_limiter=TokenBucket(1000), batch_size=500)
+    ids = [str(i) for i in range(300)]
+    with patch("requests.Session.post") as mock_post, \
+            patch("requests.Session.get") as mock_get:
+        mock_post.return_value = _make_response(minimal_article_set(ids))
+        result = client.fetch_details(ids)
+    mock_get.assert_not_called()
+    mock_post.assert_called_once()
+    _, kwargs = mock_post.call_args
+    assert kwargs["data"]["id"] == ",".join(ids)
+    assert len(result) == 300
+
+def test_fetch_details_failed_batch_is_skipped():
+    client = PubMedClient(rate_limiter=TokenBucket(1000), batch_size=1, max_workers=1,
+                          max_retries=0)
+    responses = [_make_response(minimal_article_set(["1"])), _make_response("", 500)]
+    with patch("requests.Session.get", side_effect=responses):
+        result = client.fetch_details(["1", "2"])
+    assert [a["MedlineCitation"]["PMID"] for a in result] == ["1"]
+
+def _search_xml(count, webenv="webenv123", query_key="1"):
+    history = f"<WebEnv>{webenv}</WebEnv><QueryKey>{query_key}</QueryKey>" if webenv else ""
+    return f"<eSearchResult><Count>{count}</Count><IdList/>{history}</eSearchResult>"
+
+def _paging_get(total):
+    def fake_get(url, params=None, **kwargs):
+        if "esearch.fcgi" in url:
+            return _make_response(_search_xml(total))
+        start, size = params["retstart"], params["retmax"]
+        return _make_response(minimal_article_set(range(start, min(start + size, total))))
+    return fake_get
+
+def test_iter_articles_walks_all_windows(client):
+    with patch("requests.Session.get", side_effect=_paging_get(25)) as mock_get:
+        pmids = [a["MedlineCitation"]["PMID"] for a in client.iter_articles("q", batch_size=10)]
+    assert pmids == [str(i) for i in range(25)]
+    efetch_calls = [c for c in mock_get.call_args_list if "efetch.fcgi" in c.args[0]]
+    assert [c.kwargs["params"]["retstart"] for c in efetch_calls] == [0, 10, 20]
+    assert [c.kwargs["params"]["retmax"] for c in efetch_calls] == [10, 10, 5]
+    assert all(c.kwargs["params"]["WebEnv"] == "webenv123" for c in efetch_calls)
+
+def test_iter_articles_respects_max_results(client):
+    with patch("requests.Session.get", side_effect=_paging_get(1000)):
+        articles = list(client.iter_articles("q", batch_size=10, max_results=15))
+    assert len(articles) == 15
+
+def test_search_and_fetch_empty_result(client):
+    with patch("requests.Session.get") as mock_get:
+        mock_get.return_value = _make_response(_search_xml(0))
+        assert client.search_and_fetch("q") == []
+    mock_get.assert_called_once()
+
+def test_iter_details_streams_response(client):
+    xml = minimal_article_set(["1", "2", "3"]).encode("utf-8")
+    response = _make_response("")
+    response.iter_content = Mock(return_value=iter([xml[:20], xml[20:]]))
+    with patch("requests.Session.get", return_value=response) as mock_get:
+        pmids = [a["MedlineCitation"]["PMID"] for a in client.iter_details(["1", "2", "3"])]
+    assert pmids == ["1", "2", "3"]
+    assert mock_get.call_args.kwargs["stream"] is True
+    response.close.assert_called_once()
@@ -0,0 +1,58 @@
+import pytest
+import xmltodict
+from pubmed_tools.parsers.article import ArticleParser
+from pubmed_tools.parsers.stream import iter_record_elements
+from pubmed_tools.testing.synthetic import generate_efetch_xml
+
+EDGE_CASES = b"""<PubmedArticleSet>
+<PubmedArticle><MedlineCitation><PMID Version="1">1</PMID><Article>
+    <ArticleTitle>The <i>in vivo</i> role of <sup>18</sup>F and <i>E. coli</i></ArticleTitle>
+    <Abstract>
+        <AbstractText Label="BACKGROUND">Some <b>bold</b> text.</AbstractText>
+        <AbstractText Label="">Unlabelled but attributed.</AbstractText>
+        <AbstractText/>
+    </Abstract>
+    <AuthorList><Author><CollectiveName>Group</CollectiveName></Author>
+        <Author ValidYN="Y"><LastName>Doe</LastName><ForeName/></Author></AuthorList>
+    <Journal><JournalIssue><PubDate><MedlineDate>1998 Dec-1999 Jan</MedlineDate></PubDate></JournalIssue></Journal>
+</Article></MedlineCitation></PubmedArticle>
+<PubmedArticle><MedlineCitation><PMID Version="1">2</PMID><Article>
+    <ArticleTitle/>
+    <ArticleDate><Year>2020</Year><Month/><Day>03</Day></ArticleDate>
+</Article></MedlineCitation></PubmedArticle>
+<PubmedArticle><MedlineCitation><PMID Version="1">3</PMID><Article>
+    <ArticleTitle><i>Only formatted</i></ArticleTitle>
+    <Abstract><CopyrightInformation>(c)</CopyrightInformation></Abstract>
+    <AuthorList/>
+</Article></MedlineCitation></PubmedArticle>
+<PubmedArticle><MedlineCitation><PMID Version="1">4</PMID></MedlineCitation></PubmedArticle>
+</PubmedArticleSet>"""
+
+
+def _dict_parse(xml, convert_date=False):
+    articles = xmltodict.parse(xml)["PubmedArticleSet"]["PubmedArticle"]
+    return [ArticleParser.parse_article_details(a, convert_date) for a in articles]
+
+
+@pytest.mark.parametrize("xml", [EDGE_CASES, generate_efetch_xml(300, seed=7)])
+@pytest.mark.parametrize("convert_date", [False, True])
+def test_matches_dict_parser(xml, convert_date):
+    assert list(ArticleParser.parse_xml(xml, convert_date)) == _dict_parse(xml, convert_date)
+
+
+def test_edge_cases():
+    first, second, third, fourth = ArticleParser.parse_xml(EDGE_CASES)
+    assert first["title"] == "18 in vivo E. coli The  role of F and"
+    assert first["abstract"] == "BACKGROUND: Some  text. Unlabelled but attributed. "
+    assert first["authors"] == ["", "Doe"]
+    assert first["publication_date"] == {"year": "", "month": "", "day": ""}
+    assert second["title"] == ""
+    assert second["publication_date"] == {"year": "2020", "month": "", "day": "03"}
+    assert third["title"] == "Only formatted"
+    assert third["authors"] == []
+    assert fourth["title"] == "" and fourth["pmid"] == "4"
+
+
+def test_parse_article_element_without_citation():
+    elements = iter_record_elements(b"<PubmedArticleSet><PubmedArticle/></PubmedArticleSet>")
+    assert ArticleParser.parse_article_element(next(elements)) is None
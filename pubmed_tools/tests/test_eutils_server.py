@@ -0,0 +1,104 @@
+import time
+import pytest
+import requests
+from pubmed_tools.core.client import PubMedClient
+from pubmed_tools.core.ratelimit import TokenBucket
+from pubmed_tools.parsers.article import ArticleParser
+from pubmed_tools.testing.eutils_server import StubEutilsServer
+from pubmed_tools.testing.load import OPERATIONS, is_local_url, main as load_main, run_load
+
+
+@pytest.fixture(scope='module')
+def server():
+    with StubEutilsServer(corpus_size=300, start_pmid=1000) as server:
+        yield server
+
+
+@pytest.fixture
+def client(server):
+    with PubMedClient(base_url=server.base_url, rate_limiter=TokenBucket(1000)) as client:
+        yield client
+
+
+def test_search_pages_through_corpus(client):
+    result = client.search("anything", retmax=5)
+    assert result['count'] == '300'
+    assert result['id_list'] == ['1000', '1001', '1002', '1003', '1004']
+
+
+def test_fetch_details_get_and_post(client, server):
+    small = client.fetch_details(id_list=['1000', '1001', '99999'])
+    assert [ArticleParser.parse_article_details(r)['pmid'] for r in small] == ['1000', '1001']
+
+    ids = [str(pmid) for pmid in range(1000, 1300)]
+    client.batch_size = 300
+    articles = client.fetch_details(id_list=ids)
+    assert len(articles) == 300
+    # Articles are deterministic per PMID, whatever request they come from.
+    assert articles[0] == small[0]
+
+
+def test_search_and_fetch(client):
+    articles = client.search_and_fetch("anything", max_results=50)
+    assert len(articles) == 50
+    assert client.connection_stats()['connections_reused'] > 0
+
+
+def test_history_search_and_paged_efetch(client, server):
+    articles = list(client.iter_articles("anything", batch_size=40, max_results=100))
+    pmids = [ArticleParser.parse_article_details(a)['pmid'] for a in articles]
+    assert pmids == [str(pmid) for pmid in range(1000, 1100)]
+
+    first = client.search("one", use_history=True, retmax=0)
+    assert first['webenv'].startswith('MCID_') and first['query_key'] == '1'
+    assert client.fetch_details(webenv='MCID_unknown', query_key='1') == []
+
+
+def test_injected_429s_and_rate_limit():
+    with StubEutilsServer(corpus_size=10, error_rate=1.0) as server, \
+            PubMedClient(base_url=server.base_url, rate_limiter=TokenBucket(1000),
+                         max_retries=0) as client:
+        with pytest.raises(requests.HTTPError):
+            client.search("anything")
+        assert server.requests['throttled'] == 1
+
+    with StubEutilsServer(corpus_size=10, rate_limit=3) as server, \
+            PubMedClient(base_url=server.base_url, rate_limiter=TokenBucket(1000),
+                         max_retries=0) as client:
+        statuses = [client.session.get(f"{server.base_url}esearch.fcgi").status_code
+                    for _ in range(5)]
+        assert statuses == [200, 200, 200, 429, 429]
+
+
+def test_latency_is_added_to_responses():
+    with StubEutilsServer(corpus_size=10, latency=0.05) as server, \
+            PubMedClient(base_url=server.base_url, rate_limiter=TokenBucket(1000)) as client:
+        started = time.perf_counter()
+        client.search("anything")
+        assert time.perf_counter() - started >= 0.05
+
+
+@pytest.mark.parametrize('operation', OPERATIONS)
+def test_run_load_reports_throughput_and_latency(client, operation):
+    report = run_load(client, workers=2, operations=3, operation=operation, batch_size=20)
+    assert report['operations'] == 6 and report['errors'] == 0
+    assert report['throughput'] > 0 and report['items_per_second'] > 0
+    latency = report['latency']
+    assert 0 < latency['p50'] <= latency['p95'] <= latency['p99'] <= latency['max']
+
+
+def test_run_load_counts_failed_operations():
+    # Beyond two requests a second, efetch batches are refused and come back short.
+    with StubEutilsServer(corpus_size=100, rate_limit=2) as server, \
+            PubMedClient(base_url=server.base_url, rate_limiter=TokenBucket(1000),
+                         max_retries=0) as client:
+        report = run_load(client, workers=1, operations=20, batch_size=5)
+    assert report['errors'] > 0
+    assert report['operations'] + report['errors'] == 20
+
+
+def test_load_driver_refuses_ncbi():
+    with pytest.raises(SystemExit):
+        load_main(['--base-url', 'https://eutils.ncbi.nlm.nih.gov/entrez/eutils/'])
+    assert is_local_url('http://127.0.0.1:8080/entrez/eutils/')
+    assert not is_local_url('https://mirror.example.org/entrez/eutils/')
@@ -1,9 +1,18 @@
+import asyncio
+import gzip
+import pickle
+import threading
+from unittest.mock import patch
 import pytest
 import os
 import pandas as pd
 from pubmed_tools.exporters.csv_exporter import CSVExporter
 from pubmed_tools.exporters.excel_exporter import ExcelExporter
-from pubmed_tools.exporters.pdf_exporter import PDFExporter
+from pubmed_tools.exporters.pdf_exporter import PDFExporter, _PDFResources, pdf_resource_stats
+from pubmed_tools.exporters.parquet_exporter import FeatherExporter, ParquetExporter
+from pubmed_tools.exporters.jsonl_exporter import JSONLExporter, iter_jsonl
+from pubmed_tools.parsers.article import ArticleParser
+from pubmed_tools.testing import generate_efetch_xml
 
 
 @pytest.fixture
@@ -57,6 +66,55 @@ class TestCSVExporter:
         with pytest.raises(ValueError, match="Data cannot be empty"):
             exporter.export([], 'test.csv')
 
+    def test_append_writes_header_once(self, sample_data, temp_dir):
+        exporter = CSVExporter()
+        filename = os.path.join(temp_dir, 'append.csv')
+
+        exporter.export(sample_data[:1], filename, append=True)
+        exporter.export(sample_data[1:], filename, append=True)
+
+        df = pd.read_csv(filename)
+        assert list(df['pmid'].astype(str)) == ['12345', '67890']
+
+    def test_export_from_generator(self, sample_data, temp_dir):
+        exporter = CSVExporter()
+        filename = os.path.join(temp_dir, 'generator.csv')
+
+        exporter.export((row for row in sample_data), filename)
+
+        df = pd.read_csv(filename)
+        assert list(df['pmid'].astype(str)) == ['12345', '67890']
+
+    def test_export_empty_generator(self, temp_dir):
+        exporter = CSVExporter()
+        with pytest.raises(ValueError, match="Data cannot be empty"):
+            exporter.export(iter([]), os.path.join(temp_dir, 'empty.csv'))
+
+    def test_export_gzip(self, sample_data, temp_dir):
+        exporter = CSVExporter()
+        filename = os.path.join(temp_dir, 'test.csv.gz')
+
+        exporter.export(iter(sample_data), filename)
+        exporter.export(iter(sample_data), filename, append=True)
+
+        with gzip.open(filename, 'rt', encoding='utf-8') as f:
+            assert f.readline().startswith('title,abstract')
+        assert len(pd.read_csv(filename)) == 4
+
+    def test_export_async(self, sample_data, temp_dir):
+        exporter = CSVExporter()
+        filename = os.path.join(temp_dir, 'async.csv')
+
+        async def rows():
+            for row in sample_data:
+                yield row
+
+        asyncio.run(exporter.export_async(rows(), filename, fields=['pmid', 'title']))
+
+        df = pd.read_csv(filename)
+        assert list(df.columns) == ['pmid', 'title']
+        assert len(df) == 2
+
 
 class TestExcelExporter:
     def test_export(self, sample_data, temp_dir):
@@ -79,6 +137,27 @@ class TestExcelExporter:
             'publication_date',
             'pmid']
 
+    def test_export_from_generator(self, sample_data, temp_dir):
+        exporter = ExcelExporter()
+        filename = os.path.join(temp_dir, 'generator.xlsx')
+
+        exporter.export((row for row in sample_data), filename, fields=['pmid', 'authors'])
+
+        df = pd.read_excel(filename, dtype=str)
+        assert list(df['pmid']) == ['12345', '67890']
+        assert df['authors'][0] == "['John Doe', 'Jane Smith']"
+
+    def test_sheet_rollover(self, sample_data, temp_dir):
+        exporter = ExcelExporter(max_rows=2)
+        filename = os.path.join(temp_dir, 'rollover.xlsx')
+
+        exporter.export(iter(sample_data * 2), filename)
+
+        sheets = pd.read_excel(filename, sheet_name=None, dtype=str)
+        assert list(sheets) == ['Sheet1', 'Sheet2', 'Sheet3', 'Sheet4']
+        assert [list(df['pmid']) for df in sheets.values()] == [
+            ['12345'], ['67890'], ['12345'], ['67890']]
+
 
 class TestPDFExporter:
     def test_export(self, sample_data, temp_dir):
@@ -93,3 +172,138 @@ class TestPDFExporter:
         assert os.path.exists(filename)
         # Basic file size check to ensure PDF was created
         assert os.path.getsize(filename) > 0
+
+    def test_fonts_and_styles_shared_across_instances(self):
+        first, second = PDFExporter(), PDFExporter()
+
+        assert first.styles['body'] is second.styles['body']
+        stats = pdf_resource_stats()
+        assert stats['fonts'] == 1
+        assert stats['reuses'] >= 1
+
+    def test_resource_registry_is_thread_safe(self):
+        resources = _PDFResources()
+        with patch('pubmed_tools.exporters.pdf_exporter.TTFont') as ttfont, \
+                patch('pubmed_tools.exporters.pdf_exporter.pdfmetrics.registerFont'), \
+                patch('pubmed_tools.exporters.pdf_exporter.addMapping'):
+            threads = [threading.Thread(target=resources.register_font, args=('Test', 'test.ttf'))
+                       for _ in range(8)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        assert ttfont.call_count == 1
+        assert resources.stats()['fonts'] == 1
+
+    @pytest.mark.parametrize('workers', [1, 2])
+    def test_export_chunked(self, sample_data, temp_dir, workers):
+        pypdf = pytest.importorskip('pypdf')
+        exporter = PDFExporter()
+        filename = os.path.join(temp_dir, 'chunked.pdf')
+
+        exporter.export(iter(sample_data * 3), filename, chunk_size=2, workers=workers)
+
+        reader = pypdf.PdfReader(filename)
+        assert len(reader.pages) == 7
+        assert 'Contents' in reader.pages[0].extract_text()
+        outline = reader.outline
+        assert [item.title for item in outline] == ['Contents'] + [
+            'Test Article 1', 'Test Article 2'] * 3
+        assert [reader.get_destination_page_number(item) for item in outline] == list(range(7))
+
+    def test_worker_chunks_pickle_only_their_rows(self):
+        batch = ArticleParser.parse_xml_batch(generate_efetch_xml(500))
+        chunk = list(batch)[:5]
+        restored = pickle.loads(pickle.dumps(chunk))
+        assert all(type(article) is dict for article in restored)
+        assert restored == [dict(article) for article in chunk]
+        assert len(pickle.dumps(chunk)) < len(pickle.dumps(batch)) / 20
+
+
+class TestParquetExporter:
+    def test_export(self, sample_data, temp_dir):
+        pq = pytest.importorskip('pyarrow.parquet')
+        exporter = ParquetExporter(row_group_size=1)
+        filename = os.path.join(temp_dir, 'test.parquet')
+
+        exporter.export(iter(sample_data), filename)
+
+        parquet_file = pq.ParquetFile(filename)
+        assert parquet_file.metadata.num_row_groups == 2
+        column = parquet_file.metadata.row_group(0).column(2)
+        assert column.path_in_schema == 'authors.list.element'
+        assert column.compression == 'ZSTD'
+        assert 'RLE_DICTIONARY' in column.encodings
+        assert parquet_file.read().to_pylist() == sample_data
+
+    def test_export_fields_and_string_dates(self, sample_data, temp_dir):
+        pq = pytest.importorskip('pyarrow.parquet')
+        exporter = ParquetExporter()
+        filename = os.path.join(temp_dir, 'dates.parquet')
+        data = [dict(row, publication_date='2023-01-01') for row in sample_data]
+
+        exporter.export(data, filename, fields=['pmid', 'publication_date'])
+
+        table = pq.read_table(filename, filters=[('pmid', '=', '67890')])
+        assert table.to_pylist() == [{'pmid': '67890', 'publication_date': '2023-01-01'}]
+
+
+    def test_first_batch_nulls_and_mixed_dates(self, sample_data, temp_dir):
+        pq = pytest.importorskip('pyarrow.parquet')
+        exporter = ParquetExporter(row_group_size=1)
+        filename = os.path.join(temp_dir, 'nulls.parquet')
+        data = [dict(sample_data[0], abstract=None, publication_date=None, journal=None),
+                dict(sample_data[1], journal='Nature'),
+                dict(sample_data[0], publication_date='2024-02-03', journal='Cell')]
+
+        exporter.export(data, filename)
+
+        rows = pq.read_table(filename).to_pylist()
+        assert [row['abstract'] for row in rows] == [None, 'Test Abstract 2', 'Test Abstract 1']
+        assert [row['journal'] for row in rows] == [None, 'Nature', 'Cell']
+        assert [row['publication_date'] for row in rows] == [
+            None, sample_data[1]['publication_date'],
+            {'year': '2024', 'month': '02', 'day': '03'}]
+
+class TestFeatherExporter:
+    def test_export(self, sample_data, temp_dir):
+        feather = pytest.importorskip('pyarrow.feather')
+        exporter = FeatherExporter(row_group_size=1)
+        filename = os.path.join(temp_dir, 'test.feather')
+
+        exporter.export((row for row in sample_data), filename)
+
+        assert feather.read_table(filename).to_pylist() == sample_data
+
+
+class TestJSONLExporter:
+    @pytest.mark.parametrize('name', ['test.jsonl', 'test.jsonl.gz', 'test.jsonl.zst'])
+    def test_round_trip_with_append(self, sample_data, temp_dir, name):
+        if name.endswith('.zst'):
+            pytest.importorskip('zstandard')
+        exporter = JSONLExporter()
+        filename = os.path.join(temp_dir, name)
+
+        exporter.export(iter(sample_data), filename)
+        exporter.export(sample_data[:1], filename, append=True)
+
+        assert exporter.load(filename) == sample_data + sample_data[:1]
+
+    def test_export_fields(self, sample_data, temp_dir):
+        exporter = JSONLExporter()
+        filename = os.path.join(temp_dir, 'fields.jsonl')
+
+        exporter.export(sample_data, filename, fields=['pmid', 'authors'])
+
+        with open(filename, encoding='utf-8') as f:
+            assert len(f.readlines()) == 2
+        assert list(iter_jsonl(filename)) == [
+            {'pmid': '12345', 'authors': ['John Doe', 'Jane Smith']},
+            {'pmid': '67890', 'authors': ['Bob Johnson']}]
+
+    def test_unsupported_compression(self, sample_data, temp_dir):
+        exporter = JSONLExporter()
+        with pytest.raises(ValueError, match="Unsupported compression"):
+            exporter.export(sample_data, os.path.join(temp_dir, 'x.jsonl'), compression='lz4')
+
@@ -0,0 +1,103 @@
+import os
+import time
+import pytest
+import pandas as pd
+
+from pubmed_tools.exporters.base import BaseExporter
+from pubmed_tools.exporters.csv_exporter import CSVExporter
+from pubmed_tools.exporters.fanout import ExportFanout
+from pubmed_tools.exporters.jsonl_exporter import JSONLExporter, load_jsonl
+from pubmed_tools.exporters.pdf_exporter import PDFExporter
+
+
+def _articles(count):
+    return [{'title': f'Article {i}',
+             'abstract': f'Abstract {i}',
+             'authors': ['Jane Smith'],
+             'publication_date': {'year': '2023', 'month': '01', 'day': '01'},
+             'pmid': str(1000 + i)} for i in range(count)]
+
+
+class FailingExporter(BaseExporter):
+    def export(self, data, filename, fields=None):
+        for _ in data:
+            raise RuntimeError("disk full")
+
+
+def test_fanout_list_with_pdf_in_process(tmpdir):
+    articles = _articles(3)
+    fanout = ExportFanout()
+    fanout.add(CSVExporter(), os.path.join(tmpdir, 'out.csv'))
+    fanout.add(PDFExporter(), os.path.join(tmpdir, 'out.pdf'))
+
+    results = fanout.run(articles)
+
+    assert [r['exporter'] for r in results] == ['CSVExporter', 'PDFExporter']
+    assert all(r['error'] is None and r['seconds'] > 0 for r in results)
+    assert len(pd.read_csv(os.path.join(tmpdir, 'out.csv'))) == 3
+    assert os.path.getsize(os.path.join(tmpdir, 'out.pdf')) > 0
+
+
+def test_fanout_generator_reads_source_once(tmpdir):
+    reads = []
+
+    def stream():
+        for article in _articles(25):
+            reads.append(article['pmid'])
+            yield article
+
+    fanout = ExportFanout(chunk_size=4, queue_chunks=1)
+    fanout.add(CSVExporter(), os.path.join(tmpdir, 'out.csv'))
+    fanout.add(JSONLExporter(), os.path.join(tmpdir, 'out.jsonl'), fields=['pmid'])
+    fanout.add(FailingExporter(), os.path.join(tmpdir, 'broken.txt'))
+
+    results = fanout.run(stream())
+
+    assert len(reads) == 25
+    assert [r['error'] for r in results] == [None, None, 'disk full']
+    assert len(pd.read_csv(os.path.join(tmpdir, 'out.csv'))) == 25
+    assert load_jsonl(os.path.join(tmpdir, 'out.jsonl'))[-1] == {'pmid': '1024'}
+
+
+def test_fanout_reports_process_errors(tmpdir):
+    fanout = ExportFanout()
+    fanout.add(PDFExporter(), os.path.join(tmpdir, 'out.pdf'), fields=['missing'])
+
+    results = fanout.run(iter(_articles(2)))
+
+    assert "not found in data" in results[0]['error']
+
+
+def test_fanout_source_failure_removes_partial_outputs(tmpdir):
+    def stream():
+        yield from _articles(10)
+        raise RuntimeError("source broke")
+
+    appended = os.path.join(tmpdir, 'existing.csv')
+    CSVExporter().export(_articles(1), appended)
+    fanout = ExportFanout(chunk_size=4)
+    fanout.add(CSVExporter(), os.path.join(tmpdir, 'out.csv'))
+    fanout.add(JSONLExporter(), os.path.join(tmpdir, 'out.jsonl'))
+    fanout.add(CSVExporter(), appended, append=True)
+
+    with pytest.raises(RuntimeError, match="source broke"):
+        fanout.run(stream())
+
+    assert not os.path.exists(os.path.join(tmpdir, 'out.csv'))
+    assert not os.path.exists(os.path.join(tmpdir, 'out.jsonl'))
+    assert os.path.exists(appended)
+
+
+def test_fanout_seconds_are_per_exporter(tmpdir):
+    class SlowExporter(BaseExporter):
+        def export(self, data, filename, fields=None):
+            time.sleep(0.3)
+
+    fanout = ExportFanout()
+    fanout.add(SlowExporter(), os.path.join(tmpdir, 'slow.txt'))
+    fanout.add(CSVExporter(), os.path.join(tmpdir, 'out.csv'))
+
+    slow, fast = fanout.run(_articles(3))
+
+    assert slow['seconds'] >= 0.3
+    assert fast['seconds'] < 0.3
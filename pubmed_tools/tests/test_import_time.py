@@ -0,0 +1,27 @@
+import os
+import subprocess
+import sys
+import pytest
+from pubmed_tools.testing.importtime import IMPORT_BUDGETS, heavy_imports
+
+
+@pytest.mark.parametrize('statement', list(IMPORT_BUDGETS))
+def test_light_imports_skip_heavy_dependencies(statement):
+    assert heavy_imports(statement) == []
+
+
+def test_lazy_attributes_resolve():
+    import pubmed_tools
+    from pubmed_tools import exporters
+    assert pubmed_tools.CSVExporter is exporters.CSVExporter
+    assert 'PDFExporter' in dir(pubmed_tools)
+    with pytest.raises(AttributeError):
+        pubmed_tools.NoSuchExporter
+
+
+def test_config_import_has_no_side_effects(tmp_path):
+    output_dir = tmp_path / 'outputs'
+    env = dict(os.environ, PUBMED_TOOLS_OUTPUT_DIR=str(output_dir))
+    subprocess.run([sys.executable, '-c', 'import pubmed_tools.config, pubmed_tools.exporters.base'],
+                   check=True, env=env)
+    assert not output_dir.exists()
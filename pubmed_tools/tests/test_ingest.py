@@ -0,0 +1,75 @@
+import gzip
+import json
+import random
+import pytest
+from unittest.mock import patch
+from pubmed_tools.exporters.excel_exporter import ExcelExporter
+from pubmed_tools.exporters.jsonl_exporter import JSONLExporter, load_jsonl
+from pubmed_tools.ingest import BulkIngest, find_dump_files, parse_dump_file
+from pubmed_tools.storage import ArticleIndex, ArticleStore
+from pubmed_tools.testing.synthetic import XML_FOOTER, XML_HEADER, article_xml, write_efetch_xml
+
+
+@pytest.fixture
+def dump_dir(tmp_path):
+    write_efetch_xml(str(tmp_path / 'pubmed25n0001.xml.gz'), 5, seed=1, start_pmid=1,
+                     opener=gzip.open)
+    write_efetch_xml(str(tmp_path / 'pubmed25n0002.xml.gz'), 5, seed=2, start_pmid=6,
+                     opener=gzip.open)
+    update = (XML_HEADER + article_xml(2, random.Random(3))
+              + '<DeleteCitation><PMID Version="1">3</PMID><PMID Version="1">7</PMID>'
+              '</DeleteCitation>' + XML_FOOTER)
+    with gzip.open(tmp_path / 'pubmed25n0003.xml.gz', 'wt', encoding='utf-8') as f:
+        f.write(update)
+    (tmp_path / 'README.txt').write_text('not a dump')
+    return tmp_path
+
+
+def test_find_and_parse_dump_files(dump_dir):
+    files = find_dump_files(str(dump_dir))
+    assert [f.rsplit('/', 1)[-1] for f in files] == [
+        'pubmed25n0001.xml.gz', 'pubmed25n0002.xml.gz', 'pubmed25n0003.xml.gz']
+    articles, raw, deleted, failed = parse_dump_file(files[2], keep_raw=True)
+    assert [a['pmid'] for a in articles] == ['2']
+    assert raw[0]['MedlineCitation']['PMID']['#text'] == '2'
+    assert deleted == ['3', '7']
+    assert failed == 0
+
+
+@pytest.mark.parametrize('workers', [1, 2])
+def test_ingest_into_store_index_and_exporter(dump_dir, workers):
+    store = ArticleStore(':memory:')
+    index = ArticleIndex(':memory:')
+    output = str(dump_dir / 'articles.jsonl')
+    ingest = BulkIngest(str(dump_dir / 'checkpoint.json'), workers=workers)
+
+    summary = ingest.run(str(dump_dir), store=store, index=index,
+                         exporter=JSONLExporter(), filename=output)
+
+    assert summary == {'files': 3, 'skipped': 0, 'articles': 11, 'deleted': 2, 'failed': 0}
+    assert set(store.get_details([str(i) for i in range(1, 11)])) == {
+        '1', '2', '4', '5', '6', '8', '9', '10'}
+    assert len(index) == 8
+    assert len(load_jsonl(output)) == 11
+    with open(dump_dir / 'checkpoint.json') as f:
+        assert json.load(f)['pubmed25n0003.xml.gz']['deleted'] == 2
+
+
+def test_ingest_resumes_from_checkpoint(dump_dir):
+    checkpoint = str(dump_dir / 'checkpoint.json')
+    index = ArticleIndex(':memory:')
+    files = find_dump_files(str(dump_dir))
+
+    BulkIngest(checkpoint, workers=1).run(files[:1], index=index)
+    with patch('pubmed_tools.ingest.parse_dump_file', wraps=parse_dump_file) as parse:
+        summary = BulkIngest(checkpoint, workers=1).run(str(dump_dir), index=index)
+
+    assert [call.args[0] for call in parse.call_args_list] == files[1:]
+    assert summary['files'] == 2 and summary['skipped'] == 1
+    assert len(index) == 8
+
+
+def test_ingest_requires_appending_exporter(dump_dir):
+    with pytest.raises(ValueError, match="cannot append"):
+        BulkIngest(str(dump_dir / 'c.json')).run(str(dump_dir), exporter=ExcelExporter(),
+                                                  filename='x.xlsx')
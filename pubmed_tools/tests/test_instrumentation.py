@@ -0,0 +1,110 @@
+import asyncio
+import os
+import pytest
+
+from pubmed_tools import instrumentation
+from pubmed_tools.core.client import PubMedClient
+from pubmed_tools.core.ratelimit import TokenBucket
+from pubmed_tools.exporters.csv_exporter import CSVExporter
+from pubmed_tools.parsers.article import ArticleParser
+from pubmed_tools.testing import generate_efetch_xml
+from pubmed_tools.testing.eutils_server import StubEutilsServer
+
+
+@pytest.fixture
+def recorder():
+    recorder = instrumentation.MetricsRecorder()
+    with instrumentation.use(recorder):
+        yield recorder
+
+
+def test_disabled_by_default():
+    assert not instrumentation.enabled()
+    with instrumentation.span('anything', key='value') as span:
+        span.set_attribute('other', 1)
+    assert not span.recording
+    instrumentation.add('counter')
+    instrumentation.record('histogram', 1.0)
+
+
+def test_use_restores_previous():
+    outer, inner = instrumentation.MetricsRecorder(), instrumentation.MetricsRecorder()
+    with instrumentation.use(outer):
+        with instrumentation.use(inner):
+            instrumentation.add('events')
+        instrumentation.add('events', 2)
+    assert instrumentation.get_instrumentation() is None
+    assert inner.counter('events') == 1
+    assert outer.counter('events') == 2
+
+
+def test_metrics_recorder_summaries(recorder):
+    for value in range(1, 101):
+        instrumentation.record('latency', value)
+    summary = recorder.snapshot()['histograms']['latency']
+    assert summary['count'] == 100
+    assert (summary['min'], summary['max'], summary['mean']) == (1, 100, 50.5)
+    assert (summary['p50'], summary['p95'], summary['p99']) == (50, 95, 99)
+
+
+def test_client_requests_are_instrumented(recorder):
+    with StubEutilsServer(corpus_size=50) as server, \
+            PubMedClient(base_url=server.base_url, rate_limiter=TokenBucket(1000)) as client:
+        ids = client.search("anything", retmax=50)['id_list']
+        client.fetch_details(id_list=ids)
+        streamed = list(client.iter_details(id_list=ids[:10]))
+
+    snapshot = recorder.snapshot()
+    assert len(streamed) == 10
+    assert recorder.counter('client.requests') == 3
+    assert recorder.counter('client.retries') == 0
+    assert recorder.counter('client.bytes') > 0
+    assert snapshot['histograms']['client.request']['count'] == 3
+    assert snapshot['histograms']['client.decode']['count'] == 2
+    assert snapshot['histograms']['client.throttle_seconds']['count'] == 3
+
+
+def test_parse_counts_articles_and_failures(recorder):
+    details = [{'MedlineCitation': {'PMID': {'#text': '1'}, 'Article': {}}},
+               {'PubmedBookArticle': {}}]
+    ArticleParser.parse_batch(details)
+    ArticleParser.parse_xml_batch(generate_efetch_xml(5))
+
+    snapshot = recorder.snapshot()
+    assert recorder.counter('parser.articles') == 6
+    assert recorder.counter('parser.failures') == 1
+    assert snapshot['histograms']['parser.parse']['count'] == 2
+    assert snapshot['histograms']['parser.articles_per_second']['count'] == 2
+
+
+def test_export_spans_report_exporter_and_errors(tmpdir):
+    spans = []
+    hooks = instrumentation.CallbackInstrumentation(on_span=spans.append)
+    filename = os.path.join(tmpdir, 'out.csv')
+    articles = [{'pmid': '1', 'title': 'Title'}]
+    with instrumentation.use(hooks):
+        CSVExporter().export(articles, filename)
+        with pytest.raises(ValueError):
+            CSVExporter().export(articles, filename, fields=['missing'])
+
+    assert [span.name for span in spans] == ['exporter.export', 'exporter.export']
+    assert spans[0].attributes == {'exporter': 'CSVExporter', 'filename': filename}
+    assert spans[0].seconds > 0
+    assert spans[1].attributes['error'] == 'ValueError'
+
+
+def test_async_export_is_instrumented(tmpdir):
+    spans = []
+    hooks = instrumentation.CallbackInstrumentation(on_span=spans.append)
+    filename = os.path.join(tmpdir, 'out.csv')
+
+    async def rows():
+        yield {'pmid': '1', 'title': 'Title'}
+
+    with instrumentation.use(hooks):
+        asyncio.run(CSVExporter().export_async(rows(), filename))
+        asyncio.run(CSVExporter().export_async([{'pmid': '2'}], filename))
+
+    assert [span.name for span in spans] == ['exporter.export', 'exporter.export']
+    assert spans[0].attributes == {'exporter': 'CSVExporter', 'filename': filename}
+    assert spans[0].seconds > 0
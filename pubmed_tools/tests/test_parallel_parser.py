@@ -0,0 +1,44 @@
+import xmltodict
+from pubmed_tools.parsers.article import ArticleParser
+from pubmed_tools.testing.synthetic import generate_efetch_xml
+
+XML = generate_efetch_xml(60, seed=3)
+
+
+def _records():
+    return xmltodict.parse(XML)["PubmedArticleSet"]["PubmedArticle"]
+
+
+def test_parse_all_details_parallel_matches_serial():
+    records = _records()
+    expected = ArticleParser.parse_all_details(records)
+    assert ArticleParser.parse_all_details(records, workers=2, chunk_size=7) == expected
+
+
+def test_parallel_skips_bad_records_like_serial_path():
+    records = _records()[:3]
+    records.insert(1, {"PubmedBookArticle": {}})
+    records.insert(2, {})
+    records.insert(3, {"MedlineCitation": {"PMID": "not-a-dict"}})
+    serial = ArticleParser.parse_all_details(records)
+    assert [a["pmid"] for a in serial] == ["1", "2", "3"]
+    assert ArticleParser.parse_all_details(records, workers=2, chunk_size=2) == serial
+
+
+def test_parse_xml_parallel_bytes_and_file(tmp_path):
+    expected = list(ArticleParser.parse_xml(XML))
+    assert ArticleParser.parse_xml_parallel(XML, workers=2, chunk_size=9) == expected
+
+    path = tmp_path / "dump.xml"
+    path.write_bytes(XML)
+    assert ArticleParser.parse_xml_parallel(str(path), workers=2, chunk_size=9) == expected
+
+
+def test_parse_xml_parallel_skips_malformed_records():
+    xml = (b"<PubmedArticleSet>"
+           b"<PubmedArticle><MedlineCitation><PMID>1</PMID></MedlineCitation></PubmedArticle>"
+           b"<PubmedArticle><MedlineCitation><PMID>2</PMID></Oops></PubmedArticle>"
+           b"<PubmedArticle><MedlineCitation><PMID>3</PMID></MedlineCitation></PubmedArticle>"
+           b"</PubmedArticleSet>")
+    parsed = ArticleParser.parse_xml_parallel(xml, workers=2, chunk_size=3)
+    assert [a["pmid"] for a in parsed] == ["1", "3"]
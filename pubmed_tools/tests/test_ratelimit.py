@@ -0,0 +1,74 @@
+import asyncio
+import threading
+import time
+import pytest
+from pubmed_tools.core.ratelimit import TokenBucket, get_rate_limiter
+
+
+def test_first_request_is_immediate():
+    bucket = TokenBucket(rate=5)
+    assert bucket.reserve() == 0.0
+
+
+def test_reservations_are_spaced_by_rate():
+    bucket = TokenBucket(rate=10)
+    bucket.reserve()
+    assert bucket.reserve() == pytest.approx(0.1, abs=0.01)
+    assert bucket.reserve() == pytest.approx(0.2, abs=0.01)
+
+
+def test_invalid_arguments():
+    with pytest.raises(ValueError):
+        TokenBucket(rate=0)
+    with pytest.raises(ValueError):
+        TokenBucket(rate=1, capacity=0)
+
+
+def test_threads_never_exceed_rate():
+    bucket = TokenBucket(rate=50)
+    stamps = []
+    lock = threading.Lock()
+
+    def worker():
+        for _ in range(5):
+            bucket.acquire()
+            with lock:
+                stamps.append(time.monotonic())
+
+    threads = [threading.Thread(target=worker) for _ in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    stamps.sort()
+    # 20 requests at 50/s need at least 19 intervals of 20ms
+    assert stamps[-1] - stamps[0] >= 19 / 50 - 0.02
+
+
+def test_acquire_async_does_not_block_loop():
+    bucket = TokenBucket(rate=20)
+
+    async def main():
+        start = time.monotonic()
+        await asyncio.gather(*(bucket.acquire_async() for _ in range(5)))
+        return time.monotonic() - start
+
+    elapsed = asyncio.run(main())
+    assert elapsed >= 4 / 20 - 0.02
+
+
+def test_get_rate_limiter_defaults():
+    assert get_rate_limiter().rate == 3
+    assert get_rate_limiter(api_key="abc").rate == 10
+    assert get_rate_limiter(api_key="abc") is get_rate_limiter(api_key="abc")
+
+
+def test_get_rate_limiter_shares_one_bucket_per_key(caplog):
+    limiter = get_rate_limiter(api_key="per-key-test", rate=7)
+    assert limiter.rate == 7
+    assert get_rate_limiter(api_key="per-key-test") is limiter
+    with caplog.at_level('WARNING', logger='pubmed_tools.core.ratelimit'):
+        assert get_rate_limiter(api_key="per-key-test", rate=20) is limiter
+    assert limiter.rate == 7
+    assert "Ignoring rate_limit=20" in caplog.text
@@ -0,0 +1,71 @@
+import time
+from unittest.mock import patch, Mock
+from pubmed_tools.core.client import PubMedClient
+from pubmed_tools.core.ratelimit import TokenBucket
+from pubmed_tools.storage import SearchCache, normalize_query
+
+RESULT = {'count': '2', 'ret_max': '2', 'ret_start': '0', 'id_list': ['1', '2']}
+HISTORY_RESULT = dict(RESULT, webenv='webenv123', query_key='1')
+
+
+def test_normalize_query():
+    assert normalize_query("  Cancer   Treatment[Title] ") == "cancer treatment[title]"
+    assert normalize_query("cancer AND Therapy") == "cancer AND therapy"
+    assert normalize_query("cancer and therapy") != normalize_query("cancer AND therapy")
+
+
+def test_hit_after_put():
+    cache = SearchCache()
+    cache.put("cancer", RESULT, retmax=10, use_history=False)
+    assert cache.get(" Cancer ", retmax=10, use_history=False) == RESULT
+    assert cache.get("cancer", retmax=20, use_history=False) is None
+    assert cache.get("cancer", retmax=10, use_history=True) is None
+    assert (cache.hits, cache.misses) == (1, 2)
+
+
+def test_returns_copies():
+    cache = SearchCache()
+    cache.put("cancer", RESULT)
+    cache.get("cancer")["id_list"].append("3")
+    assert cache.get("cancer")["id_list"] == ['1', '2']
+
+
+def test_ttl_and_history_ttl():
+    cache = SearchCache(ttl=100, history_ttl=10)
+    cache.put("plain", RESULT)
+    cache.put("history", HISTORY_RESULT)
+    later = time.time() + 50
+    with patch("pubmed_tools.storage.search_cache.time.time", return_value=later):
+        assert cache.get("plain") == RESULT
+        assert cache.get("history") is None
+
+
+def test_lru_bound():
+    cache = SearchCache(max_entries=2)
+    for query in ("a", "b", "c"):
+        cache.put(query, RESULT)
+    assert cache.get("a") is None
+    assert cache.get("c") == RESULT
+
+
+def test_disk_layer(tmp_path):
+    path = str(tmp_path / "searches.sqlite")
+    first = SearchCache(path=path)
+    first.put("cancer", RESULT, retmax=5)
+    first.close()
+    second = SearchCache(path=path)
+    assert second.get("cancer", retmax=5) == RESULT
+    second.invalidate("cancer", retmax=5)
+    assert SearchCache(path=path).get("cancer", retmax=5) is None
+
+
+def test_client_serves_repeated_search_from_cache():
+    client = PubMedClient(rate_limiter=TokenBucket(1000), search_cache=SearchCache())
+    xml = "<eSearchResult><Count>1</Count><IdList><Id>1</Id></IdList></eSearchResult>"
+    response = Mock(status_code=200, content=xml.encode("utf-8"))
+    with patch("requests.Session.get", return_value=response) as mock_get:
+        first = client.search("cancer")
+        second = client.search("CANCER")
+        client.search("cancer", retmax=5)
+    assert first == second
+    assert mock_get.call_count == 2
@@ -0,0 +1,71 @@
+import pytest
+from pubmed_tools.storage import ArticleIndex
+
+
+def _article(pmid, title, abstract='', authors=(), year='2020'):
+    return {'title': title,
+            'abstract': abstract,
+            'authors': list(authors),
+            'publication_date': {'year': year, 'month': '01', 'day': '01'},
+            'pmid': pmid}
+
+
+@pytest.fixture
+def index(tmp_path):
+    with ArticleIndex(str(tmp_path / "index.sqlite")) as index:
+        index.add([
+            _article('1', 'Intermittent fasting and insulin resistance',
+                     'Fasting improved glucose control.', ['Jane Smith'], '2019'),
+            _article('2', 'Insulin signalling in mice',
+                     'We studied intermittent dosing of insulin in fasting mice.',
+                     ['Bob Johnson'], '2021'),
+            _article('3', 'Dietary habits of shift workers',
+                     'Meal timing and intermittent fasting were surveyed.',
+                     ['Ana Smith', 'Li Wei'], '2023'),
+        ])
+        yield index
+
+
+def test_boolean_and_phrase_queries(index):
+    assert len(index) == 3
+    assert {a['pmid'] for a in index.search('insulin AND fasting')} == {'1', '2'}
+    assert {a['pmid'] for a in index.search('fasting NOT mice')} == {'1', '3'}
+    assert {a['pmid'] for a in index.search('"intermittent fasting"')} == {'1', '3'}
+    assert index.count('shift OR signalling') == 2
+
+
+def test_bm25_ranks_title_matches_first(index):
+    ranked = index.search_pmids('fasting')
+    assert ranked[0][0] == '1'
+    assert ranked[0][1] >= ranked[-1][1] > 0
+
+
+def test_field_and_year_filters(index):
+    assert [a['pmid'] for a in index.search('smith', fields=['authors'])] in (['1', '3'], ['3', '1'])
+    assert [a['pmid'] for a in index.search('fasting', fields=['title'])] == ['1']
+    assert [a['pmid'] for a in index.search('authors:smith', year_from=2020)] == ['3']
+    assert {a['pmid'] for a in index.search('fasting', year_to=2021)} == {'1', '2'}
+    with pytest.raises(ValueError):
+        index.search('fasting', fields=['journal'])
+
+
+def test_round_trip_and_incremental_update(index, tmp_path):
+    article = index.search('shift')[0]
+    assert article == _article('3', 'Dietary habits of shift workers',
+                               'Meal timing and intermittent fasting were surveyed.',
+                               ['Ana Smith', 'Li Wei'], '2023')
+
+    index.add([_article('3', 'Night shift nursing')])
+    index.remove(['2'])
+    assert len(index) == 2
+    assert index.search('dietary') == []
+    assert index.count('insulin') == 1
+
+    index.close()
+    with ArticleIndex(str(tmp_path / "index.sqlite")) as reopened:
+        assert [a['pmid'] for a in reopened.search('nursing')] == ['3']
+
+
+def test_invalid_query(index):
+    with pytest.raises(ValueError, match="Invalid search query"):
+        index.search('"unbalanced')
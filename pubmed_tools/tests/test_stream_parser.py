@@ -0,0 +1,64 @@
+import gzip
+import xml.etree.ElementTree as ET
+import pytest
+import xmltodict
+from pubmed_tools.parsers.stream import (find_record_spans, iter_pubmed_articles,
+                                         iter_record_bytes, iter_record_elements)
+
+XML = b"""<?xml version="1.0" ?>
+<!DOCTYPE PubmedArticleSet PUBLIC "-//NLM//DTD PubMedArticle, 1st January 2024//EN" "https://dtd.nlm.nih.gov/ncbi/pubmed/out/pubmed_240101.dtd">
+<PubmedArticleSet>
+<PubmedArticle>
+    <MedlineCitation Status="MEDLINE">
+        <PMID Version="1">111</PMID>
+        <Article>
+            <ArticleTitle>The <i>in vivo</i> effect</ArticleTitle>
+            <AuthorList><Author><ForeName>John</ForeName><LastName>Doe</LastName></Author></AuthorList>
+        </Article>
+    </MedlineCitation>
+</PubmedArticle>
+<PubmedBookArticle><BookDocument><PMID>999</PMID></BookDocument></PubmedBookArticle>
+<PubmedArticle>
+    <MedlineCitation><PMID Version="1">222</PMID></MedlineCitation>
+</PubmedArticle>
+</PubmedArticleSet>"""
+
+
+def test_matches_xmltodict_output():
+    expected = xmltodict.parse(XML)["PubmedArticleSet"]["PubmedArticle"]
+    assert list(iter_pubmed_articles(XML)) == expected
+
+
+def test_small_chunks():
+    chunks = [XML[i:i + 7] for i in range(0, len(XML), 7)]
+    pmids = [a["MedlineCitation"]["PMID"]["#text"] for a in iter_pubmed_articles(chunks)]
+    assert pmids == ["111", "222"]
+
+
+def test_records_are_standalone_elements():
+    elements = iter_record_elements(XML, tags=("PubmedArticle", "PubmedBookArticle"))
+    first = next(elements)
+    assert first.tag == "PubmedArticle"
+    second = next(elements)
+    assert second.tag == "PubmedBookArticle"
+    assert len(first) > 0  # each record is a complete, standalone tree
+
+
+def test_gzip_path(tmp_path):
+    path = tmp_path / "articles.xml.gz"
+    with gzip.open(path, "wb") as f:
+        f.write(XML)
+    assert len(list(iter_pubmed_articles(str(path)))) == 2
+
+
+def test_truncated_record_raises():
+    with pytest.raises(ET.ParseError):
+        list(iter_record_bytes(XML[:-60]))
+
+
+def test_find_record_spans():
+    spans = find_record_spans(XML)
+    assert len(spans) == 2
+    start, end = spans[0]
+    assert XML[start:end].startswith(b"<PubmedArticle>")
+    assert XML[start:end].endswith(b"</PubmedArticle>")
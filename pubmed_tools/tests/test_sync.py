@@ -0,0 +1,74 @@
+import datetime
+import json
+import pandas as pd
+import pytest
+from unittest.mock import Mock
+from pubmed_tools.exporters.csv_exporter import CSVExporter
+from pubmed_tools.exporters.pdf_exporter import PDFExporter
+from pubmed_tools.sync import IncrementalSync, entrez_date
+
+
+def _record(pmid, edat=None):
+    record = {'MedlineCitation': {'PMID': {'@Version': '1', '#text': pmid},
+                                  'Article': {'ArticleTitle': f'Title {pmid}'}}}
+    if edat:
+        year, month, day = edat.split('/')
+        record['PubmedData'] = {'History': {'PubMedPubDate': [
+            {'@PubStatus': 'received', 'Year': '2000', 'Month': '1', 'Day': '1'},
+            {'@PubStatus': 'entrez', 'Year': year, 'Month': month, 'Day': day},
+        ]}}
+    return record
+
+
+@pytest.fixture
+def client():
+    return Mock()
+
+
+def test_entrez_date():
+    assert entrez_date(_record('1', '2024/3/7')) == '2024/03/07'
+    assert entrez_date(_record('1')) is None
+
+
+def test_first_run_fetches_everything_then_uses_watermark(client, tmp_path):
+    state = str(tmp_path / 'state.json')
+    client.iter_articles.return_value = iter([_record('1', '2024/01/01'),
+                                              _record('2', '2024/01/02')])
+    sync = IncrementalSync(client, state)
+    first = sync.run('Cancer', today=datetime.date(2024, 1, 2))
+    assert [a['pmid'] for a in first] == ['1', '2']
+    assert client.iter_articles.call_args.kwargs == {}
+    assert sync.watermark('cancer') == '2024/01/02'
+
+    client.iter_articles.return_value = iter([_record('2', '2024/01/02'),
+                                              _record('3', '2024/01/02'),
+                                              _record('4', '2024/01/03')])
+    second = IncrementalSync(client, state).run('cancer', today=datetime.date(2024, 1, 3))
+    assert [a['pmid'] for a in second] == ['3', '4']
+    assert client.iter_articles.call_args.kwargs == {
+        'mindate': '2024/01/02', 'maxdate': '2024/01/03', 'datetype': 'edat'}
+    with open(state) as f:
+        assert json.load(f)['cancer']['seen_pmids'] == ['4']
+
+
+def test_appends_to_csv_export(client, tmp_path):
+    filename = str(tmp_path / 'out.csv')
+    sync = IncrementalSync(client, str(tmp_path / 'state.json'))
+    client.iter_articles.return_value = iter([_record('1')])
+    sync.run('q', exporter=CSVExporter(), filename=filename, today=datetime.date(2024, 1, 1))
+    client.iter_articles.return_value = iter([_record('2')])
+    sync.run('q', exporter=CSVExporter(), filename=filename, today=datetime.date(2024, 1, 2))
+    assert list(pd.read_csv(filename)['pmid'].astype(str)) == ['1', '2']
+
+
+def test_rejects_exporters_that_cannot_append(client, tmp_path):
+    sync = IncrementalSync(client, str(tmp_path / 'state.json'))
+    with pytest.raises(ValueError):
+        sync.run('q', exporter=PDFExporter(), filename='out.pdf')
+
+
+def test_writes_new_records_to_store(client, tmp_path):
+    store = Mock()
+    client.iter_articles.return_value = iter([_record('1')])
+    IncrementalSync(client, str(tmp_path / 'state.json'), store=store).run('q')
+    store.put_records.assert_called_once_with([_record('1')])
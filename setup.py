@@ -7,7 +7,6 @@ setup(
     install_requires=[
         'pubmed_sdk',
         'xmltodict',
-        'pandas',
         'reportlab',
         'openpyxl'
     ],